@@ -0,0 +1,148 @@
+"""Created on 2026-10-19.
+
+@author: wf
+"""
+
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from typing import List, Optional
+
+import osprojects
+from osprojects.file_snapshot import FileSnapshot
+from osprojects.github_api import GitHubApi
+
+
+class CheckCache:
+    """Persistent cache of check group results keyed by a fingerprint of the
+    input files of the group.
+
+    The fingerprint covers the mtime and size of each declared input
+    file, the checker and package version and the parameters of the
+    check so that the results of unchanged projects can be reused
+    between runs. Only the file based check groups are cached this way -
+    remote lookups are kept for a maximum age via lookup_recent.
+    """
+
+    def __init__(self, cache_file: Optional[str] = None):
+        """Construct me.
+
+        Args:
+            cache_file (str): the JSON cache file - defaults to checkos_results.json in the GitHub cache directory
+        """
+        if cache_file is None:
+            cache_file = GitHubApi.get_instance().get_cache_path("checkos_results.json")
+        self.cache_file = cache_file
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.modified = False
+        self.entries = {}
+        if os.path.isfile(cache_file):
+            try:
+                with open(cache_file, "r") as f:
+                    self.entries = json.load(f)
+            except (ValueError, OSError):
+                self.entries = {}
+
+    @staticmethod
+    def stat_key(path: str) -> Optional[list]:
+        """Get the mtime and size of the given path from the file snapshot -
+        None if it does not exist."""
+        file_entry = FileSnapshot.get_instance().get(path)
+        key = [file_entry.mtime_ns, file_entry.size] if file_entry.exists else None
+        return key
+
+    @staticmethod
+    def fingerprint(
+        checker_version: int, paths: List[str], params: Optional[dict] = None
+    ) -> str:
+        """Get the fingerprint of the given input paths.
+
+        Args:
+            checker_version (int): the version of the check implementation
+            paths (List[str]): the input files and directories of the check group
+            params (dict): further parameters the results depend on
+
+        Returns:
+            str: the sha1 hex digest of the fingerprint
+        """
+        fingerprint_parts = [
+            checker_version,
+            osprojects.__version__,
+            params or {},
+            [[path, CheckCache.stat_key(path)] for path in paths],
+        ]
+        fingerprint_json = json.dumps(fingerprint_parts, sort_keys=True)
+        fingerprint = hashlib.sha1(fingerprint_json.encode()).hexdigest()
+        return fingerprint
+
+    def lookup(self, key: str, fingerprint: str) -> Optional[dict]:
+        """Get the cached entry for the given key if its fingerprint matches.
+
+        Args:
+            key (str): the key e.g. project folder and check group
+            fingerprint (str): the current fingerprint of the inputs
+
+        Returns:
+            dict: the cached entry or None
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry.get("fingerprint") == fingerprint:
+                self.hits += 1
+            else:
+                entry = None
+                self.misses += 1
+        return entry
+
+    def lookup_recent(self, key: str, max_age: float) -> Optional[dict]:
+        """Get the cached entry for the given key if it was stored at most
+        max_age seconds ago.
+
+        Args:
+            key (str): the key e.g. the project and the remote lookup
+            max_age (float): the maximum age in seconds
+
+        Returns:
+            dict: the cached entry or None
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and time.time() - entry.get("stored", 0) <= max_age:
+                self.hits += 1
+            else:
+                entry = None
+                self.misses += 1
+        return entry
+
+    def store_recent(self, key: str, entry: dict):
+        """Store the given entry with the current time - see
+        lookup_recent."""
+        entry["stored"] = time.time()
+        with self.lock:
+            self.entries[key] = entry
+            self.modified = True
+
+    def store(self, key: str, fingerprint: str, entry: dict):
+        """Store the given entry with the given fingerprint."""
+        entry["fingerprint"] = fingerprint
+        with self.lock:
+            self.entries[key] = entry
+            self.modified = True
+
+    def save(self):
+        """Save the cache atomically if it was modified."""
+        with self.lock:
+            if self.modified:
+                if not os.path.exists(self.cache_file):
+                    print(f"check cache created at {self.cache_file}", file=sys.stderr)
+                os.makedirs(os.path.dirname(self.cache_file) or ".", exist_ok=True)
+                tmp_file = f"{self.cache_file}.tmp"
+                with open(tmp_file, "w") as f:
+                    json.dump(self.entries, f)
+                os.replace(tmp_file, self.cache_file)
+                self.modified = False
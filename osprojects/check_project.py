@@ -5,16 +5,20 @@
 
 import os
 import sys
-from dataclasses import dataclass
-from typing import List
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import List, Optional
 
-from git import Repo
 from git.exc import InvalidGitRepositoryError, NoSuchPathError
 from packaging import version
 
+from osprojects.check_rules import RuleSet
+
 # original at ngwidgets - use redundant local copy ...
 from osprojects.editor import Editor
+from osprojects.file_snapshot import FileEntry, FileSnapshot
 from osprojects.github_api import GitHubAction
+from osprojects.timing import Timing
 
 
 @dataclass
@@ -22,26 +26,41 @@ class Check:
     ok: bool = False
     path: str = None
     msg: str = ""
-    content: str = None
+    file_entry: FileEntry = field(default=None, repr=False, compare=False)
 
     @property
     def marker(self) -> str:
         return f"✅" if self.ok else f"❌"
 
+    @property
+    def content(self) -> Optional[str]:
+        """The lazily decoded content of a file check."""
+        content = self.file_entry.text if self.file_entry is not None else None
+        return content
+
     @classmethod
     def file_exists(cls, path) -> "Check":
-        ok = os.path.exists(path)
-        content = None
-        if ok and os.path.isfile(path):
-            with open(path, "r") as f:
-                content = f.read()
-        check = Check(ok, path, msg=path, content=content)
+        file_entry = FileSnapshot.get_instance().get(path)
+        ok = file_entry.exists and not file_entry.too_large
+        msg = path
+        if file_entry.too_large:
+            msg = f"{path} exceeds {FileSnapshot.get_instance().max_size} bytes"
+        check = Check(ok, path, msg=msg, file_entry=file_entry)
         return check
 
 
 class CheckProject:
     """Checker for an individual open source project."""
 
+    # increase whenever the checks change to invalidate cached results
+    CHECKER_VERSION = 2
+    WORKFLOW_FILES = ["build.yml", "upload-to-pypi.yml"]
+    SCRIPT_FILES = ["blackisort", "test", "install", "doc", "release"]
+    # the cacheable check groups in the order they are run
+    GROUPS = ["pyproject_toml", "github_workflows", "readme", "scripts"]
+    # the project state derived by the pyproject_toml group
+    STATE_ATTRS = ["project_name", "requires_python", "min_python_version_minor"]
+
     def __init__(self, parent, project, args):
         self.parent = parent
         self.project = project
@@ -52,6 +71,7 @@ class CheckProject:
         self.requires_python = None
         self.min_python_version_minor = None
         self.max_python_version_minor = 13  # python 3.13 is max version
+        self.latest_run_future: Optional[Future] = None
 
     @property
     def total(self) -> int:
@@ -91,6 +111,54 @@ class CheckProject:
         check = self.add_check(ok, msg=f"{needle} in ", path=path, negative=negative)
         return check
 
+    def rule_params(self) -> dict:
+        """Get the template parameters of the content rules."""
+        python_minor = []
+        if self.min_python_version_minor is not None:
+            python_minor = list(
+                range(self.min_python_version_minor, self.max_python_version_minor + 1)
+            )
+        params = {
+            "project_name": self.project_name,
+            "owner": self.project.owner,
+            "project_id": self.project.project_id,
+            "fqid": self.project.fqid,
+            "python_minor": python_minor,
+            "python_versions": ", ".join(f"'3.{minor}'" for minor in python_minor),
+        }
+        return params
+
+    def add_rule_checks(self, rel_path: str, file_check: Check) -> List[Check]:
+        """Add the checks of the content rules of the given file.
+
+        The rule results are memoized by content hash so that identical
+        copies of a file are only evaluated once per run - only the path is
+        project specific.
+
+        Args:
+            rel_path (str): the path of the file relative to the project folder with / separators
+            file_check (Check): the existence check of the file with its content
+
+        Returns:
+            List[Check]: the added checks
+        """
+        rule_set = RuleSet.get_default()
+        params = self.rule_params()
+        file_entry = file_check.file_entry
+        if file_entry is not None and file_entry.content_hash is not None:
+            results = rule_set.evaluate_memoized(
+                rel_path, file_entry.content_hash, lambda: file_check.content, params
+            )
+        else:
+            results = rule_set.evaluate(rel_path, file_check.content, params)
+        checks = []
+        for rule, ok in results:
+            check = self.add_check(
+                ok, msg=rule.message, path=file_check.path, negative=rule.negative
+            )
+            checks.append(check)
+        return checks
+
     def add_path_check(self, path) -> Check:
         # Check if path exists
         path_exists = Check.file_exists(path)
@@ -121,14 +189,11 @@ class CheckProject:
         workflows_exist = self.add_path_check(workflows_path)
 
         if workflows_exist.ok:
-            required_files = ["build.yml", "upload-to-pypi.yml"]
-            for file in required_files:
+            for file in CheckProject.WORKFLOW_FILES:
                 file_path = os.path.join(workflows_path, file)
                 file_exists = self.add_path_check(file_path)
 
                 if file_exists.ok:
-                    content = file_exists.content
-
                     if file == "build.yml":
                         min_python_version_minor = int(
                             self.requires_python.split(".")[-1]
@@ -138,73 +203,17 @@ class CheckProject:
                             msg=f"{min_python_version_minor} (build.yml)!={self.min_python_version_minor} (pyprojec.toml)",
                             path=file_path,
                         )
-                        python_versions = f"""python-version: [ {", ".join([f"'3.{i}'" for i in range(self.min_python_version_minor, self.max_python_version_minor + 1)])} ]"""
-                        self.add_content_check(
-                            content,
-                            python_versions,
-                            file_path,
-                        )
-                        self.add_content_check(
-                            content,
-                            "os: [ubuntu-latest, macos-latest, windows-latest]",
-                            file_path,
-                        )
-                        self.add_content_check(
-                            content, "uses: actions/checkout@v6", file_path
-                        )
-                        self.add_content_check(
-                            content,
-                            "uses: actions/setup-python@v6",
-                            file_path,
-                        )
-
-                        self.add_content_check(
-                            content, "sphinx", file_path, negative=True
-                        )
-                        scripts_ok = (
-                            "scripts/install" in content
-                            and "scripts/test" in content
-                            or "scripts/installAndTest" in content
-                        )
-                        self.add_check(scripts_ok, "install and test", file_path)
-
-                    elif file == "upload-to-pypi.yml":
-                        self.add_content_check(content, "id-token: write", file_path)
-                        self.add_content_check(
-                            content, "uses: actions/checkout@v6", file_path
-                        )
-                        self.add_content_check(
-                            content,
-                            "uses: actions/setup-python@v6",
-                            file_path,
-                        )
-                        self.add_content_check(
-                            content,
-                            "uses: pypa/gh-action-pypi-publish@release/v1",
-                            file_path,
-                        )
+                    self.add_rule_checks(f".github/workflows/{file}", file_exists)
 
     def check_scripts(self):
         scripts_path = os.path.join(self.project_path, "scripts")
         scripts_exist = self.add_path_check(scripts_path)
         if scripts_exist.ok:
-            required_files = ["blackisort", "test", "install", "doc", "release"]
-            for file in required_files:
+            for file in CheckProject.SCRIPT_FILES:
                 file_path = os.path.join(scripts_path, file)
                 file_exists = self.add_path_check(file_path)
                 if file_exists.ok:
-                    content = file_exists.content
-                    if file == "doc":
-                        self.add_content_check(
-                            content, "sphinx", file_path, negative=True
-                        )
-                        self.add_content_check(
-                            content, "WF 2024-07-30 - updated", file_path
-                        )
-                    if file == "test":
-                        self.add_content_check(content, "WF 2024-08-03", file_path)
-                    if file == "release":
-                        self.add_content_check(content, "scripts/doc -d", file_path)
+                    self.add_rule_checks(f"scripts/{file}", file_exists)
 
     def check_readme(self):
         readme_path = os.path.join(self.project_path, "README.md")
@@ -217,26 +226,7 @@ class CheckProject:
             )
             return
         if readme_exists.ok:
-            readme_content = readme_exists.content
-            badge_lines = [
-                "[![pypi](https://img.shields.io/pypi/pyversions/{self.project_name})](https://pypi.org/project/{self.project_name}/)",
-                "[![Github Actions Build](https://github.com/{self.project.fqid}/actions/workflows/build.yml/badge.svg)](https://github.com/{self.project.fqid}/actions/workflows/build.yml)",
-                "[![PyPI Status](https://img.shields.io/pypi/v/{self.project_name}.svg)](https://pypi.python.org/pypi/{self.project_name}/)",
-                "[![GitHub issues](https://img.shields.io/github/issues/{self.project.fqid}.svg)](https://github.com/{self.project.fqid}/issues)",
-                "[![GitHub closed issues](https://img.shields.io/github/issues-closed/{self.project.fqid}.svg)](https://github.com/{self.project.fqid}/issues/?q=is%3Aissue+is%3Aclosed)",
-                "[![API Docs](https://img.shields.io/badge/API-Documentation-blue)](https://{self.project.owner}.github.io/{self.project.project_id}/)",
-                "[![License](https://img.shields.io/github/license/{self.project.fqid}.svg)](https://www.apache.org/licenses/LICENSE-2.0)",
-            ]
-            for line in badge_lines:
-                formatted_line = line.format(self=self)
-                self.add_content_check(
-                    content=readme_content,
-                    needle=formatted_line,
-                    path=readme_path,
-                )
-            self.add_content_check(
-                readme_content, "readthedocs", readme_path, negative=True
-            )
+            self.add_rule_checks("README.md", readme_exists)
 
     def check_pyproject_toml_vialib(self, toml_module) -> bool:
         """Check pyproject.toml using the given toml_module."""
@@ -268,15 +258,7 @@ class CheckProject:
                     self.min_python_version_minor = int(
                         str(min_python_version).split(".")[-1]
                     )
-                    for minor_version in range(
-                        self.min_python_version_minor, self.max_python_version_minor + 1
-                    ):
-                        needle = f"Programming Language :: Python :: 3.{minor_version}"
-                        self.add_content_check(content, needle, toml_path)
-            self.add_content_check(content, "hatchling", toml_path)
-            self.add_content_check(
-                content, "[tool.hatch.build.targets.wheel.sources]", toml_path
-            )
+            self.add_rule_checks("pyproject.toml", toml_exists)
         return toml_exists.ok
 
     def check_pyproject_toml_py311(self) -> bool:
@@ -327,13 +309,171 @@ class CheckProject:
             )
 
             # Check if there are uncommitted changes (this still requires local git access)
-            local_repo = Repo(self.project_path)
+            git_status = self.parent.git_status(self.project_path)
+            self.add_check(
+                not git_status.is_dirty,
+                f"uncomitted changes ({git_status.summary}) for ",
+                self.project_path,
+            )
+
+        except InvalidGitRepositoryError:
+            self.add_check(False, "Not a valid git repository", self.project_path)
+        except NoSuchPathError:
             self.add_check(
-                not local_repo.is_dirty(), "uncomitted changes for", self.project_path
+                False, "Git repository path does not exist", self.project_path
             )
+        except Exception as ex:
+            self.add_error(ex, self.project_path)
+
+        return owner_match and not is_fork
+
+    @property
+    def ok(self) -> bool:
+        return len(self.failed_checks) == 0
+
+    def to_dict(self) -> dict:
+        """Get the results of the checks as a JSON compatible dict."""
+        result = {
+            "project": str(self.project),
+            "url": self.project.url,
+            "ok": self.ok,
+            "total": self.total,
+            "failed": len(self.failed_checks),
+            "checks": [
+                {"ok": check.ok, "path": check.path, "msg": check.msg}
+                for check in self.checks
+            ],
+        }
+        return result
+
+    def group_inputs(self, group: str) -> List[str]:
+        """Get the paths of the files the given check group reads.
+
+        The groups depending on the project state derived from
+        pyproject.toml also declare pyproject.toml as input.
+        """
+        rel_paths = ["pyproject.toml"]
+        if group == "github_workflows":
+            workflows = os.path.join(".github", "workflows")
+            rel_paths += [workflows] + [
+                os.path.join(workflows, file) for file in CheckProject.WORKFLOW_FILES
+            ]
+        elif group == "readme":
+            rel_paths += ["README.md"]
+        elif group == "scripts":
+            rel_paths = ["scripts"] + [
+                os.path.join("scripts", file) for file in CheckProject.SCRIPT_FILES
+            ]
+        inputs = [os.path.join(self.project_path, rel_path) for rel_path in rel_paths]
+        return inputs
+
+    def state(self) -> dict:
+        """Get the project state derived by the checks."""
+        state = {attr: getattr(self, attr) for attr in CheckProject.STATE_ATTRS}
+        return state
+
+    def run_group(self, group: str):
+        """Run the check method of the given group as a timed span - see
+        evaluate_group."""
+        timing = Timing.get_instance()
+        with timing.span(f"check_{group}", "group", project=self.project.fqid):
+            result = self.evaluate_group(group)
+        return result
+
+    def evaluate_group(self, group: str):
+        """Run the check method of the given group - if a check cache is
+        available the results are served from the cache while the group
+        inputs are unchanged.
+
+        Args:
+            group (str): the check group e.g. readme for check_readme
 
-            # Check latest GitHub Actions workflow run
-            latest_run = GitHubAction.get_latest_workflow_run(self.project)
+        Returns:
+            the result of the check method
+        """
+        check_method = getattr(self, f"check_{group}")
+        check_cache = getattr(self.parent, "check_cache", None)
+        if check_cache is None:
+            return check_method()
+        key = f"{self.project_path}:{group}"
+        params = {
+            "fqid": self.project.fqid,
+            "rules": RuleSet.get_default().version,
+            "max_python_version_minor": self.max_python_version_minor,
+            "state": self.state(),
+        }
+        fingerprint = check_cache.fingerprint(
+            CheckProject.CHECKER_VERSION, self.group_inputs(group), params
+        )
+        entry = check_cache.lookup(key, fingerprint)
+        if entry is not None:
+            for record in entry["checks"]:
+                self.checks.append(Check(**record))
+            for attr, value in entry["state"].items():
+                setattr(self, attr, value)
+            result = entry["result"]
+        else:
+            start = len(self.checks)
+            result = check_method()
+            entry = {
+                "result": result,
+                "checks": [
+                    {"ok": check.ok, "path": check.path, "msg": check.msg}
+                    for check in self.checks[start:]
+                ],
+                "state": self.state(),
+            }
+            check_cache.store(key, fingerprint, entry)
+        return result
+
+    def run_checks(self, latest_run_future: Future = None) -> "CheckProject":
+        """Run all checks of the project without any output so that projects
+        can be checked concurrently.
+
+        The local checks run first - the remote workflow run check comes
+        last so that a prefetched result has the most time to arrive.
+
+        Args:
+            latest_run_future (Future): the prefetched latest workflow run if any
+        """
+        timing = Timing.get_instance()
+        fqid = self.project.fqid
+        with timing.span(str(self.project), "project"):
+            self.check_local()
+            if self.run_group("pyproject_toml"):
+                self.run_group("github_workflows")
+                self.run_group("readme")
+                self.run_group("scripts")
+            # the git status depends on the whole working tree and is never cached
+            with timing.span("check_git", "git", project=fqid):
+                self.check_git()
+            with timing.span("check_workflow_run", "remote", project=fqid):
+                self.check_workflow_run(latest_run_future)
+        return self
+
+    def check_workflow_run(self, latest_run_future: Future = None):
+        """Check the latest GitHub Actions workflow run.
+
+        Args:
+            latest_run_future (Future): the prefetched result of
+                GitHubAction.get_latest_workflow_run - fetched here via the
+                parent's fetch_workflow_run if None
+        """
+        if latest_run_future is None:
+            latest_run_future = Future()
+            if self.parent is not None:
+                fetch_workflow_run = self.parent.fetch_workflow_run
+            else:
+                fetch_workflow_run = GitHubAction.get_latest_workflow_run
+            try:
+                latest_run = fetch_workflow_run(self.project)
+                latest_run_future.set_result(latest_run)
+            except Exception as ex:
+                latest_run_future.set_exception(ex)
+        # keep the completed lookup so that rechecks can reuse it
+        self.latest_run_future = latest_run_future
+        try:
+            latest_run = latest_run_future.result()
             if latest_run:
                 self.add_check(
                     latest_run["conclusion"] == "success",
@@ -346,27 +486,22 @@ class CheckProject:
                     "No GitHub Actions runs found",
                     self.project.repo.ticketUrl(),
                 )
-
-        except InvalidGitRepositoryError:
-            self.add_check(False, "Not a valid git repository", self.project_path)
-        except NoSuchPathError:
-            self.add_check(
-                False, "Git repository path does not exist", self.project_path
-            )
         except Exception as ex:
             self.add_error(ex, self.project_path)
 
-        return owner_match and not is_fork
-
     def check(self, title: str):
         """Check the given project and print results."""
-        self.check_local()
-        self.check_git()
-        if self.check_pyproject_toml():
-            self.check_github_workflows()
-            self.check_readme()
-            self.check_scripts()
+        self.run_checks()
+        self.report(title)
 
+    def report(self, title: str, file=None):
+        """Print the results of the checks.
+
+        Args:
+            title (str): the title prefix e.g. the number of the project
+            file: the stream to print to - defaults to sys.stdout
+        """
+        file = file or sys.stdout
         # ok_count=len(ok_checks)
         failed_count = len(self.failed_checks)
         summary = (
@@ -374,7 +509,7 @@ class CheckProject:
             if failed_count > 0
             else f"✅ {self.total:2}/{self.total:2}"
         )
-        print(f"{title}{summary}:{self.project}→{self.project.url}")
+        print(f"{title}{summary}:{self.project}→{self.project.url}", file=file)
         if failed_count > 0:
             # Sort checks by path
             sorted_checks = sorted(self.checks, key=lambda c: c.path or "")
@@ -390,13 +525,13 @@ class CheckProject:
             for path, path_checks in checks_by_path.items():
                 path_failed = sum(1 for c in path_checks if not c.ok)
                 if path_failed > 0 or self.args.debug:
-                    print(f"❌ {path}: {path_failed}")
+                    print(f"❌ {path}: {path_failed}", file=file)
                     i = 0
                     for check in path_checks:
                         show = not check.ok or self.args.debug
                         if show:
                             i += 1
-                            print(f"    {i:3}{check.marker}:{check.msg}")
+                            print(f"    {i:3}{check.marker}:{check.msg}", file=file)
 
                     if self.args.editor and path_failed > 0:
                         if os.path.isfile(path):
@@ -0,0 +1,230 @@
+"""Created on 2026-10-19.
+
+@author: wf
+"""
+
+import hashlib
+import os
+import string
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+import yaml
+
+
+@dataclass(frozen=True)
+class Rule:
+    """A content rule with its template parameters already applied.
+
+    Attributes:
+        needle (str): text that has to be contained in the file
+        negative (bool): if True the needle must not be contained
+        alternatives (tuple): alternative tuples of needles - ok if all needles of one are contained
+        msg (str): the message of an alternatives rule
+    """
+
+    needle: Optional[str] = None
+    negative: bool = False
+    alternatives: Optional[Tuple[Tuple[str, ...], ...]] = None
+    msg: Optional[str] = None
+
+    @property
+    def needles(self) -> List[str]:
+        """Get all needles this rule needs to look for."""
+        if self.alternatives is not None:
+            needles = [needle for needles in self.alternatives for needle in needles]
+        else:
+            needles = [self.needle]
+        return needles
+
+    @property
+    def message(self) -> str:
+        message = self.msg if self.alternatives is not None else f"{self.needle} in "
+        return message
+
+    def evaluate(self, found: Set[str]) -> bool:
+        """Evaluate the rule for the given set of needles found in the content
+        - negative rules are inverted by CheckProject.add_check."""
+        if self.alternatives is not None:
+            ok = any(
+                all(needle in found for needle in needles)
+                for needles in self.alternatives
+            )
+        else:
+            ok = self.needle in found
+        return ok
+
+
+def find_needles(content: str, needles: Tuple[str, ...]) -> Set[str]:
+    """Find which of the given needles are contained in the content.
+
+    Each distinct needle is looked up with the substring search of str.
+    A single pass multi-pattern matcher e.g. a pure Python Aho-Corasick
+    automaton or a combined regular expression is 25 to 60 times slower
+    for the handful of needles per file - files with the same content
+    are evaluated only once via RuleSet.evaluate_memoized.
+
+    Args:
+        content (str): the text to scan
+        needles (Tuple[str, ...]): the distinct needles to look for
+
+    Returns:
+        Set[str]: the contained needles
+    """
+    found = set()
+    if content:
+        found = {needle for needle in needles if needle in content}
+    return found
+
+
+class RuleSet:
+    """Declarative content rules of checkos loaded from YAML.
+
+    The rules are grouped by the path of the file relative to the project
+    folder - all rules of a file are evaluated from a single lookup of
+    their distinct needles in its content.
+    """
+
+    RULES_PATH = os.path.join(
+        os.path.dirname(__file__), "resources", "check_rules.yaml"
+    )
+    default_rule_set = None
+    default_lock = threading.Lock()
+
+    def __init__(self, rules_by_path: Dict[str, List[dict]], version: str = ""):
+        """Construct me.
+
+        Args:
+            rules_by_path (Dict[str, List[dict]]): the rule definitions by relative file path
+            version (str): a hash of the rule definitions
+        """
+        self.rules_by_path = rules_by_path
+        self.version = version
+        # rule results by file, content hash and used parameters
+        self.memo: Dict[tuple, List[Tuple[Rule, bool]]] = {}
+        self.memo_lock = threading.Lock()
+        self.memo_hits = 0
+        self.memo_misses = 0
+
+    @classmethod
+    def load(cls, path: Optional[str] = None) -> "RuleSet":
+        """Load the rule set from the given YAML file - defaults to the
+        check_rules.yaml resource."""
+        path = path or cls.RULES_PATH
+        with open(path, "r", encoding="utf-8") as f:
+            yaml_text = f.read()
+        rules_by_path = yaml.safe_load(yaml_text) or {}
+        version = hashlib.sha1(yaml_text.encode()).hexdigest()
+        rule_set = cls(rules_by_path, version)
+        return rule_set
+
+    @classmethod
+    def get_default(cls) -> "RuleSet":
+        """Get the default rule set - loaded once per run."""
+        with cls.default_lock:
+            if cls.default_rule_set is None:
+                cls.default_rule_set = cls.load()
+        return cls.default_rule_set
+
+    def expand(self, rel_path: str, params: dict) -> List[Rule]:
+        """Apply the given template parameters to the rules of the given file.
+
+        Args:
+            rel_path (str): the path of the file relative to the project folder with / separators
+            params (dict): the template parameters e.g. project_name and python_minor
+
+        Returns:
+            List[Rule]: the rules in definition order - foreach rules expanded per value
+        """
+        rules = []
+        for rule_def in self.rules_by_path.get(rel_path, []):
+            if "any" in rule_def:
+                alternatives = tuple(
+                    tuple(needle.format_map(params) for needle in needles)
+                    for needles in rule_def["any"]
+                )
+                rules.append(Rule(alternatives=alternatives, msg=rule_def.get("msg")))
+                continue
+            foreach = rule_def.get("foreach")
+            values = (params.get(foreach) or []) if foreach else [None]
+            for value in values:
+                rule_params = dict(params, **{foreach: value}) if foreach else params
+                rules.append(
+                    Rule(
+                        needle=rule_def["needle"].format_map(rule_params),
+                        negative=rule_def.get("negative", False),
+                    )
+                )
+        return rules
+
+    def evaluate(
+        self, rel_path: str, content: str, params: dict
+    ) -> List[Tuple[Rule, bool]]:
+        """Evaluate the rules of the given file against its content.
+
+        Args:
+            rel_path (str): the path of the file relative to the project folder with / separators
+            content (str): the content of the file
+            params (dict): the template parameters
+
+        Returns:
+            List[Tuple[Rule, bool]]: each rule with its result
+        """
+        rules = self.expand(rel_path, params)
+        needles = tuple(dict.fromkeys(n for rule in rules for n in rule.needles))
+        found = find_needles(content, needles)
+        results = [(rule, rule.evaluate(found)) for rule in rules]
+        return results
+
+    def param_names(self, rel_path: str) -> List[str]:
+        """Get the names of the template parameters the rules of the given file
+        use."""
+        names = set()
+        formatter = string.Formatter()
+        for rule_def in self.rules_by_path.get(rel_path, []):
+            templates = [rule_def.get("needle") or ""]
+            for needles in rule_def.get("any", []):
+                templates.extend(needles)
+            for template in templates:
+                for _text, name, _spec, _conversion in formatter.parse(template):
+                    if name:
+                        names.add(name)
+            if rule_def.get("foreach"):
+                names.add(rule_def["foreach"])
+        return sorted(names)
+
+    def evaluate_memoized(
+        self,
+        rel_path: str,
+        content_hash: str,
+        get_content: Callable[[], str],
+        params: dict,
+    ) -> List[Tuple[Rule, bool]]:
+        """Evaluate the rules of the given file once per distinct content and
+        used parameters - identical copies of a file e.g. the same
+        scripts/test in many projects reuse the results.
+
+        Args:
+            rel_path (str): the path of the file relative to the project folder with / separators
+            content_hash (str): the hash of the content
+            get_content (Callable[[], str]): returns the content - only called if not memoized
+            params (dict): the template parameters
+
+        Returns:
+            List[Tuple[Rule, bool]]: each rule with its result
+        """
+        used_params = tuple(
+            (name, repr(params.get(name))) for name in self.param_names(rel_path)
+        )
+        key = (rel_path, content_hash, used_params)
+        with self.memo_lock:
+            results = self.memo.get(key)
+            if results is not None:
+                self.memo_hits += 1
+        if results is None:
+            results = self.evaluate(rel_path, get_content(), params)
+            with self.memo_lock:
+                self.memo[key] = results
+                self.memo_misses += 1
+        return results
@@ -0,0 +1,157 @@
+"""Created on 2026-10-19.
+
+@author: wf
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from typing import List, Tuple
+
+
+class CheckShard:
+    """A deterministic shard i/n of the selected projects e.g. for spreading
+    the checks of a fleet over several CI nodes.
+
+    Projects are assigned to shards by a stable hash of their owner and
+    project id so that every node computes the same partition from the
+    same selection. Each shard saves its results as a JSON file and the
+    merged result files give the report and exit code of a single run.
+    """
+
+    RESULTS_VERSION = 1
+
+    def __init__(self, index: int, count: int):
+        """Construct me.
+
+        Args:
+            index (int): the 1-based number of the shard
+            count (int): the total number of shards
+        """
+        if count < 1 or not 1 <= index <= count:
+            raise ValueError(f"invalid shard {index}/{count}")
+        self.index = index
+        self.count = count
+
+    def __str__(self):
+        return f"{self.index}/{self.count}"
+
+    @classmethod
+    def parse(cls, spec: str) -> "CheckShard":
+        """Parse a shard specification like 2/4 - usable as an argparse
+        type.
+
+        Raises:
+            argparse.ArgumentTypeError: if the specification is invalid
+        """
+        try:
+            index, count = (int(part) for part in spec.split("/"))
+            shard = cls(index, count)
+        except ValueError:
+            raise argparse.ArgumentTypeError(
+                f"invalid shard {spec} - expected i/n with 1 <= i <= n"
+            )
+        return shard
+
+    @staticmethod
+    def bucket(key: str, count: int) -> int:
+        """Get the 0-based shard of the given key - stable across machines
+        and Python processes unlike the builtin hash."""
+        digest = hashlib.sha1(key.lower().encode("utf-8")).hexdigest()
+        bucket = int(digest, 16) % count
+        return bucket
+
+    def contains(self, project) -> bool:
+        result = CheckShard.bucket(project.fqid, self.count) == self.index - 1
+        return result
+
+    def select(self, projects: List) -> Tuple[List[int], List]:
+        """Select the projects of this shard.
+
+        Args:
+            projects: all selected projects in report order
+
+        Returns:
+            Tuple[List[int], List]: the numbers of the projects in the
+            single run report and the projects of this shard
+        """
+        numbers = []
+        shard_projects = []
+        for number, project in enumerate(projects, 1):
+            if self.contains(project):
+                numbers.append(number)
+                shard_projects.append(project)
+        return numbers, shard_projects
+
+    @property
+    def default_results_path(self) -> str:
+        path = f"checkos_shard_{self.index}_of_{self.count}.json"
+        return path
+
+    def save_results(self, path: str, total: int, results: List[dict]):
+        """Save the results of this shard.
+
+        Args:
+            path (str): the JSON file to write
+            total (int): the number of projects selected by all shards
+            results (List[dict]): the numbered result of each project
+        """
+        shard_results = {
+            "version": CheckShard.RESULTS_VERSION,
+            "shard": self.index,
+            "shards": self.count,
+            "total": total,
+            "projects": results,
+        }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as json_file:
+            json.dump(shard_results, json_file, indent=2, default=str)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def merge(paths: List[str], file=None) -> int:
+        """Merge the result files of all shards of a run into the report of a
+        single run.
+
+        Args:
+            paths (List[str]): the result files - one per shard
+            file: the stream to print to - defaults to sys.stdout
+
+        Returns:
+            int: the combined exit code - 0 if all checks passed else 1
+
+        Raises:
+            ValueError: if the result files are not the complete set of
+                shards of one run
+        """
+        file = file or sys.stdout
+        shards = {}
+        count = total = None
+        results = []
+        for path in paths:
+            with open(path, encoding="utf-8") as json_file:
+                shard_results = json.load(json_file)
+            if shard_results.get("version") != CheckShard.RESULTS_VERSION:
+                raise ValueError(f"{path} is not a checkos shard result file")
+            if count is None:
+                count, total = shard_results["shards"], shard_results["total"]
+            elif (shard_results["shards"], shard_results["total"]) != (count, total):
+                raise ValueError(f"{path} belongs to a different sharded run")
+            index = shard_results["shard"]
+            if index in shards:
+                raise ValueError(f"shard {index}/{count} in {shards[index]} and {path}")
+            shards[index] = path
+            results.extend(shard_results["projects"])
+        missing = sorted(set(range(1, (count or 0) + 1)) - set(shards))
+        if not shards or missing:
+            raise ValueError(f"missing shards {missing} of {count}")
+        if len(results) != total:
+            raise ValueError(f"{len(results)} of {total} project results found")
+        exit_code = 0
+        for result in sorted(results, key=lambda result: result["number"]):
+            print(result["report"], end="", file=file)
+            if not result["ok"]:
+                exit_code = 1
+        return exit_code
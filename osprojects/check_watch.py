@@ -0,0 +1,222 @@
+"""Created on 2026-10-19.
+
+@author: wf
+"""
+
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from osprojects.check_project import CheckProject
+from osprojects.file_snapshot import FileSnapshot
+
+
+class CheckWatcher:
+    """Watch the check inputs of the checked projects and recheck only the
+    affected projects when files change.
+
+    Changes are detected by polling the stat of the declared group inputs
+    or - if the optional watchdog package is installed - by file system
+    events. Unchanged check groups of a rechecked project are served from
+    the check cache and the remote workflow run lookup of the first run is
+    reused so that a recheck only touches the changed files.
+    """
+
+    # directories whose changes never affect the checks e.g. git operations
+    IGNORED_DIRS = {".git", ".venv", "venv", "node_modules", "__pycache__", ".tox"}
+
+    def __init__(self, checkos, interval: float = 0.2, use_watchdog: bool = True):
+        """Construct me.
+
+        Args:
+            checkos (CheckOS): the checker with the checkers of the initial run
+            interval (float): the polling interval in seconds
+            use_watchdog (bool): if True use watchdog events if available
+        """
+        self.checkos = checkos
+        self.interval = interval
+        self.use_watchdog = use_watchdog
+        self.observer = None
+        self.events: Set[str] = set()
+        self.events_lock = threading.Lock()
+        self.stats: Dict[str, Optional[Tuple[int, int]]] = {}
+        # the project folder and groups of each watched path
+        self.path_groups: Dict[str, Tuple[str, Set[str]]] = {}
+        for folder, checker in checkos.checkers.items():
+            for group in CheckProject.GROUPS:
+                for path in map(os.path.abspath, checker.group_inputs(group)):
+                    _folder, groups = self.path_groups.setdefault(path, (folder, set()))
+                    groups.add(group)
+
+    @staticmethod
+    def stat_key(path: str) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(path)
+            key = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            key = None
+        return key
+
+    def poll_changes(self) -> Set[str]:
+        """Get the watched paths that changed since the last poll - the first
+        poll only records the current state."""
+        changed = set()
+        first = not self.stats
+        for path in self.path_groups:
+            key = CheckWatcher.stat_key(path)
+            if not first and self.stats.get(path) != key:
+                changed.add(path)
+            self.stats[path] = key
+        return changed
+
+    @staticmethod
+    def is_ignored(path: str) -> bool:
+        """Check whether the given path is in one of the IGNORED_DIRS."""
+        ignored = any(part in CheckWatcher.IGNORED_DIRS for part in path.split(os.sep))
+        return ignored
+
+    def watch_dirs(self) -> Dict[str, bool]:
+        """Get the directories to observe for the watched paths.
+
+        The existing parent directory of each path is observed without
+        recursion - if the parent does not exist yet the nearest existing
+        ancestor is observed recursively.
+
+        Returns:
+            Dict[str, bool]: the recursive flag by directory
+        """
+        watch_dirs = {}
+        for path in self.path_groups:
+            folder = os.path.dirname(path)
+            recursive = False
+            while not os.path.isdir(folder) and os.path.dirname(folder) != folder:
+                folder = os.path.dirname(folder)
+                recursive = True
+            watch_dirs[folder] = watch_dirs.get(folder, False) or recursive
+        return watch_dirs
+
+    def start_observer(self) -> bool:
+        """Start a watchdog observer on the workspace if watchdog is installed.
+
+        Returns:
+            bool: True if file system events are used instead of polling
+        """
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            return False
+        watcher = self
+
+        class EventHandler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                paths = [event.src_path, getattr(event, "dest_path", None)]
+                paths = [os.path.abspath(path) for path in paths if path]
+                paths = [path for path in paths if not CheckWatcher.is_ignored(path)]
+                with watcher.events_lock:
+                    watcher.events.update(paths)
+
+        self.observer = Observer()
+        handler = EventHandler()
+        for folder, recursive in self.watch_dirs().items():
+            self.observer.schedule(handler, folder, recursive=recursive)
+        self.observer.start()
+        return True
+
+    def event_changes(self) -> Set[str]:
+        """Get the watched paths with file system events since the last
+        call."""
+        with self.events_lock:
+            events, self.events = self.events, set()
+        changed = {path for path in events if path in self.path_groups}
+        return changed
+
+    def affected(self, changed_paths: Set[str]) -> Dict[str, Set[str]]:
+        """Map the given changed paths to the affected check groups.
+
+        Returns:
+            Dict[str, Set[str]]: the affected groups by project folder
+        """
+        affected = {}
+        for path in changed_paths:
+            folder, groups = self.path_groups[path]
+            affected.setdefault(folder, set()).update(groups)
+        return affected
+
+    def recheck(self, folder: str, groups: Set[str]) -> List[str]:
+        """Recheck the project in the given folder.
+
+        Args:
+            folder (str): the project folder
+            groups (Set[str]): the affected check groups - for display
+
+        Returns:
+            List[str]: the lines describing the changed results
+        """
+        previous = self.checkos.checkers[folder]
+        checker = self.checkos.recheck(folder)
+        before = {(check.path, check.msg): check.ok for check in previous.checks}
+        after = {(check.path, check.msg): check.ok for check in checker.checks}
+        failed = len(checker.failed_checks)
+        was_failed = len(previous.failed_checks)
+        marker = "❌" if failed else "✅"
+        lines = [
+            f"{marker} {failed:2}/{checker.total:2} (was {was_failed:2}):"
+            f"{checker.project} [{', '.join(sorted(groups))}]"
+        ]
+        for (path, msg), ok in after.items():
+            if before.get((path, msg)) != ok:
+                lines.append(f"    {'✅' if ok else '❌'}:{msg}")
+        for (path, msg), ok in before.items():
+            if (path, msg) not in after:
+                lines.append(f"    ➖:{msg}")
+        return lines
+
+    def check_changes(self) -> List[str]:
+        """Recheck the projects affected by the changes since the last call.
+
+        Returns:
+            List[str]: the delta lines of all rechecked projects
+        """
+        if self.observer is not None:
+            changed = self.event_changes()
+        else:
+            changed = self.poll_changes()
+        lines = []
+        if changed:
+            # each recheck stats the changed files again
+            FileSnapshot.get_instance().new_run()
+            for folder, groups in sorted(self.affected(changed).items()):
+                lines.extend(self.recheck(folder, groups))
+            if self.checkos.check_cache is not None:
+                self.checkos.check_cache.save()
+        return lines
+
+    def run(self, max_rounds: Optional[int] = None):
+        """Watch until interrupted and print the deltas of each recheck.
+
+        Args:
+            max_rounds (int): stop after the given number of polls - endless if None
+        """
+        if not (self.use_watchdog and self.start_observer()):
+            self.poll_changes()
+        project_count = len(self.checkos.checkers)
+        file_count = len(self.path_groups)
+        print(
+            f"watching {project_count} projects ({file_count} files) - Ctrl-C to stop",
+            flush=True,
+        )
+        rounds = 0
+        try:
+            while max_rounds is None or rounds < max_rounds:
+                rounds += 1
+                for line in self.check_changes():
+                    print(line, flush=True)
+                time.sleep(self.interval)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if self.observer is not None:
+                self.observer.stop()
+                self.observer.join()
@@ -5,22 +5,47 @@
 """
 
 import argparse
+import io
 import logging
 import os
+import sys
 import traceback
 from argparse import Namespace
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional
 
+from osprojects.check_cache import CheckCache
 from osprojects.check_project import CheckProject
+from osprojects.check_rules import RuleSet
+from osprojects.check_shard import CheckShard
+from osprojects.checkos_client import DEFAULT_PORT
+from osprojects.file_snapshot import FileSnapshot
+from osprojects.git_status import GitStatus
+from osprojects.github_api import GitHubAction, GitHubApi
 from osprojects.osproject import OsProjects
+from osprojects.timing import Timing, profiled
 
 
 class CheckOS:
     """Checker for a set of open source projects."""
 
+    # the number of concurrent git status processes
+    GIT_STATUS_JOBS = min(8, os.cpu_count() or 1)
+
     def __init__(
-        self, args: Namespace, osprojects: OsProjects, max_python_version_minor=12
+        self,
+        args: Namespace,
+        osprojects: OsProjects,
+        max_python_version_minor=12,
+        check_cache: CheckCache = None,
     ):
         self.args = args
+        self.check_cache = check_cache
+        self.git_status_futures: Dict[str, Future] = {}
+        self.checkers: Dict[str, CheckProject] = {}
+        # the numbered results of the last report e.g. for shard result files
+        self.results: List[dict] = []
         self.verbose = args.verbose
         self.workspace = args.workspace
         self.osprojects = osprojects
@@ -35,7 +60,8 @@ class CheckOS:
         osprojects = OsProjects.from_folder(
             args.workspace, with_progress=True, project_id=project_id
         )
-        return cls(args, osprojects)
+        check_cache = CheckCache() if getattr(args, "cache", False) else None
+        return cls(args, osprojects, check_cache=check_cache)
 
     def select_projects(self):
         try:
@@ -68,19 +94,221 @@ class CheckOS:
         if self.args.local:
             self.osprojects.filter_projects(local_only=True)
 
-    def check_projects(self):
+    def prefetch_workflow_runs(self, executor: Executor, projects) -> List[Future]:
+        """Issue the remote workflow run lookups of all given projects up front
+        on the given executor.
+
+        Returns:
+            List[Future]: the pending lookups in the order of the projects
+        """
+        futures = [
+            executor.submit(self.fetch_workflow_run, project) for project in projects
+        ]
+        return futures
+
+    def fetch_workflow_run(self, project, max_age: float = None) -> Optional[dict]:
+        """Fetch the latest workflow run of the given project as a timed span.
+
+        With a check cache a lookup of at most max_age seconds ago is
+        reused.
+
+        Args:
+            project: the project
+            max_age (float): the maximum age of a reused lookup - defaults to --run-ttl
+
+        Returns:
+            dict: the latest workflow run or None if there is none
+        """
+        if max_age is None:
+            max_age = getattr(self.args, "run_ttl", 0)
+        key = f"{project.fqid}:workflow_run"
+        entry = None
+        if self.check_cache is not None and max_age > 0:
+            entry = self.check_cache.lookup_recent(key, max_age)
+        if entry is not None:
+            latest_run = entry["run"]
+        else:
+            timing = Timing.get_instance()
+            with timing.span("workflow run lookup", "remote", project=project.fqid):
+                latest_run = GitHubAction.get_latest_workflow_run(project)
+            if self.check_cache is not None:
+                self.check_cache.store_recent(key, {"run": latest_run})
+        return latest_run
+
+    @staticmethod
+    def fetch_git_status(folder: str) -> GitStatus:
+        """Get the git status of the given folder as a timed span."""
+        with Timing.get_instance().span("git status", "git", folder=folder):
+            git_status = GitStatus.of_folder(folder)
+        return git_status
+
+    def git_status(self, folder: str) -> GitStatus:
+        """Get the git status of the given folder - from the batched status
+        lookups if available.
+
+        Raises:
+            NoSuchPathError: if the folder does not exist
+            InvalidGitRepositoryError: if the folder is not a git repository
+        """
+        future = self.git_status_futures.get(folder)
+        if future is not None:
+            git_status = future.result()
+        else:
+            git_status = CheckOS.fetch_git_status(folder)
+        return git_status
+
+    def iter_checked(self, projects, latest_run_futures=None) -> Iterator[CheckProject]:
+        """Run the checks of the given projects.
+
+        With --jobs > 1 the checks are run on a bounded thread pool - the
+        checkers are yielded in the order of the given projects so that the
+        report stays numbered as in a sequential run.
+
+        Args:
+            projects: the projects to check
+            latest_run_futures: the prefetched workflow runs of the projects if any
+
+        Yields:
+            CheckProject: the checker of each project with its checks done
+        """
+        # each run stats the files again
+        FileSnapshot.get_instance().new_run()
+        if latest_run_futures is None:
+            latest_run_futures = [None] * len(projects)
+        jobs = getattr(self.args, "jobs", 1) or 1
+        if jobs <= 1:
+            for project, latest_run_future in zip(projects, latest_run_futures):
+                checker = CheckProject(self, project, self.args)
+                yield checker.run_checks(latest_run_future)
+        else:
+            pending = deque()
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                for project, latest_run_future in zip(projects, latest_run_futures):
+                    checker = CheckProject(self, project, self.args)
+                    pending.append(
+                        executor.submit(checker.run_checks, latest_run_future)
+                    )
+                    # bound the number of finished checkers held in memory
+                    if len(pending) >= 2 * jobs:
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+
+    def check_projects(self) -> int:
         """Select, filter, and check all projects based on the provided
-        arguments."""
-        self.select_projects()
-        self.filter_projects()
+        arguments.
 
-        for i, (_url, project) in enumerate(
-            self.osprojects.selected_projects.items(), 1
+        The remote workflow run lookups and the git status of all selected
+        projects are prefetched in the background while the local checks run.
+        With --shard only the projects of the given shard are checked - they
+        keep their numbers of a single run and the rate limits of the
+        access token are divided among the shards.
+
+        Returns:
+            int: the combined exit code - 0 if all checks passed else 1
+        """
+        with Timing.get_instance().span("select projects"):
+            self.select_projects()
+            self.filter_projects()
+        projects = list(self.osprojects.selected_projects.values())
+        total = len(projects)
+        shard = getattr(self.args, "shard", None)
+        numbers = None
+        if shard is not None:
+            numbers, projects = shard.select(projects)
+            GitHubApi.get_instance().share_rate_limits(shard.count)
+        exit_code = self.report_projects(projects, numbers)
+        results_path = getattr(self.args, "results", None)
+        if shard is not None and not results_path:
+            results_path = shard.default_results_path
+        if results_path:
+            shard = shard or CheckShard(1, 1)
+            shard.save_results(results_path, total, self.results)
+            if self.verbose:
+                print(f"results of shard {shard} written to {results_path}")
+        return exit_code
+
+    def report_projects(self, projects: List, numbers: List[int] = None) -> int:
+        """Check and report the given projects - the checkers are kept by
+        project folder e.g. for rechecks in watch mode.
+
+        Args:
+            projects: the projects to check
+            numbers: the report numbers of the projects - 1..n if None
+
+        Returns:
+            int: the combined exit code - 0 if all checks passed else 1
+        """
+        exit_code = 0
+        if numbers is None:
+            numbers = range(1, len(projects) + 1)
+        self.results = []
+        prefetch_jobs = getattr(self.args, "prefetch_jobs", 0)
+        with (
+            ThreadPoolExecutor(max_workers=max(1, prefetch_jobs)) as network,
+            ThreadPoolExecutor(max_workers=CheckOS.GIT_STATUS_JOBS) as local,
         ):
-            checker = CheckProject(self, project, self.args)
-            checker.check(f"{i:3}:")
-            if self.args.badges:
-                print(checker.generate_badge_markdown())
+            # batch the git status of all projects
+            self.git_status_futures = {
+                project.folder: local.submit(CheckOS.fetch_git_status, project.folder)
+                for project in projects
+            }
+            latest_run_futures = None
+            if prefetch_jobs > 0:
+                latest_run_futures = self.prefetch_workflow_runs(network, projects)
+            checkers = self.iter_checked(projects, latest_run_futures)
+            for number, checker in zip(numbers, checkers):
+                self.checkers[checker.project_path] = checker
+                report = io.StringIO()
+                checker.report(f"{number:3}:", file=report)
+                if self.args.badges:
+                    print(checker.generate_badge_markdown(), file=report)
+                print(report.getvalue(), end="", flush=True)
+                result = checker.to_dict()
+                result["number"] = number
+                result["report"] = report.getvalue()
+                self.results.append(result)
+                if not checker.ok:
+                    exit_code = 1
+            self.git_status_futures = {}
+        if self.check_cache is not None:
+            self.check_cache.save()
+            if self.verbose:
+                print(
+                    f"check cache {self.check_cache.cache_file}: {self.check_cache.hits} hits, {self.check_cache.misses} misses"
+                )
+        if self.verbose:
+            rule_set = RuleSet.get_default()
+            print(
+                f"rule results: {rule_set.memo_hits} reused, {rule_set.memo_misses} evaluated"
+            )
+        return exit_code
+
+    def recheck(self, folder: str, refresh_remote: bool = False) -> CheckProject:
+        """Recheck the already checked project in the given folder - with a
+        check cache only the groups with changed inputs are run again.
+
+        Args:
+            folder (str): the project folder
+            refresh_remote (bool): if True fetch the latest workflow run again
+                instead of reusing the lookup of the previous check
+
+        Returns:
+            CheckProject: the new checker - the previous one is replaced
+        """
+        previous = self.checkers[folder]
+        checker = CheckProject(self, previous.project, self.args)
+        latest_run_future = previous.latest_run_future
+        if refresh_remote:
+            latest_run_future = Future()
+            try:
+                latest_run = self.fetch_workflow_run(previous.project, max_age=0)
+                latest_run_future.set_result(latest_run)
+            except Exception as ex:
+                latest_run_future.set_exception(ex)
+        checker.run_checks(latest_run_future)
+        self.checkers[folder] = checker
+        return checker
 
     def handle_exception(self, ex: Exception):
         CheckOS.show_exception(ex, self.args.debug)
@@ -120,6 +348,83 @@ def main(_argv=None):
     parser.add_argument(
         "--local", action="store_true", help="check only locally available projects"
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of projects to check concurrently [default: %(default)s]",
+    )
+    parser.add_argument(
+        "--prefetch-jobs",
+        type=int,
+        default=4,
+        help="number of concurrent background workflow run lookups - 0 to fetch them during the checks [default: %(default)s]",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="reuse the results of the file based check groups with unchanged inputs from ~/.github/cache/checkos_results.json - the git status is always checked",
+    )
+    parser.add_argument(
+        "--run-ttl",
+        type=float,
+        default=300,
+        help="with --cache reuse workflow run lookups of at most the given age in seconds - 0 to always fetch [default: %(default)s]",
+    )
+    parser.add_argument(
+        "-w",
+        "--watch",
+        action="store_true",
+        help="keep watching the checked files and recheck the affected projects on changes - with --cache only the changed check groups are run again",
+    )
+    parser.add_argument(
+        "--watch-interval",
+        type=float,
+        default=0.2,
+        help="polling interval of the watch mode in seconds [default: %(default)s]",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="keep the checked projects in memory and serve check, badge and status requests - see checkos-client",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=DEFAULT_PORT,
+        help="localhost port of the server [default: %(default)s]",
+    )
+    parser.add_argument(
+        "--socket", help="Unix socket path of the server - used instead of the port"
+    )
+    parser.add_argument(
+        "--shard",
+        type=CheckShard.parse,
+        help="check only the shard i/n of the selected projects and save its results - see --merge",
+    )
+    parser.add_argument(
+        "--results",
+        help="write the results as JSON to the given file [default with --shard: checkos_shard_i_of_n.json]",
+    )
+    parser.add_argument(
+        "--merge",
+        nargs="+",
+        metavar="RESULTS",
+        help="report the merged result files of all shards instead of checking",
+    )
+    parser.add_argument(
+        "--profile",
+        help="write cProfile/pstats output to the given file and print the top functions",
+    )
+    parser.add_argument(
+        "--timing",
+        action="store_true",
+        help="print the slowest phases and projects at the end",
+    )
+    parser.add_argument(
+        "--spans", help="write the timing spans as JSON lines to the given file"
+    )
     parser.add_argument(
         "-v", "--verbose", action="store_true", help="show verbose output"
     )
@@ -131,14 +436,46 @@ def main(_argv=None):
     )
 
     args = parser.parse_args(args=_argv)
+    if args.watch and args.serve:
+        parser.error("--watch and --serve can not be combined")
 
+    if args.merge:
+        try:
+            exit_code = CheckShard.merge(args.merge)
+        except (OSError, ValueError) as ex:
+            CheckOS.show_exception(ex, debug=args.debug)
+            exit_code = 2
+        return exit_code
+    timing = Timing.get_instance()
+    if args.spans:
+        timing.open_jsonl(args.spans)
     try:
-        checker = CheckOS.from_args(args)
-        checker.check_projects()
+        with profiled(args.profile):
+            checker = CheckOS.from_args(args)
+            exit_code = checker.check_projects()
+        if args.timing:
+            print(timing.summary(), file=sys.stderr)
+        if args.watch:
+            from osprojects.check_watch import CheckWatcher
+
+            CheckWatcher(checker, interval=args.watch_interval).run()
+        if args.serve:
+            from osprojects.checkos_server import CheckOSServer
+
+            server = CheckOSServer(
+                checker,
+                port=args.port,
+                socket_path=args.socket,
+                verbose=args.verbose,
+            )
+            server.serve()
+        return exit_code
     except Exception as ex:
         CheckOS.show_exception(ex, debug=args.debug)
         raise ex
+    finally:
+        timing.close()
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
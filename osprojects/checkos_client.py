@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+"""Created on 2026-10-19.
+
+@author: wf
+
+Thin client of the checkos server - only uses the standard library so
+that it starts in milliseconds.
+"""
+
+import argparse
+import http.client
+import json
+import socket
+import sys
+from urllib.parse import urlencode
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection over a Unix domain socket."""
+
+    def __init__(self, socket_path: str, timeout: float = 60.0):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+class CheckOSClient:
+    """Client of the checkos server."""
+
+    def __init__(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        socket_path: str = None,
+        timeout: float = 60.0,
+    ):
+        """Construct me.
+
+        Args:
+            host (str): the host of the HTTP server
+            port (int): the port of the HTTP server
+            socket_path (str): the Unix socket of the server - used instead of host and port if given
+            timeout (float): the timeout in seconds
+        """
+        self.host = host
+        self.port = port
+        self.socket_path = socket_path
+        self.timeout = timeout
+
+    def get(self, path: str, **params) -> dict:
+        """Get the JSON result of the given server path.
+
+        Args:
+            path (str): e.g. /check
+            **params: the query parameters - None values are skipped
+
+        Returns:
+            dict: the decoded JSON response
+        """
+        query = urlencode({k: v for k, v in params.items() if v is not None})
+        url = f"{path}?{query}" if query else path
+        if self.socket_path:
+            connection = UnixHTTPConnection(self.socket_path, timeout=self.timeout)
+        else:
+            connection = http.client.HTTPConnection(
+                self.host, self.port, timeout=self.timeout
+            )
+        try:
+            connection.request("GET", url)
+            response = connection.getresponse()
+            result = json.loads(response.read().decode("utf-8"))
+        finally:
+            connection.close()
+        if response.status != 200:
+            raise RuntimeError(result.get("error", f"HTTP {response.status}"))
+        return result
+
+    def check(self, project: str = None, refresh: bool = False) -> dict:
+        """Check the given project - all served projects if None."""
+        result = self.get("/check", project=project, refresh=1 if refresh else None)
+        return result
+
+    def badges(self, project: str) -> dict:
+        result = self.get("/badges", project=project)
+        return result
+
+    def status(self) -> dict:
+        result = self.get("/status")
+        return result
+
+
+def main(_argv=None) -> int:
+    """Command line entry point of the checkos client."""
+    parser = argparse.ArgumentParser(description="Client of the checkos server")
+    parser.add_argument(
+        "command", choices=["check", "badges", "status"], help="the request"
+    )
+    parser.add_argument("-p", "--project", help="name of the project")
+    parser.add_argument(
+        "--host", default=DEFAULT_HOST, help="server host [default: %(default)s]"
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=DEFAULT_PORT,
+        help="server port [default: %(default)s]",
+    )
+    parser.add_argument("--socket", help="Unix socket of the server")
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="fetch the latest workflow run again",
+    )
+    parser.add_argument("--json", action="store_true", help="output raw JSON")
+    args = parser.parse_args(args=_argv)
+    client = CheckOSClient(args.host, args.port, socket_path=args.socket)
+    exit_code = 0
+    try:
+        if args.command == "check":
+            result = client.check(args.project, refresh=args.refresh)
+            exit_code = result["exit_code"]
+            text = result["report"]
+        elif args.command == "badges":
+            if not args.project:
+                parser.error("badges needs --project")
+            result = client.badges(args.project)
+            text = result["markdown"]
+        else:
+            result = client.status()
+            text = json.dumps(result, indent=2)
+    except (OSError, RuntimeError) as ex:
+        print(f"Error: {ex}", file=sys.stderr)
+        return 2
+    if args.json:
+        text = json.dumps(result, indent=2)
+    print(text, end="" if text.endswith("\n") else "\n")
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
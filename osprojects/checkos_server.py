@@ -0,0 +1,234 @@
+"""Created on 2026-10-19.
+
+@author: wf
+"""
+
+import io
+import json
+import os
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+from urllib.parse import parse_qs, urlparse
+
+from osprojects.check_rules import RuleSet
+from osprojects.checkos_client import DEFAULT_HOST, DEFAULT_PORT
+from osprojects.file_snapshot import FileSnapshot
+
+
+class ProjectNotFoundError(Exception):
+    """Raised for requests of projects the server does not serve."""
+
+
+class ThreadingUnixHTTPServer(
+    socketserver.ThreadingMixIn, socketserver.UnixStreamServer
+):
+    """HTTP server on a Unix domain socket."""
+
+    daemon_threads = True
+
+    def server_bind(self):
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+        socketserver.UnixStreamServer.server_bind(self)
+        self.server_name = "localhost"
+        self.server_port = 0
+
+
+class CheckOSRequestHandler(BaseHTTPRequestHandler):
+    """JSON API of the checkos server."""
+
+    def log_message(self, format, *args):
+        if self.server.checkos_server.verbose:
+            BaseHTTPRequestHandler.log_message(self, format, *args)
+
+    def address_string(self):
+        address = self.client_address[0] if self.client_address else "unix"
+        return address
+
+    def send_json(self, status: int, result: dict):
+        body = json.dumps(result, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        server = self.server.checkos_server
+        try:
+            if url.path == "/check":
+                status, result = 200, server.check(
+                    params.get("project"), refresh=params.get("refresh") == "1"
+                )
+            elif url.path == "/badges":
+                status, result = 200, server.badges(params.get("project"))
+            elif url.path == "/status":
+                status, result = 200, server.status()
+            else:
+                status, result = 404, {"error": f"unknown path {url.path}"}
+        except ProjectNotFoundError as ex:
+            status, result = 404, {"error": f"unknown project {ex}"}
+        except Exception as ex:
+            server.checkos.handle_exception(ex)
+            status, result = 500, {"error": str(ex)}
+        self.send_json(status, result)
+
+
+class CheckOSServer:
+    """Long running checkos server keeping the projects, the HTTP caches and
+    the check results in memory.
+
+    Requests recheck the projects incrementally - unchanged check groups
+    are served from the check cache, identical files from the rule memo
+    and the workflow run lookups are reused unless a refresh is requested.
+    The requests are accepted concurrently but served one at a time since
+    they share the checkers, the results and the check cache.
+    """
+
+    def __init__(
+        self,
+        checkos,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        socket_path: Optional[str] = None,
+        verbose: bool = False,
+    ):
+        """Construct me.
+
+        Args:
+            checkos (CheckOS): the checker with the checkers of the initial run
+            host (str): the host to bind to - only localhost should be used
+            port (int): the port to bind to
+            socket_path (str): a Unix socket to bind to instead of host and port
+            verbose (bool): if True log the requests
+        """
+        self.checkos = checkos
+        self.verbose = verbose
+        self.started = time.time()
+        self.requests = 0
+        # serializes the requests on the shared checker state
+        self.lock = threading.Lock()
+        # the server reports the results - it never opens an editor
+        self.checkos.args.editor = False
+        if socket_path:
+            self.httpd = ThreadingUnixHTTPServer(socket_path, CheckOSRequestHandler)
+            self.address = socket_path
+        else:
+            self.httpd = ThreadingHTTPServer((host, port), CheckOSRequestHandler)
+            self.address = f"http://{host}:{self.httpd.server_port}"
+        self.httpd.checkos_server = self
+
+    def find_folders(self, project: Optional[str]) -> List[str]:
+        """Get the folders of the given project - all folders if None.
+
+        Raises:
+            ProjectNotFoundError: if the project is not served
+        """
+        if project is None:
+            folders = list(self.checkos.checkers.keys())
+        else:
+            folders = [
+                folder
+                for folder, checker in self.checkos.checkers.items()
+                if project.lower()
+                in (
+                    str(checker.project.project_id).lower(),
+                    os.path.basename(folder).lower(),
+                )
+            ]
+            if not folders:
+                raise ProjectNotFoundError(project)
+        return folders
+
+    def check(self, project: Optional[str] = None, refresh: bool = False) -> dict:
+        """Recheck the given project - all projects if None.
+
+        Returns:
+            dict: the report, the exit code and the checks of each project
+        """
+        report = io.StringIO()
+        results = []
+        exit_code = 0
+        with self.lock:
+            self.requests += 1
+            FileSnapshot.get_instance().new_run()
+            for i, folder in enumerate(self.find_folders(project), 1):
+                checker = self.checkos.recheck(folder, refresh_remote=refresh)
+                checker.report(f"{i:3}:", file=report)
+                if not checker.ok:
+                    exit_code = 1
+                results.append(checker.to_dict())
+            if self.checkos.check_cache is not None:
+                self.checkos.check_cache.save()
+        result = {
+            "exit_code": exit_code,
+            "report": report.getvalue(),
+            "projects": results,
+        }
+        return result
+
+    def badges(self, project: str) -> dict:
+        """Get the badge markdown of the given project."""
+        with self.lock:
+            self.requests += 1
+            if not project:
+                raise ProjectNotFoundError("project parameter missing")
+            folder = self.find_folders(project)[0]
+            checker = self.checkos.checkers[folder]
+            result = {
+                "project": str(checker.project),
+                "markdown": checker.generate_badge_markdown(),
+            }
+        return result
+
+    def status(self) -> dict:
+        """Get the state of the server and its caches."""
+        rule_set = RuleSet.get_default()
+        check_cache = self.checkos.check_cache
+        with self.lock:
+            self.requests += 1
+            status = {
+                "address": self.address,
+                "pid": os.getpid(),
+                "uptime_secs": round(time.time() - self.started, 1),
+                "requests": self.requests,
+                "projects": len(self.checkos.checkers),
+                "failed_projects": sum(
+                    1 for checker in self.checkos.checkers.values() if not checker.ok
+                ),
+                "check_cache": (
+                    {"hits": check_cache.hits, "misses": check_cache.misses}
+                    if check_cache is not None
+                    else None
+                ),
+                "rule_results": {
+                    "reused": rule_set.memo_hits,
+                    "evaluated": rule_set.memo_misses,
+                },
+                "file_stats": FileSnapshot.get_instance().stats,
+            }
+        return status
+
+    def serve(self):
+        """Serve until interrupted."""
+        print(
+            f"checkos server listening on {self.address} - Ctrl-C to stop", flush=True
+        )
+        try:
+            self.httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.shutdown()
+
+    def shutdown(self):
+        self.httpd.server_close()
+        if isinstance(self.httpd, ThreadingUnixHTTPServer) and os.path.exists(
+            self.address
+        ):
+            os.unlink(self.address)
@@ -0,0 +1,169 @@
+"""Created on 2026-10-19.
+
+@author: wf
+"""
+
+import datetime
+import json
+import os
+import subprocess
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from osprojects.github_api import GitHubApi
+from osprojects.osproject import Commit, OsProject
+
+
+class CommitCache:
+    """Per repository cache of the parsed commits keyed by the last seen HEAD.
+
+    Later calls only parse the commits of last..HEAD and append them to
+    the cache - if the last seen head is no longer an ancestor of HEAD
+    e.g. after a rebase the cache is rebuilt from the full history. The
+    commits are kept sorted by date - if new commits are older than the
+    cached ones e.g. from a merged side branch the cache is rewritten in
+    date order.
+
+    The commits are stored as JSON lines with a small head file holding
+    the last seen HEAD and the valid length of the commit file so that an
+    interrupted append is discarded. The loaded commits are kept in memory
+    so that repeated calls with an unchanged HEAD do not read the file.
+    """
+
+    # cache file -> (head, records) of the commits loaded in this process
+    loaded: Dict[str, Tuple[str, List[dict]]] = {}
+    loaded_lock = threading.Lock()
+
+    def __init__(self, os_project: OsProject, cache_dir: Optional[str] = None):
+        """Construct me.
+
+        Args:
+            os_project (OsProject): the project with the local repository
+            cache_dir (str): the cache directory - defaults to commits in the GitHub cache directory
+        """
+        self.os_project = os_project
+        if cache_dir is None:
+            cache_dir = GitHubApi.get_instance().get_cache_path("commits")
+        os.makedirs(cache_dir, exist_ok=True)
+        self.cache_file = os.path.join(
+            cache_dir, f"{os_project.owner}_{os_project.project_id}.ndjson"
+        )
+        self.head_file = f"{self.cache_file}.head"
+
+    def git(self, *args) -> subprocess.CompletedProcess:
+        """Run the given git command in the repository."""
+        result = subprocess.run(
+            ["git", *args],
+            cwd=self.os_project.folder,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        return result
+
+    def head(self) -> Optional[str]:
+        """Get the full hash of HEAD or None if there is no commit yet."""
+        result = self.git("rev-parse", "--verify", "-q", "HEAD")
+        head = result.stdout.decode().strip() if result.returncode == 0 else None
+        return head
+
+    def is_ancestor(self, commit_hash: str) -> bool:
+        """Check whether the given commit is an ancestor of HEAD."""
+        result = self.git("merge-base", "--is-ancestor", commit_hash, "HEAD")
+        return result.returncode == 0
+
+    @staticmethod
+    def record_date(record: dict) -> datetime.datetime:
+        """Get the date of the given commit record."""
+        date = datetime.datetime.fromisoformat(record["date"])
+        return date
+
+    def load_head(self) -> Tuple[Optional[str], int]:
+        """Load the last seen head and the valid length of the commit file."""
+        head, size = None, 0
+        try:
+            with open(self.head_file, "r") as f:
+                head_record = json.load(f)
+            head, size = head_record["head"], head_record["size"]
+        except (ValueError, KeyError, OSError):
+            pass
+        return head, size
+
+    def load(self) -> Tuple[Optional[str], List[dict]]:
+        """Load the cached head and commit records."""
+        head, size = self.load_head()
+        with CommitCache.loaded_lock:
+            loaded = CommitCache.loaded.get(self.cache_file)
+        if loaded is not None and loaded[0] == head:
+            return loaded
+        records = []
+        try:
+            with open(self.cache_file, "rb") as f:
+                lines = f.read(size).splitlines()
+            records = [json.loads(line) for line in lines]
+        except (ValueError, OSError):
+            head, records = None, []
+        return head, records
+
+    def append(self, head: str, records: List[dict], rebuild: bool = False):
+        """Append the given commit records and record the given head.
+
+        Args:
+            head (str): the head the records are up to date with
+            records (List[dict]): the new commit records
+            rebuild (bool): if True replace the cached records
+        """
+        _cached_head, size = (None, 0) if rebuild else self.load_head()
+        with open(self.cache_file, "ab") as f:
+            # discard the records of an interrupted append
+            f.truncate(size)
+            for record in records:
+                f.write(json.dumps(record, default=str).encode() + b"\n")
+            size = f.tell()
+        tmp_file = f"{self.head_file}.tmp"
+        with open(tmp_file, "w") as f:
+            json.dump({"head": head, "size": size}, f)
+        os.replace(tmp_file, self.head_file)
+
+    def update(self) -> List[dict]:
+        """Bring the cache up to date with HEAD.
+
+        Returns:
+            List[dict]: the commit records sorted by date
+        """
+        head = self.head()
+        cached_head, records = self.load()
+        if head is None:
+            records = []
+        elif head != cached_head:
+            rebuild = not (cached_head and self.is_ancestor(cached_head))
+            if rebuild:
+                commits = self.os_project.iterCommits()
+            else:
+                commits = self.os_project.iterCommits(revisions=f"{cached_head}..HEAD")
+            # git yields the commits newest first - the cache is chronological
+            new_records = [commit.to_record() for commit in commits]
+            new_records.reverse()
+            # make sure the dates are serialized the same way for new and cached records
+            for record in new_records:
+                if not isinstance(record["date"], str):
+                    record["date"] = record["date"].isoformat()
+            new_records.sort(key=CommitCache.record_date)
+            if (
+                not rebuild
+                and records
+                and new_records
+                and CommitCache.record_date(new_records[0])
+                < CommitCache.record_date(records[-1])
+            ):
+                new_records = sorted(records + new_records, key=CommitCache.record_date)
+                rebuild = True
+            self.append(head, new_records, rebuild=rebuild)
+            records = new_records if rebuild else records + new_records
+        with CommitCache.loaded_lock:
+            CommitCache.loaded[self.cache_file] = (head, records)
+        return records
+
+    def getCommits(self) -> List[Commit]:
+        """Get all commits - only parsing the ones not seen before."""
+        commits = [Commit.from_record(record) for record in self.update()]
+        return commits
@@ -0,0 +1,148 @@
+"""Created on 2026-10-19.
+
+@author: wf
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from osprojects.osproject import Commit, Ticket
+
+
+@dataclass
+class TicketRef:
+    """A reference to a ticket in a commit subject.
+
+    Attributes:
+        number (int): the ticket number
+        keyword (str): the closing keyword e.g. fixes - None for plain references
+        ticket (Ticket): the referenced ticket if known
+    """
+
+    number: int
+    keyword: Optional[str] = None
+    ticket: Optional[Ticket] = None
+
+    @property
+    def closes(self) -> bool:
+        return self.keyword is not None
+
+
+class CommitLinker:
+    """Link commits to tickets via the #123, fixes #123 and issue url
+    references in their subjects.
+
+    The references of each subject are extracted with a single regular
+    expression pass and joined against a dict of the tickets keyed by
+    number so linking is linear in the number of commits.
+    """
+
+    REF_PATTERN = re.compile(
+        r"(?:\b(?P<keyword>fix(?:es|ed)?|close[sd]?|resolve[sd]?)\s*:?\s+)?"
+        r"(?:https?://github\.com/(?P<owner>[^/\s]+)/(?P<project>[^/\s]+)/issues/|(?<![\w/&])#)"
+        r"(?P<number>\d+)\b",
+        re.IGNORECASE,
+    )
+
+    def __init__(
+        self,
+        tickets: Dict[int, Ticket],
+        owner: Optional[str] = None,
+        project_id: Optional[str] = None,
+    ):
+        """Construct me.
+
+        Args:
+            tickets (Dict[int, Ticket]): the tickets keyed by number e.g. from OsProject.getAllTickets()
+            owner (str): the owner of the project - url references to other owners are ignored
+            project_id (str): the project - url references to other projects are ignored
+        """
+        self.tickets = tickets
+        self.owner = owner
+        self.project_id = project_id
+
+    def refs(self, subject: str) -> List[TicketRef]:
+        """Extract the ticket references of the given commit subject.
+
+        Args:
+            subject (str): the commit subject
+
+        Returns:
+            List[TicketRef]: the references in order of appearance without duplicates
+        """
+        refs = {}
+        for match in CommitLinker.REF_PATTERN.finditer(subject or ""):
+            owner = match.group("owner")
+            project = match.group("project")
+            if owner and self.owner and owner.lower() != self.owner.lower():
+                continue
+            if (
+                project
+                and self.project_id
+                and project.lower() != self.project_id.lower()
+            ):
+                continue
+            number = int(match.group("number"))
+            keyword = match.group("keyword")
+            keyword = keyword.lower() if keyword else None
+            if number in refs:
+                # a closing reference wins over a plain one
+                if keyword and not refs[number].keyword:
+                    refs[number].keyword = keyword
+            else:
+                refs[number] = TicketRef(
+                    number=number, keyword=keyword, ticket=self.tickets.get(number)
+                )
+        return list(refs.values())
+
+    def link(self, commits: Iterable[Commit]) -> Iterator[tuple]:
+        """Link the given commits to their tickets.
+
+        Yields:
+            Tuple[Commit, List[TicketRef]]: each commit with its references
+        """
+        for commit in commits:
+            yield commit, self.refs(commit.subject)
+
+    @staticmethod
+    def ticket_markup(ref: TicketRef, fmt: str) -> str:
+        """Get the markup for the given ticket reference."""
+        prefix = f"{ref.keyword} " if ref.keyword else ""
+        ticket = ref.ticket
+        if ticket is None:
+            markup = f"{prefix}#{ref.number}"
+        elif fmt == "wiki":
+            markup = f"{prefix}[{ticket.url} #{ticket.number} {ticket.title}]"
+        else:
+            markup = f"{prefix}[#{ticket.number} {ticket.title}]({ticket.url})"
+        return markup
+
+    def release_notes(
+        self,
+        commits: Iterable[Commit],
+        fmt: str = "markdown",
+        linked_only: bool = False,
+    ) -> Iterator[str]:
+        """Generate release note lines for the given commits as they are
+        produced.
+
+        Args:
+            commits (Iterable[Commit]): the commits e.g. of a date range
+            fmt (str): wiki or markdown
+            linked_only (bool): if True skip commits without ticket references
+
+        Yields:
+            str: one release note line per commit
+        """
+        for commit, refs in self.link(commits):
+            if linked_only and not refs:
+                continue
+            commit_url = f"{commit.host}/commit/{commit.hash}"
+            tickets = ", ".join(CommitLinker.ticket_markup(ref, fmt) for ref in refs)
+            suffix = f" - {tickets}" if tickets else ""
+            if fmt == "wiki":
+                line = f"* {commit.date.date()} [{commit_url} {commit.hash}] {commit.subject}{suffix}"
+            else:
+                line = f"- {commit.date.date()} [{commit.hash}]({commit_url}) {commit.subject}{suffix}"
+            yield line
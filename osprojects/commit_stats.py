@@ -0,0 +1,134 @@
+"""Created on 2026-10-19.
+
+@author: wf
+"""
+
+from collections import Counter
+from typing import Dict, Iterable, List, Set
+
+import numpy as np
+
+from osprojects.osproject import Commit
+
+
+class CommitStats:
+    """Single pass aggregation of commit statistics.
+
+    Counts commits per committer, per month and per project and collects the
+    active days. Commits are only buffered as date strings and names
+    per chunk - the bucketing of each chunk is vectorized with numpy so
+    that arbitrarily long commit streams can be aggregated without
+    holding the Commit objects in memory.
+    """
+
+    def __init__(self, chunk_size: int = 10000):
+        """Construct me.
+
+        Args:
+            chunk_size (int): the number of commits to buffer before bucketing
+        """
+        self.chunk_size = chunk_size
+        self.total = 0
+        self.by_committer = Counter()
+        self.by_month = Counter()
+        self.by_project = Counter()
+        self.active_days: Set[str] = set()
+        self.active_days_by_committer: Dict[str, Set[str]] = {}
+        self._days: List[str] = []
+        self._committers: List[str] = []
+        self._projects: List[str] = []
+
+    def add(self, commit: Commit):
+        """Add the given commit."""
+        self._days.append(str(commit.date.date()))
+        self._committers.append(commit.name)
+        self._projects.append(commit.project)
+        if len(self._days) >= self.chunk_size:
+            self.flush()
+
+    def add_all(self, commits: Iterable[Commit]) -> "CommitStats":
+        """Add all commits of the given iterable in one pass."""
+        for commit in commits:
+            self.add(commit)
+        self.flush()
+        return self
+
+    @staticmethod
+    def count(values: np.ndarray) -> Dict[str, int]:
+        """Count the occurrences of the given values."""
+        keys, counts = np.unique(values, return_counts=True)
+        counted = dict(zip(keys.astype(str).tolist(), counts.tolist()))
+        return counted
+
+    def flush(self):
+        """Bucket the buffered commits."""
+        if not self._days:
+            return
+        days = np.array(self._days, dtype="datetime64[D]")
+        committers = np.array(self._committers, dtype=str)
+        projects = np.array(self._projects, dtype=str)
+        self.total += len(days)
+        self.by_month.update(CommitStats.count(days.astype("datetime64[M]")))
+        self.by_committer.update(CommitStats.count(committers))
+        self.by_project.update(CommitStats.count(projects))
+        self.active_days.update(np.unique(days).astype(str).tolist())
+        # unit separator between committer and day to get the unique pairs
+        committer_days = np.unique(
+            np.char.add(np.char.add(committers, "\x1f"), days.astype(str))
+        )
+        for committer_day in committer_days.tolist():
+            committer, day = committer_day.split("\x1f")
+            self.active_days_by_committer.setdefault(committer, set()).add(day)
+        self._days, self._committers, self._projects = [], [], []
+
+    def merge(self, other: "CommitStats") -> "CommitStats":
+        """Merge the statistics of the other e.g. from another repository."""
+        self.flush()
+        other.flush()
+        self.total += other.total
+        self.by_committer.update(other.by_committer)
+        self.by_month.update(other.by_month)
+        self.by_project.update(other.by_project)
+        self.active_days.update(other.active_days)
+        for committer, days in other.active_days_by_committer.items():
+            self.active_days_by_committer.setdefault(committer, set()).update(days)
+        return self
+
+    @staticmethod
+    def longest_streak(days: Iterable[str]) -> int:
+        """Get the longest run of consecutive active days."""
+        streak = 0
+        if days:
+            ordinals = np.array(sorted(days), dtype="datetime64[D]").astype(np.int64)
+            # a new run starts wherever the gap to the previous day is not one
+            breaks = np.flatnonzero(np.diff(ordinals) != 1)
+            bounds = np.concatenate(([-1], breaks, [len(ordinals) - 1]))
+            streak = int(np.max(np.diff(bounds)))
+        return streak
+
+    def to_dict(self) -> dict:
+        """Get the statistics as a JSON compatible dict."""
+        self.flush()
+        active_day_count = len(self.active_days)
+        stats = {
+            "commits": self.total,
+            "active_days": active_day_count,
+            "commits_per_active_day": (
+                round(self.total / active_day_count, 2) if active_day_count else 0
+            ),
+            "longest_streak": CommitStats.longest_streak(self.active_days),
+            "first_day": min(self.active_days) if self.active_days else None,
+            "last_day": max(self.active_days) if self.active_days else None,
+            "by_month": dict(sorted(self.by_month.items())),
+            "by_project": dict(self.by_project.most_common()),
+            "by_committer": {
+                committer: {
+                    "commits": count,
+                    "active_days": len(
+                        self.active_days_by_committer.get(committer, ())
+                    ),
+                }
+                for committer, count in self.by_committer.most_common()
+            },
+        }
+        return stats
@@ -0,0 +1,180 @@
+"""Created on 2026-10-19.
+
+@author: wf
+"""
+
+import hashlib
+import mmap
+import os
+import stat
+import threading
+from typing import Dict, Optional, Tuple
+
+
+class FileEntry:
+    """Snapshot of a single path from one stat call with lazily read
+    content."""
+
+    __slots__ = (
+        "path",
+        "exists",
+        "is_file",
+        "is_dir",
+        "size",
+        "mtime_ns",
+        "too_large",
+        "mmap_threshold",
+        "_text",
+        "_content_hash",
+    )
+
+    def __init__(
+        self,
+        path: str,
+        st: Optional[os.stat_result],
+        max_size: int,
+        mmap_threshold: int,
+    ):
+        """Construct me.
+
+        Args:
+            path (str): the path
+            st (os.stat_result): the stat result - None if the path does not exist
+            max_size (int): files larger than this are not read
+            mmap_threshold (int): files of at least this size are memory-mapped
+        """
+        self.path = path
+        self.exists = st is not None
+        self.is_file = st is not None and stat.S_ISREG(st.st_mode)
+        self.is_dir = st is not None and stat.S_ISDIR(st.st_mode)
+        self.size = st.st_size if st is not None else 0
+        self.mtime_ns = st.st_mtime_ns if st is not None else 0
+        self.too_large = self.is_file and self.size > max_size
+        self.mmap_threshold = mmap_threshold
+        self._text = None
+        self._content_hash = None
+
+    @property
+    def key(self) -> Tuple[str, int, int]:
+        return (self.path, self.mtime_ns, self.size)
+
+    @property
+    def readable(self) -> bool:
+        """True if this is a file within the size cap."""
+        return self.is_file and not self.too_large
+
+    @staticmethod
+    def decode(data) -> str:
+        """Decode the given bytes or memory map as utf-8 without copying it to
+        an intermediate bytes object."""
+        text = str(data, "utf-8", "replace")
+        return text
+
+    def load(self, with_text: bool):
+        """Load the content hash and - if requested - the text.
+
+        Small files are read once for both. Large files are
+        memory-mapped - the hash and the text are computed directly
+        from the mapping so that only the decoded text is allocated.
+
+        Args:
+            with_text (bool): if True the text is needed
+        """
+        with open(self.path, "rb") as f:
+            if self.size >= self.mmap_threshold:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    if self._content_hash is None:
+                        self._content_hash = hashlib.sha1(data).hexdigest()
+                    if with_text and self._text is None:
+                        self._text = FileEntry.decode(data)
+            else:
+                data = f.read()
+                self._content_hash = hashlib.sha1(data).hexdigest()
+                self._text = FileEntry.decode(data)
+
+    @property
+    def text(self) -> Optional[str]:
+        """The utf-8 decoded content - None for directories, missing and
+        too large files."""
+        if self._text is None and self.readable:
+            self.load(with_text=True)
+        return self._text
+
+    @property
+    def content_hash(self) -> Optional[str]:
+        """The sha1 hex digest of the content - None if not readable."""
+        if self._content_hash is None and self.readable:
+            self.load(with_text=False)
+        return self._content_hash
+
+
+class FileSnapshot:
+    """Per run file snapshot service for the checks.
+
+    Each path is stat-ed once per run. The entries are kept across runs
+    and reused as long as mtime and size of the path are unchanged so
+    that contents are read and decoded at most once.
+    """
+
+    MAX_SIZE = 8 * 1024 * 1024
+    MMAP_THRESHOLD = 256 * 1024
+
+    instance = None
+    instance_lock = threading.Lock()
+
+    def __init__(self, max_size: int = MAX_SIZE, mmap_threshold: int = MMAP_THRESHOLD):
+        """Construct me.
+
+        Args:
+            max_size (int): files larger than this are not read
+            mmap_threshold (int): files of at least this size are memory-mapped
+        """
+        self.max_size = max_size
+        self.mmap_threshold = mmap_threshold
+        self.lock = threading.Lock()
+        # the entries stat-ed in the current run
+        self.run_entries: Dict[str, FileEntry] = {}
+        # the entries of all runs keyed by path
+        self.entries: Dict[str, FileEntry] = {}
+        self.stats = 0
+
+    @classmethod
+    def get_instance(cls) -> "FileSnapshot":
+        """Get the shared snapshot service."""
+        with cls.instance_lock:
+            if cls.instance is None:
+                cls.instance = cls()
+        return cls.instance
+
+    def new_run(self):
+        """Start a new run - paths are stat-ed again while unchanged
+        contents stay cached."""
+        with self.lock:
+            self.run_entries = {}
+
+    def get(self, path: str) -> FileEntry:
+        """Get the snapshot entry of the given path.
+
+        Args:
+            path (str): the path of the file or directory
+
+        Returns:
+            FileEntry: the entry - stat-ed once per run
+        """
+        with self.lock:
+            entry = self.run_entries.get(path)
+        if entry is None:
+            try:
+                st = os.stat(path)
+            except OSError:
+                st = None
+            entry = FileEntry(path, st, self.max_size, self.mmap_threshold)
+            with self.lock:
+                self.stats += 1
+                cached = self.entries.get(path)
+                if cached is not None and cached.exists and cached.key == entry.key:
+                    entry = cached
+                else:
+                    self.entries[path] = entry
+                self.run_entries[path] = entry
+        return entry
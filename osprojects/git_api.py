@@ -5,7 +5,7 @@
 
 import re
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 
 @dataclass
@@ -72,6 +72,12 @@ class GenericRepo:
             url = re.sub(r"\.git$", "", self.url)
         return url
 
+    def iterIssueRecords(self, limit: int = None, **params) -> Iterator[Dict]:
+        """Not implemented for generic repos."""
+        raise NotImplementedError(
+            f"iterIssueRecords is not supported for generic repo '{self.projectUrl()}'"
+        )
+
     def getIssueRecords(self, limit: int = None, **params) -> List[Dict]:
         """Not implemented for generic repos."""
         raise NotImplementedError(
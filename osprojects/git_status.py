@@ -0,0 +1,131 @@
+"""Created on 2026-10-19.
+
+@author: wf
+"""
+
+import os
+import subprocess
+from dataclasses import dataclass
+from typing import Optional
+
+from git.exc import GitCommandError, InvalidGitRepositoryError, NoSuchPathError
+
+
+@dataclass
+class GitStatus:
+    """Working tree status of a local git repository from a single git status
+    --porcelain=v2 call.
+
+    Compared to GitPython's Repo.is_dirty this needs one short lived git
+    process per repository, uses the untracked cache and a file system
+    monitor configured for the repository and gets the ahead/behind
+    counts of the upstream branch in the same pass.
+    """
+
+    folder: str
+    oid: Optional[str] = None
+    branch: Optional[str] = None
+    upstream: Optional[str] = None
+    ahead: int = 0
+    behind: int = 0
+    changed: int = 0
+
+    @property
+    def is_dirty(self) -> bool:
+        """True if the index or the working tree have changes - like
+        Repo.is_dirty() untracked files are not considered."""
+        return self.changed > 0
+
+    @property
+    def summary(self) -> str:
+        """Short summary of the branch state e.g. main ↑2 ↓0."""
+        summary = self.branch or "?"
+        if self.upstream:
+            summary += f" ↑{self.ahead} ↓{self.behind}"
+        return summary
+
+    @staticmethod
+    def git_cmd() -> list:
+        """Get the git status command line."""
+        # core.fsmonitor is not forced - it would leave a monitor daemon
+        # running for each checked repository - a configured one is used
+        git_cmd = ["git", "-c", "core.untrackedCache=true"]
+        git_cmd += [
+            "status",
+            "--porcelain=v2",
+            "-z",
+            "--branch",
+            "--untracked-files=no",
+        ]
+        return git_cmd
+
+    @classmethod
+    def parse(cls, folder: str, output: bytes) -> "GitStatus":
+        """Parse the given git status --porcelain=v2 -z --branch output.
+
+        Args:
+            folder (str): the folder of the repository
+            output (bytes): the NUL separated status entries
+
+        Returns:
+            GitStatus: the parsed status
+        """
+        status = cls(folder=folder)
+        entries = output.decode("utf-8", errors="replace").split("\0")
+        skip = False
+        for entry in entries:
+            if skip:
+                # the original path of a rename or copy entry
+                skip = False
+                continue
+            if not entry:
+                continue
+            if entry.startswith("# branch.oid "):
+                status.oid = entry[len("# branch.oid ") :]
+            elif entry.startswith("# branch.head "):
+                status.branch = entry[len("# branch.head ") :]
+            elif entry.startswith("# branch.upstream "):
+                status.upstream = entry[len("# branch.upstream ") :]
+            elif entry.startswith("# branch.ab "):
+                ahead, behind = entry[len("# branch.ab ") :].split()
+                status.ahead = int(ahead)
+                status.behind = abs(int(behind))
+            elif entry[0] in "12u":
+                status.changed += 1
+                skip = entry[0] == "2"
+        return status
+
+    @classmethod
+    def of_folder(cls, folder: str) -> "GitStatus":
+        """Get the status of the repository in the given folder.
+
+        Args:
+            folder (str): the working tree of the repository
+
+        Returns:
+            GitStatus: the status
+
+        Raises:
+            NoSuchPathError: if the folder does not exist
+            InvalidGitRepositoryError: if the folder is not a git repository
+            GitCommandError: if git status fails otherwise
+        """
+        if not os.path.isdir(folder):
+            raise NoSuchPathError(folder)
+        git_cmd = cls.git_cmd()
+        result = subprocess.run(
+            git_cmd,
+            cwd=folder,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            stdin=subprocess.DEVNULL,
+            # untranslated messages to detect invalid repositories
+            env=dict(os.environ, LC_ALL="C"),
+        )
+        if result.returncode != 0:
+            stderr = result.stderr.decode(errors="replace")
+            if "not a git repository" in stderr:
+                raise InvalidGitRepositoryError(folder)
+            raise GitCommandError(git_cmd, result.returncode, stderr)
+        status = cls.parse(folder, result.stdout)
+        return status
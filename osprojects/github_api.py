@@ -14,10 +14,13 @@ see https://docs.github.com/en/rest/using-the-rest-api/rate-limits-for-the-rest-
 import json
 import os
 import re
+import threading
 import time
+from collections import OrderedDict
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 from urllib.parse import urlparse
 
 import requests
@@ -35,12 +38,18 @@ class GitHubApi:
     """
 
     githubapi_instance: "GitHubApi" = None
+    # the instance and its rate limit state are shared by all threads
+    instance_lock = threading.Lock()
+    # the number of owners whose full repo records are kept - see full_repo_info
+    FULL_REPO_INDEX_OWNERS = 4
 
     @classmethod
     def get_instance(cls) -> "GitHubApi":
         """Singleton access."""
         if cls.githubapi_instance is None:
-            cls.githubapi_instance = cls()
+            with cls.instance_lock:
+                if cls.githubapi_instance is None:
+                    cls.githubapi_instance = cls()
         return cls.githubapi_instance
 
     def __init__(self):
@@ -57,6 +66,13 @@ class GitHubApi:
             {"Authorization": f"token {self.access_token}"} if self.access_token else {}
         )
         self.api_url = "https://api.github.com"
+        # the full repo records by name with the cache file stat of the
+        # most recently used owners
+        self.full_repo_index: OrderedDict[str, tuple] = OrderedDict()
+        self.full_repo_index_lock = threading.Lock()
+        # the share of the rate limits of this process - see share_rate_limits
+        self.core_limit = None
+        self.search_limit = None
 
     def get_cache_path(self, file_name: str):
         """Get the cache path for the given file_name."""
@@ -78,6 +94,18 @@ class GitHubApi:
         # Return None if no token file is found
         return token
 
+    def share_rate_limits(self, shares: int):
+        """Limit this process to its share of the rate limits of the access
+        token e.g. when the checks are sharded over several nodes.
+
+        Args:
+            shares (int): the number of processes sharing the rate limits
+        """
+        self.core_limit = limits(calls=max(1, 5000 // shares), period=3600)(
+            lambda: None
+        )
+        self.search_limit = limits(calls=max(1, 30 // shares), period=60)(lambda: None)
+
     @on_exception(expo, RateLimitException, max_tries=8)
     @limits(calls=5000, period=3600)
     def get_response(self, title: str, url: str, params={}, allow_redirects=True):
@@ -92,6 +120,8 @@ class GitHubApi:
         Returns:
             requests.Response: The response object
         """
+        if self.core_limit is not None:
+            self.core_limit()
         response = requests.get(
             url, headers=self.headers, params=params, allow_redirects=allow_redirects
         )
@@ -111,6 +141,75 @@ class GitHubApi:
             result = response
         return result
 
+    @on_exception(expo, RateLimitException, max_tries=8)
+    @limits(calls=30, period=60)
+    def get_search_response(self, title: str, url: str, params={}):
+        """Get a response from the GitHub search API which has its own lower
+        rate limit of 30 requests per minute."""
+        if self.search_limit is not None:
+            self.search_limit()
+        response = self.get_response(title, url, params)
+        return response
+
+    def search_issue_records(
+        self,
+        owner: str,
+        since: str,
+        org: bool = False,
+        state: Optional[str] = None,
+    ) -> Dict[str, List[dict]]:
+        """Search all issues and pull requests of the given owner updated
+        since the given date with one paginated search/issues query - as
+        the issues API of a single repository does.
+
+        The search API returns at most 1000 results per query so the results
+        are sorted by update time and the query is continued from the last
+        seen update time when the limit is reached.
+
+        Args:
+            owner (str): the user or organization
+            since (str): ISO date e.g. 2026-10-01 or 2026-10-01T00:00:00Z
+            org (bool): if True use the org: qualifier instead of user:
+            state (str): optional open or closed state filter
+
+        Returns:
+            Dict[str, List[dict]]: the raw issue records keyed by repository name
+        """
+        url = f"{self.api_url}/search/issues"
+        qualifier = "org" if org else "user"
+        state_query = f" state:{state}" if state in ["open", "closed"] else ""
+        records_by_repo: Dict[str, List[dict]] = {}
+        seen_ids = set()
+        while True:
+            params = {
+                "q": f"{qualifier}:{owner} updated:>={since}{state_query}",
+                "sort": "updated",
+                "order": "asc",
+                "per_page": 100,
+            }
+            last_updated = None
+            new_count = 0
+            # the search API only returns the first 1000 results
+            for page in range(1, 11):
+                params["page"] = page
+                response = self.get_search_response("search tickets", url, params)
+                items = response.json().get("items", [])
+                for item in items:
+                    last_updated = item.get("updated_at")
+                    if item["id"] in seen_ids:
+                        continue
+                    seen_ids.add(item["id"])
+                    new_count += 1
+                    repo_name = item["repository_url"].rsplit("/", 1)[-1]
+                    records_by_repo.setdefault(repo_name, []).append(item)
+                if len(items) < 100:
+                    break
+            if page < 10 or new_count == 0 or last_updated is None:
+                break
+            # continue from the last seen update time
+            since = last_updated
+        return records_by_repo
+
     def repos_for_owner(self, owner: str, cache_expiry: int = 300) -> list[dict]:
         """Retrieve all repositories for the given owner, using cache if
         available and valid, or via API otherwise.
@@ -169,6 +268,75 @@ class GitHubApi:
 
         return cache_file, cache_content, cache_age
 
+    def repo_infos_for_owner(
+        self, owner: str, cache_expiry: int = 300
+    ) -> list["RepoInfo"]:
+        """Retrieve the compact repository infos for the given owner.
+
+        The compact projection is selected when the cache is written, so
+        that loading the owner's repositories does not need to parse the
+        full GitHub API payload.
+
+        Args:
+            owner (str): The username of the owner whose repositories are being retrieved.
+            cache_expiry (int, optional): The cache expiry time in seconds.
+
+        Returns:
+            list[RepoInfo]: The compact repository infos.
+        """
+        compact_file = os.path.join(self.cache_dir, f"{owner}_repos_compact.json")
+        records = None
+        if os.path.exists(compact_file):
+            cache_age = time.time() - os.path.getmtime(compact_file)
+            if cache_age < cache_expiry:
+                with open(compact_file, "r") as f:
+                    records = json.load(f)
+        if records is None:
+            repos = self.repos_for_owner(owner, cache_expiry)
+            records = [RepoInfo.project(repo) for repo in repos]
+            with open(compact_file, "w") as f:
+                json.dump(records, f)
+        repo_infos = [RepoInfo.from_record(record) for record in records]
+        return repo_infos
+
+    def full_repo_info(self, owner: str, name: str) -> Optional[dict]:
+        """Get the full repository record for the given owner and name from the
+        cache.
+
+        The owner's cache file is parsed once and indexed by repository
+        name - it is only parsed again when the cache file changes. Only
+        the indexes of the FULL_REPO_INDEX_OWNERS most recently used owners
+        are kept so that fleet wide runs hold the compact RepoInfo
+        projections only.
+
+        Args:
+            owner (str): The owner of the repository.
+            name (str): The name of the repository.
+
+        Returns:
+            Optional[dict]: The full GitHub API record or None if not cached.
+        """
+        cache_file = os.path.join(self.cache_dir, f"{owner}_repos.json")
+        try:
+            st = os.stat(cache_file)
+            stat_key = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            stat_key = None
+        with self.full_repo_index_lock:
+            cached_key, index = self.full_repo_index.get(owner, (None, None))
+        if index is None or cached_key != stat_key:
+            _cache_file, cache_content, _cache_age = self.repos_for_owner_from_cache(
+                owner
+            )
+            index = {record.get("name"): record for record in cache_content or []}
+        with self.full_repo_index_lock:
+            self.full_repo_index[owner] = (stat_key, index)
+            self.full_repo_index.move_to_end(owner)
+            while len(self.full_repo_index) > GitHubApi.FULL_REPO_INDEX_OWNERS:
+                self.full_repo_index.popitem(last=False)
+        repo = index.get(name)
+        return repo
+
     def repos_for_owner_via_api(self, owner: str) -> list[dict]:
         """Retrieve all repositories for the given owner directly from the
         GitHub API.
@@ -201,6 +369,150 @@ class GitHubApi:
         return repos
 
 
+class RepoInfo(Mapping):
+    """Compact projection of a GitHub repository record.
+
+    Only the fields actually used by osprojects are kept - the full
+    ~100 field payload of the GitHub API is loaded lazily from the
+    owner's full cache file on demand via the full property.
+
+    RepoInfo is a read only Mapping - use dict(repo_info) or to_record
+    e.g. for JSON serialization.
+    """
+
+    # the fields projected from the GitHub API repo record
+    FIELDS = (
+        "name",
+        "fork",
+        "language",
+        "description",
+        "html_url",
+        "stargazers_count",
+        "forks_count",
+        "created_at",
+        "updated_at",
+    )
+
+    __slots__ = FIELDS + (
+        "owner_login",
+        "_created_at_dt",
+        "_updated_at_dt",
+        "_full",
+    )
+
+    def __init__(self, owner_login: str = None, **kwargs):
+        """Construct me from the given projected fields.
+
+        Args:
+            owner_login (str): The login of the repository owner.
+            **kwargs: Values for the projected FIELDS.
+        """
+        self.owner_login = owner_login
+        for key in RepoInfo.FIELDS:
+            setattr(self, key, kwargs.get(key))
+        self._created_at_dt = None
+        self._updated_at_dt = None
+        self._full = None
+
+    @classmethod
+    def project(cls, repo_record: dict) -> dict:
+        """Project a full GitHub API repo record to the compact record form.
+
+        Args:
+            repo_record (dict): The full repository record from the GitHub API.
+
+        Returns:
+            dict: The compact record with the selected FIELDS and the owner login.
+        """
+        record = {key: repo_record.get(key) for key in cls.FIELDS}
+        owner = repo_record.get("owner") or {}
+        record["owner_login"] = owner.get("login")
+        return record
+
+    @classmethod
+    def from_record(cls, record: dict) -> "RepoInfo":
+        """Create a RepoInfo from a full or compact record.
+
+        Args:
+            record (dict): A GitHub API repo record or its compact projection.
+
+        Returns:
+            RepoInfo: The compact repository info.
+        """
+        if "owner_login" not in record:
+            record = cls.project(record)
+        repo_info = cls(**record)
+        return repo_info
+
+    def to_record(self) -> dict:
+        """Return the compact record form of me e.g. for caching as JSON."""
+        record = {key: getattr(self, key) for key in RepoInfo.FIELDS}
+        record["owner_login"] = self.owner_login
+        return record
+
+    @staticmethod
+    def parse_date(iso_date: Optional[str]) -> Optional[datetime]:
+        """Parse a GitHub ISO date string to a naive datetime."""
+        date = datetime.fromisoformat(iso_date.rstrip("Z")) if iso_date else None
+        return date
+
+    @property
+    def created_at_dt(self) -> Optional[datetime]:
+        """The creation date - parsed once and cached."""
+        if self._created_at_dt is None and self.created_at:
+            self._created_at_dt = RepoInfo.parse_date(self.created_at)
+        return self._created_at_dt
+
+    @property
+    def updated_at_dt(self) -> Optional[datetime]:
+        """The update date - parsed once and cached."""
+        if self._updated_at_dt is None and self.updated_at:
+            self._updated_at_dt = RepoInfo.parse_date(self.updated_at)
+        return self._updated_at_dt
+
+    @property
+    def full(self) -> Optional[dict]:
+        """The full GitHub API record - lazily loaded from the owner's
+        cache."""
+        if self._full is None and self.owner_login:
+            github = GitHubApi.get_instance()
+            self._full = github.full_repo_info(self.owner_login, self.name)
+        return self._full
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict like access to the projected fields with fallback to the full
+        record for fields that have not been projected."""
+        if key == "owner":
+            value = {"login": self.owner_login}
+        elif key in RepoInfo.FIELDS:
+            value = getattr(self, key)
+        else:
+            full = self.full
+            value = full.get(key) if full else None
+        if value is None:
+            value = default
+        return value
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in RepoInfo.FIELDS and key != "owner":
+            full = self.full
+            if not full or key not in full:
+                raise KeyError(key)
+        return self.get(key)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate the keys - the projected ones and those of the full
+        record if available."""
+        keys = list(RepoInfo.FIELDS) + ["owner"]
+        full = self.full
+        if full:
+            keys.extend(key for key in full if key not in keys)
+        return iter(keys)
+
+    def __len__(self) -> int:
+        return sum(1 for _key in self)
+
+
 @dataclass
 class GitHubRepo(GenericRepo):
     """Represents a GitHub Repository.
@@ -240,8 +552,24 @@ class GitHubRepo(GenericRepo):
     def projectUrl(self) -> str:
         return f"https://github.com/{self.owner}/{self.project_id}"
 
-    def getIssueRecords(self, limit: int = None, **params) -> List[Dict]:
-        all_issues_records = []
+    def getIssueRecord(self, issue_number: int) -> Dict:
+        """Fetch the record of a single issue."""
+        response = self.github.get_response(
+            "fetch ticket", f"{self.ticketUrl()}/{issue_number}"
+        )
+        record = response.json()
+        return record
+
+    def iterIssueRecords(self, limit: int = None, **params) -> Iterator[Dict]:
+        """Iterate over the issue records page by page as they are fetched.
+
+        Args:
+            limit (int): if set, limit the number of pages fetched
+            **params: additional query parameters e.g. state
+
+        Yields:
+            Dict: the raw GitHub API issue records
+        """
         nextResults = True
         params["per_page"] = 100
         params["page"] = 1
@@ -251,7 +579,7 @@ class GitHubRepo(GenericRepo):
                 "fetch tickets", self.ticketUrl(), params
             )
             issue_records = json.loads(response.text)
-            all_issues_records.extend(issue_records)
+            yield from issue_records
             fetched_count += 1
             # Check if we have reached the limit
             if limit is not None and fetched_count >= limit:
@@ -262,6 +590,9 @@ class GitHubRepo(GenericRepo):
                 nextResults = False
             else:
                 params["page"] += 1
+
+    def getIssueRecords(self, limit: int = None, **params) -> List[Dict]:
+        all_issues_records = list(self.iterIssueRecords(limit=limit, **params))
         return all_issues_records
 
 
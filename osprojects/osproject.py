@@ -11,20 +11,77 @@ import logging
 import os
 import subprocess
 import sys
-from typing import Dict, Iterable, List, Optional, Set, Tuple
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from basemkit.base_cmd import BaseCmd
 from dateutil.parser import parse
 from tqdm import tqdm
 
 from osprojects.git_api import GenericRepo
-from osprojects.github_api import GitHubApi, GitHubRepo
+from osprojects.github_api import GitHubApi, GitHubRepo, RepoInfo
 from osprojects.gitlab_api import GitLabRepo
+from osprojects.record_writer import RecordWriter
+from osprojects.timing import Timing, profiled
 
 
 class Ticket(object):
     """A Ticket."""
 
+    __slots__ = (
+        "number",
+        "title",
+        "project",
+        "createdAt",
+        "closedAt",
+        "state",
+        "url",
+        "_body",
+        "_body_loader",
+    )
+
+    def __init__(
+        self,
+        number: int = None,
+        title: str = None,
+        project: str = None,
+        createdAt: datetime.datetime = None,
+        closedAt: datetime.datetime = None,
+        state: str = None,
+        url: str = None,
+        body: str = None,
+        body_loader: Callable[[int], str] = None,
+    ):
+        """Construct me.
+
+        Args:
+            body (str): the ticket body - if None and a body_loader is given
+                the body is loaded lazily on first access
+            body_loader (Callable[[int], str]): loader for the body by ticket number
+        """
+        self.number = number
+        self.title = title
+        self.project = project
+        self.createdAt = createdAt
+        self.closedAt = closedAt
+        self.state = state
+        self.url = url
+        self._body = body
+        self._body_loader = body_loader
+
+    @property
+    def body(self) -> Optional[str]:
+        """The ticket body - lazily loaded if a body_loader is available."""
+        if self._body is None and self._body_loader is not None:
+            self._body = self._body_loader(self.number)
+            self._body_loader = None
+        return self._body
+
+    @body.setter
+    def body(self, body: Optional[str]):
+        self._body = body
+
     @staticmethod
     def getSamples():
         samples = [
@@ -52,6 +109,97 @@ class Ticket(object):
             setattr(issue, k, v)
         return issue
 
+    @staticmethod
+    def parse_date(iso_date: Optional[str]):
+        """Parse the given ISO-8601 date string of the GitHub API.
+
+        Uses the fast datetime.fromisoformat path and only falls back
+        to dateutil for non standard formats.
+
+        Args:
+            iso_date (str): the date string e.g. 2022-01-24T07:41:29Z
+
+        Returns:
+            the timezone aware datetime or "" if no date is given
+        """
+        date = ""
+        if iso_date:
+            try:
+                date = datetime.datetime.fromisoformat(iso_date.replace("Z", "+00:00"))
+            except ValueError:
+                date = parse(iso_date)
+        return date
+
+    @classmethod
+    def iter_from_records(
+        cls,
+        records: Iterable[dict],
+        project: str,
+        project_url: str,
+        with_body: bool = True,
+        body_loader: Callable[[int], str] = None,
+        limit: int = None,
+    ) -> Iterator["Ticket"]:
+        """Construct Tickets from GitHub API issue records one by one.
+
+        Args:
+            records (Iterable[dict]): the raw GitHub API issue records
+            project (str): the project id
+            project_url (str): the browsable url of the project
+            with_body (bool): if False the bodies are not kept in memory
+            body_loader (Callable[[int], str]): optional loader to lazily
+                get the body on access if with_body is False
+            limit (int): if set, limit the number of tickets
+
+        Yields:
+            Ticket: the tickets
+        """
+        parse_date = cls.parse_date
+        count = 0
+        for record in records:
+            number = record.get("number")
+            ticket = cls(
+                number=number,
+                title=record.get("title"),
+                project=project,
+                createdAt=parse_date(record.get("created_at")),
+                closedAt=parse_date(record.get("closed_at")),
+                state=record.get("state"),
+                url=f"{project_url}/issues/{number}",
+                body=(record.get("body") or "") if with_body else None,
+                body_loader=None if with_body else body_loader,
+            )
+            yield ticket
+            count += 1
+            if limit is not None and count >= limit:
+                break
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[dict],
+        project: str,
+        project_url: str,
+        with_body: bool = True,
+        body_loader: Callable[[int], str] = None,
+        limit: int = None,
+    ) -> List["Ticket"]:
+        """Batch construct Tickets from GitHub API issue records - see
+        iter_from_records for the arguments."""
+        tickets = list(
+            cls.iter_from_records(
+                records, project, project_url, with_body, body_loader, limit
+            )
+        )
+        return tickets
+
+    def to_record(self) -> dict:
+        """Return me in the getSamples() record form."""
+        record = {
+            key: getattr(self, key, None) for key in Ticket.getSamples()[0].keys()
+        }
+        return record
+
     def toWikiMarkup(self) -> str:
         """Returns Ticket in wiki markup."""
         return f"""# {{{{Ticket
@@ -63,6 +211,11 @@ class Ticket(object):
 |state={self.state}
 }}}}"""
 
+    def toMarkdown(self) -> str:
+        """Returns Ticket as a markdown list item."""
+        markdown = f"- [#{self.number}]({self.url}) {self.title} ({self.state})"
+        return markdown
+
 
 class Commit(object):
     """A commit."""
@@ -90,6 +243,28 @@ class Commit(object):
         markup = f"{{{{commit|{'|'.join(params)}|storemode=subobject|viewmode=line}}}}"
         return markup
 
+    @classmethod
+    def from_record(cls, record: dict) -> "Commit":
+        """Create a Commit from its record form e.g. as cached as JSON."""
+        commit = cls()
+        for key, value in record.items():
+            if key == "date" and isinstance(value, str):
+                value = datetime.datetime.fromisoformat(value)
+            setattr(commit, key, value)
+        return commit
+
+    def toMarkdown(self) -> str:
+        """Returns Commit as a markdown list item."""
+        markdown = f"- {self.date} [{self.hash}]({self.host}/commit/{self.hash}) {self.subject} ({self.name})"
+        return markdown
+
+    def to_record(self) -> dict:
+        """Return me in the getSamples() record form."""
+        record = {
+            key: getattr(self, key, None) for key in Commit.getSamples()[0].keys()
+        }
+        return record
+
 
 class OsProjects:
     """A set of open source projects."""
@@ -182,13 +357,33 @@ class OsProjects:
         self.selected_projects = filtered_projects
         return self.selected_projects
 
+    def project_table(self, selected: bool = True) -> "ProjectTable":
+        """Get a columnar view of my projects for fast sorting and aggregation.
+
+        Args:
+            selected (bool): If True only the selected projects are included.
+
+        Returns:
+            ProjectTable: The columnar project table.
+        """
+        from osprojects.project_table import ProjectTable
+
+        projects = (
+            self.selected_projects.values()
+            if selected
+            else self.projects_by_url.values()
+        )
+        table = ProjectTable.from_projects(projects)
+        return table
+
     def add_projects_of_owner(self, owner: str, cache_expiry: int = 300):
         """Add the projects of the given owner."""
         if not owner in self.projects:
             self.projects[owner] = {}
-            repo_infos = self.github.repos_for_owner(owner, cache_expiry)
+            with Timing.get_instance().span("owner fetch", "remote", owner=owner):
+                repo_infos = self.github.repo_infos_for_owner(owner, cache_expiry)
             for repo_info in repo_infos:
-                project_id = repo_info["name"]
+                project_id = repo_info.name
                 os_project = OsProject(owner=owner, project_id=project_id)
                 os_project.repo_info = repo_info
                 self.projects[owner][project_id] = os_project
@@ -197,6 +392,89 @@ class OsProjects:
             # owner already known
             pass
 
+    @classmethod
+    def iter_tickets(
+        cls,
+        os_projects: Iterable["OsProject"],
+        jobs: int = 4,
+        failed: Optional[List["OsProject"]] = None,
+        **params,
+    ) -> Iterator[Tuple["OsProject", List[Ticket]]]:
+        """Fetch the tickets of the given projects concurrently.
+
+        The requests are run on a bounded thread pool sharing the rate limit
+        state of the GitHubApi singleton. Results are yielded in the order of
+        the given projects so that the output is deterministic.
+
+        Args:
+            os_projects (Iterable[OsProject]): the projects to fetch the tickets for
+            jobs (int): the maximum number of concurrent fetches
+            failed (List[OsProject]): if given the projects whose tickets could
+                not be fetched are appended - they are yielded without tickets
+            **params: query parameters for getIssues e.g. state
+
+        Yields:
+            Tuple[OsProject, List[Ticket]]: each project with its tickets
+        """
+        params.setdefault("with_body", False)
+
+        def get_result(os_project, future) -> List[Ticket]:
+            tickets = []
+            try:
+                tickets = future.result()
+            except Exception as ex:
+                logging.error(f"fetching tickets of {os_project} failed: {ex}")
+                if failed is not None:
+                    failed.append(os_project)
+            return tickets
+
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            for os_project in os_projects:
+                future = executor.submit(os_project.getIssues, **params)
+                pending.append((os_project, future))
+                # bound the number of results held in memory
+                if len(pending) >= 2 * jobs:
+                    os_project, future = pending.popleft()
+                    yield os_project, get_result(os_project, future)
+            while pending:
+                os_project, future = pending.popleft()
+                yield os_project, get_result(os_project, future)
+
+    def tickets_of_owner_since(
+        self, owner: str, since: str, org: bool = False, **params
+    ) -> Dict[str, List[Ticket]]:
+        """Get the tickets of all projects of the given owner that changed
+        since the given date with a single paginated issue search.
+
+        Args:
+            owner (str): the user or organization
+            since (str): ISO date e.g. 2026-10-01
+            org (bool): if True the owner is an organization
+            **params: e.g. state and with_body
+
+        Returns:
+            Dict[str, List[Ticket]]: the changed tickets keyed by project id
+                sorted by project id
+        """
+        with_body = params.get("with_body", False)
+        records_by_repo = self.github.search_issue_records(
+            owner, since, org=org, state=params.get("state")
+        )
+        tickets_by_project = {}
+        for project_id in sorted(records_by_repo.keys()):
+            os_project = OsProject(owner=owner, project_id=project_id)
+            tickets = Ticket.from_records(
+                records_by_repo[project_id],
+                project=project_id,
+                project_url=os_project.projectUrl(),
+                with_body=with_body,
+                body_loader=os_project.getIssueBody,
+            )
+            tickets.sort(key=lambda ticket: ticket.number, reverse=True)
+            tickets_by_project[project_id] = tickets
+        return tickets_by_project
+
     @classmethod
     def from_owners(cls, owners: list[str]):
         osp = cls()
@@ -247,7 +525,9 @@ class OsProjects:
             OsProjects: An instance of OsProjects with collected projects.
         """
         osp = cls()
-        owners, repos_by_folder = cls.github_repos_of_folder(folder_path)
+        # the remote owner fetches are timed separately
+        with Timing.get_instance().span("workspace scan"):
+            owners, repos_by_folder = cls.github_repos_of_folder(folder_path)
 
         # Optimization: If a specific project_id is requested, only fetch data for relevant owners
         if project_id:
@@ -327,7 +607,7 @@ class OsProject:
     """A GitHub based opens source project."""
 
     def __init__(self, owner: str = None, project_id: str = None):
-        self.repo_info = None  # might be fetched
+        self.repo_info: Optional[RepoInfo] = None  # might be fetched
         self.folder = None  # set for local projects
         if owner and project_id:
             url = f"https://github.com/{owner}/{project_id}"
@@ -350,6 +630,49 @@ class OsProject:
             os_project.repo = GenericRepo.from_url(url)
         return os_project
 
+    @classmethod
+    def fromSpec(cls, spec: str, owner: str = None) -> "OsProject":
+        """Init OsProject from the given project specification.
+
+        Args:
+            spec (str): a project url, owner/project or a plain project name
+            owner (str): the owner to use for plain project names
+
+        Returns:
+            OsProject: the project
+        """
+        spec = spec.strip()
+        if "://" in spec or spec.startswith("git@"):
+            os_project = cls.fromUrl(spec)
+        elif "/" in spec:
+            spec_owner, project_id = spec.split("/", 1)
+            os_project = cls(owner=spec_owner, project_id=project_id)
+        elif owner:
+            os_project = cls(owner=owner, project_id=spec)
+        else:
+            raise ValueError(f"owner needed for project {spec}")
+        return os_project
+
+    @classmethod
+    def fromFolder(cls, folder: str) -> Optional["OsProject"]:
+        """Init OsProject from the git repository in the given folder.
+
+        Args:
+            folder (str): the folder of the local clone
+
+        Returns:
+            Optional[OsProject]: the project or None if the folder has no origin remote
+        """
+        os_project = None
+        url = OsProjects.get_project_url_from_git_config(folder)
+        if url:
+            os_project = cls.fromUrl(url)
+            if os_project.repo is None:
+                os_project = None
+            else:
+                os_project.folder = folder
+        return os_project
+
     @classmethod
     def fromRepo(cls):
         """Init OsProject from repo in current working directory."""
@@ -363,34 +686,44 @@ class OsProject:
         except subprocess.CalledProcessError:
             return None
 
-    def getIssues(self, limit: int = None, **params) -> List[Ticket]:
-        # Fetch the raw issue records using the new getIssueRecords method
-        issue_records = self.repo.getIssueRecords(limit=limit, **params)
-
-        issues = []
-        for record in issue_records:
-            tr = {
-                "project": self.repo.project_id,
-                "title": record.get("title"),
-                "body": record.get("body", ""),
-                "createdAt": (
-                    parse(record.get("created_at")) if record.get("created_at") else ""
-                ),
-                "closedAt": (
-                    parse(record.get("closed_at")) if record.get("closed_at") else ""
-                ),
-                "state": record.get("state"),
-                "number": record.get("number"),
-                "url": f"{self.projectUrl()}/issues/{record.get('number')}",
-            }
-            issues.append(Ticket.init_from_dict(**tr))
+    def getIssues(
+        self, limit: int = None, with_body: bool = True, **params
+    ) -> List[Ticket]:
+        """Get the issues of this project as Tickets.
 
-            # Check if we have reached the limit
-            if limit is not None and len(issues) >= limit:
-                break
+        Args:
+            limit (int): if set, limit the number of tickets retrieved
+            with_body (bool): if False the bodies are dropped and
+                lazily fetched on access
+            **params: additional query parameters e.g. state
 
+        Returns:
+            List[Ticket]: the tickets
+        """
+        issues = list(self.iterIssues(limit=limit, with_body=with_body, **params))
         return issues
 
+    def iterIssues(
+        self, limit: int = None, with_body: bool = True, **params
+    ) -> Iterator[Ticket]:
+        """Iterate over the issues of this project as they are fetched - see
+        getIssues for the arguments."""
+        issue_records = self.repo.iterIssueRecords(limit=limit, **params)
+        yield from Ticket.iter_from_records(
+            issue_records,
+            project=self.repo.project_id,
+            project_url=self.projectUrl(),
+            with_body=with_body,
+            body_loader=self.getIssueBody,
+            limit=limit,
+        )
+
+    def getIssueBody(self, issue_number: int) -> str:
+        """Fetch the body of the given issue."""
+        record = self.repo.getIssueRecord(issue_number)
+        body = record.get("body") or ""
+        return body
+
     def getAllTickets(
         self, limit: int = None, with_sort: bool = True
     ) -> Dict[int, Ticket]:
@@ -461,21 +794,11 @@ class OsProject:
 
     @property
     def created_at(self):
-        created_at = self.repo_info.get("created_at")
-        return (
-            datetime.datetime.fromisoformat(created_at.rstrip("Z"))
-            if created_at
-            else None
-        )
+        return self.repo_info.created_at_dt
 
     @property
     def updated_at(self):
-        updated_at = self.repo_info.get("updated_at")
-        return (
-            datetime.datetime.fromisoformat(updated_at.rstrip("Z"))
-            if updated_at
-            else None
-        )
+        return self.repo_info.updated_at_dt
 
     @property
     def stars(self):
@@ -510,35 +833,221 @@ class OsProject:
         ]
         return samples
 
-    def getCommits(self) -> List[Commit]:
-        commits = []
-        # Use delimiter to separate fields to avoid JSON escaping issues with commit subjects
-        delimiter = "|||"
+    def to_record(self) -> dict:
+        """Return me in the getSamples() record form."""
+        record = {key: getattr(self, key) for key in OsProject.getSamples()[0].keys()}
+        return record
+
+    def getCommits(self, **filters) -> List[Commit]:
+        """Get the commits matching the given filters in chronological
+        order."""
+        commits = list(self.iterCommits(**filters))
+        commits.reverse()
+        return commits
+
+    def selectCommits(
+        self,
+        date_prefix: Optional[str] = None,
+        committer: Optional[str] = None,
+        paths: Optional[List[str]] = None,
+        use_cache: bool = False,
+    ) -> Iterable[Commit]:
+        """Select the commits matching the given filters.
+
+        Args:
+            date_prefix (str): e.g. 2026, 2026-03 or 2026-03-28
+            committer (str): only commits whose committer matches the given pattern
+            paths (List[str]): only commits touching the given paths
+            use_cache (bool): if True use the CommitCache - only for
+                date prefix filtering which is done on the cached commits -
+                the cache is skipped with a warning for committer and path filters
+
+        Returns:
+            Iterable[Commit]: the matching commits newest first
+        """
+        if use_cache and (committer or paths):
+            logging.warning(
+                f"{self}: commit cache skipped - it does not support committer and path filters"
+            )
+            use_cache = False
+        if use_cache:
+            from osprojects.commit_cache import CommitCache
+
+            commits = reversed(CommitCache(self).getCommits())
+            if date_prefix:
+                commits = (
+                    c for c in commits if str(c.date.date()).startswith(date_prefix)
+                )
+        else:
+            commits = self.iterCommitsByDatePrefix(
+                date_prefix, committer=committer, paths=paths
+            )
+        return commits
+
+    def iterCommitsByDatePrefix(
+        self, date_prefix: Optional[str] = None, **filters
+    ) -> Iterator[Commit]:
+        """Iterate over the commits whose local date starts with the given
+        prefix.
+
+        The prefix is translated to a --since/--until range for git which is
+        widened by a day to cover all timezones - the exact prefix check is
+        then only done on the commits of that range.
+
+        Args:
+            date_prefix (str): e.g. 2026, 2026-03 or 2026-03-28
+            **filters: further filters for iterCommits e.g. committer and paths
+
+        Yields:
+            Commit: the matching commits newest first
+        """
+        if date_prefix:
+            date_range = OsProject.datePrefixRange(date_prefix)
+            if date_range:
+                one_day = datetime.timedelta(days=1)
+                filters["since"] = date_range[0] - one_day
+                filters["until"] = date_range[1] + one_day
+        commits = self.iterCommits(**filters)
+        if date_prefix:
+            commits = (c for c in commits if str(c.date.date()).startswith(date_prefix))
+        yield from commits
+
+    @staticmethod
+    def datePrefixRange(
+        date_prefix: str,
+    ) -> Optional[Tuple[datetime.datetime, datetime.datetime]]:
+        """Get the date range covered by the given date prefix.
+
+        Args:
+            date_prefix (str): e.g. 2026, 2026-03 or 2026-03-28
+
+        Returns:
+            Optional[Tuple[datetime, datetime]]: the start (inclusive) and
+                end (exclusive) of the range or None if the prefix is not a
+                year, month or day
+        """
+        date_range = None
+        parts = date_prefix.split("-")
+        try:
+            if len(parts) == 1 and len(parts[0]) == 4:
+                year = int(parts[0])
+                date_range = (
+                    datetime.datetime(year, 1, 1),
+                    datetime.datetime(year + 1, 1, 1),
+                )
+            elif len(parts) == 2 and len(parts[1]) == 2:
+                year, month = int(parts[0]), int(parts[1])
+                start = datetime.datetime(year, month, 1)
+                end = (start + datetime.timedelta(days=32)).replace(day=1)
+                date_range = (start, end)
+            elif len(parts) == 3 and len(parts[2]) == 2:
+                start = datetime.datetime.fromisoformat(date_prefix)
+                date_range = (start, start + datetime.timedelta(days=1))
+        except ValueError:
+            date_range = None
+        return date_range
+
+    def iterCommits(
+        self,
+        since: Optional[datetime.datetime] = None,
+        until: Optional[datetime.datetime] = None,
+        committer: Optional[str] = None,
+        paths: Optional[List[str]] = None,
+        revisions: Optional[str] = None,
+    ) -> Iterator[Commit]:
+        """Iterate over the commits of the local repository lazily.
+
+        The git log is read as a stream of NUL separated fields so that
+        subjects may contain any delimiter and the history is never held
+        in memory as a whole. The given filters are pushed down into git.
+        The commits are kept in the native order of git - with --reverse
+        git would have to walk the whole history before the first commit.
+
+        Args:
+            since (datetime): only commits at or after the given time
+            until (datetime): only commits before the given time
+            committer (str): only commits whose committer matches the given pattern
+            paths (List[str]): only commits touching the given paths
+            revisions (str): optional revision range e.g. abc1234..HEAD
+
+        Yields:
+            Commit: the commits newest first
+        """
+        # %x00 separates the fields and -z the records - so every
+        # group of four fields is one commit
         gitlogCmd = [
             "git",
             "--no-pager",
             "log",
-            "--reverse",
-            f"--pretty=format:%cn{delimiter}%cI{delimiter}%h{delimiter}%s",
+            "-z",
+            "--pretty=format:%cn%x00%cI%x00%h%x00%s",
         ]
-        rawCommitLogs = subprocess.check_output(gitlogCmd).decode()
-        for rawLog in rawCommitLogs.split("\n"):
-            if not rawLog.strip():
-                continue
-            parts = rawLog.split(delimiter)
-            if len(parts) != 4:
-                continue
-            name, date_str, hash_val, subject = parts
-            commit = Commit()
-            commit.name = name
-            commit.date = datetime.datetime.fromisoformat(date_str)
-            commit.hash = hash_val
-            commit.subject = subject
-            commit.project = self.project_id
-            commit.host = self.projectUrl()
-            commit.path = ""
-            commits.append(commit)
-        return commits
+        if since:
+            gitlogCmd.append(f"--since={since.isoformat()}")
+        if until:
+            gitlogCmd.append(f"--until={until.isoformat()}")
+        if committer:
+            gitlogCmd.append(f"--committer={committer}")
+        if revisions:
+            gitlogCmd.append(revisions)
+        if paths:
+            gitlogCmd.extend(["--", *paths])
+        host = self.projectUrl()
+        fields = []
+        for field in OsProject.iterGitFields(gitlogCmd, cwd=self.folder):
+            fields.append(field)
+            if len(fields) == 4:
+                name, date_str, hash_val, subject = fields
+                fields = []
+                commit = Commit()
+                commit.name = name
+                commit.date = datetime.datetime.fromisoformat(date_str)
+                commit.hash = hash_val
+                commit.subject = subject
+                commit.project = self.project_id
+                commit.host = host
+                commit.path = ""
+                yield commit
+
+    @staticmethod
+    def iterGitFields(
+        gitCmd: List[str], cwd: Optional[str] = None, chunk_size: int = 65536
+    ) -> Iterator[str]:
+        """Run the given git command and yield its NUL separated output fields
+        as they arrive.
+
+        Args:
+            gitCmd (List[str]): the git command to run
+            cwd (str): the working directory - defaults to the current one
+            chunk_size (int): the maximum number of bytes to read at once
+
+        Yields:
+            str: the decoded fields
+
+        Raises:
+            subprocess.CalledProcessError: if git fails
+        """
+        process = subprocess.Popen(gitCmd, stdout=subprocess.PIPE, cwd=cwd)
+        try:
+            buffer = b""
+            while True:
+                chunk = process.stdout.read1(chunk_size)
+                if not chunk:
+                    break
+                buffer += chunk
+                *fields, buffer = buffer.split(b"\0")
+                for field in fields:
+                    yield field.decode(errors="replace")
+            if buffer:
+                yield buffer.decode(errors="replace")
+        finally:
+            process.stdout.close()
+            if process.poll() is None:
+                # the consumer stopped early
+                process.terminate()
+            returncode = process.wait()
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, gitCmd)
 
 
 class GitLog2WikiCmd(BaseCmd):
@@ -556,6 +1065,67 @@ class GitLog2WikiCmd(BaseCmd):
             help="Filter commits by date prefix, e.g. 2026, 2026-03, 2026-03-28",
             default=None,
         )
+        parser.add_argument(
+            "--committer",
+            help="Filter commits by the committer shown for each commit (git --committer pattern)",
+            default=None,
+        )
+        parser.add_argument(
+            "--path",
+            nargs="+",
+            help="Filter commits touching the given path(s)",
+            default=None,
+        )
+        parser.add_argument(
+            "--cache",
+            action="store_true",
+            help="use the per repository commit cache - only new commits since the last call are parsed - not used with --committer or --path",
+        )
+        parser.add_argument(
+            "--profile",
+            help="write cProfile/pstats output to the given file and print the top functions",
+        )
+        output = parser.add_mutually_exclusive_group()
+        output.add_argument(
+            "--release-notes",
+            action="store_true",
+            help="output release notes with the commits linked to the tickets they reference (wiki or markdown format, not with --workspace)",
+        )
+        output.add_argument(
+            "--stats",
+            action="store_true",
+            help="output per committer, month and project commit statistics as JSON instead of the commits",
+        )
+        parser.add_argument(
+            "--reverse",
+            action="store_true",
+            help="output the commits in chronological order instead of newest first - all commits are read before the first one is output",
+        )
+        parser.add_argument(
+            "-ws",
+            "--workspace",
+            help="collect the commits of all repositories in the given workspace directory",
+            default=None,
+        )
+        parser.add_argument(
+            "--order",
+            choices=["time", "project"],
+            default="time",
+            help="output order of the workspace commits [default: %(default)s]",
+        )
+        parser.add_argument(
+            "-j",
+            "--jobs",
+            type=int,
+            default=None,
+            help="number of worker processes for --workspace [default: number of cpus]",
+        )
+        parser.add_argument(
+            "--format",
+            choices=RecordWriter.FORMATS,
+            default="wiki",
+            help="output format [default: %(default)s]",
+        )
 
     def handle_args(self, args):
         """Handle parsed arguments and run the command.
@@ -570,6 +1140,60 @@ class GitLog2WikiCmd(BaseCmd):
         result = False
         if handled:
             result = True
+        else:
+            self.check_args(args)
+            with profiled(args.profile):
+                result = self.show_log(args)
+        return result
+
+    def check_args(self, args):
+        """Reject option combinations that would be silently ignored.
+
+        Args:
+            args: Parsed argument namespace.
+        """
+        if args.release_notes:
+            if args.workspace:
+                self.parser.error("--release-notes is not supported with --workspace")
+            if args.format not in ("wiki", "markdown"):
+                self.parser.error(
+                    f"--release-notes supports the wiki and markdown format only not {args.format}"
+                )
+
+    def show_log(self, args) -> bool:
+        """Show the git log as selected by the given arguments.
+
+        Args:
+            args: Parsed argument namespace.
+
+        Returns:
+            bool: True if the log could be shown.
+        """
+        if args.workspace:
+            from osprojects.workspace_log import WorkspaceLog
+
+            workspace_log = WorkspaceLog(args.workspace, jobs=args.jobs)
+            if args.stats:
+                stats = workspace_log.stats(
+                    date_prefix=args.filter,
+                    committer=args.committer,
+                    paths=args.path,
+                    use_cache=args.cache,
+                )
+                print(json.dumps(stats.to_dict(), indent=2))
+            else:
+                commits = workspace_log.iterCommits(
+                    order=args.order,
+                    date_prefix=args.filter,
+                    committer=args.committer,
+                    paths=args.path,
+                    use_cache=args.cache,
+                )
+                if args.reverse:
+                    commits = reversed(list(commits))
+                writer = RecordWriter.create(args.format)
+                writer.write_all(commits)
+            result = True
         else:
             osProject = OsProject.fromRepo()
             if osProject is None or osProject.repo is None:
@@ -589,13 +1213,32 @@ class GitLog2WikiCmd(BaseCmd):
                     )
                 result = False
             else:
-                commits = osProject.getCommits()
-                if args.filter:
-                    date_filter = args.filter
-                    commits = [
-                        c for c in commits if str(c.date.date()).startswith(date_filter)
-                    ]
-                print("\n".join([c.toWikiMarkup() for c in commits]))
+                commits = osProject.selectCommits(
+                    args.filter,
+                    committer=args.committer,
+                    paths=args.path,
+                    use_cache=args.cache,
+                )
+                if args.reverse:
+                    commits = reversed(list(commits))
+                if args.stats:
+                    from osprojects.commit_stats import CommitStats
+
+                    stats = CommitStats().add_all(commits)
+                    print(json.dumps(stats.to_dict(), indent=2))
+                elif args.release_notes:
+                    from osprojects.commit_linker import CommitLinker
+
+                    linker = CommitLinker(
+                        osProject.getAllTickets(),
+                        owner=osProject.owner,
+                        project_id=osProject.project_id,
+                    )
+                    for line in linker.release_notes(commits, fmt=args.format):
+                        print(line, flush=True)
+                else:
+                    writer = RecordWriter.create(args.format)
+                    writer.write_all(commits)
                 result = True
         return result
 
@@ -614,12 +1257,29 @@ def main(_argv=None):
     """Main command line entry point."""
     parser = argparse.ArgumentParser(description="Issue2ticket")
     parser.add_argument("-o", "--owner", help="project owner")
-    parser.add_argument("-p", "--project", help="name of the project")
+    parser.add_argument(
+        "-p",
+        "--project",
+        nargs="+",
+        help="name(s) of the project(s) - all projects of the owner if omitted",
+    )
     parser.add_argument(
         "--repo",
         action="store_true",
         help="get needed information form repository of current location",
     )
+    parser.add_argument(
+        "--stdin",
+        action="store_true",
+        help="read owner/project or project url lines from stdin",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=4,
+        help="number of projects to fetch concurrently [default: %(default)s]",
+    )
     parser.add_argument(
         "-s",
         "--state",
@@ -627,18 +1287,98 @@ def main(_argv=None):
         default="all",
         help="only issues with the given state",
     )
+    parser.add_argument(
+        "--since",
+        help="only tickets of the owner updated since the given ISO date - uses a single issue search for all projects - like without --since the tickets include pull requests",
+    )
+    parser.add_argument(
+        "--org",
+        action="store_true",
+        help="the owner is an organization (for --since)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=RecordWriter.FORMATS,
+        default="wiki",
+        help="output format [default: %(default)s]",
+    )
+    parser.add_argument(
+        "--profile",
+        help="write cProfile/pstats output to the given file and print the top functions",
+    )
     parser.add_argument("-V", "--version", action="version", version="gitlog2wiki 0.1")
 
     args = parser.parse_args(args=_argv)
-    if args.project and args.owner:
-        osProject = OsProject(
-            owner=args.owner,
-            project_id=args.project,
+    with profiled(args.profile):
+        exit_code = issue2ticket(args, parser)
+    return exit_code
+
+
+def issue2ticket(args, parser) -> int:
+    """Output the tickets selected by the given issue2ticket arguments.
+
+    Args:
+        args: Parsed argument namespace.
+        parser: the argument parser for error messages.
+
+    Returns:
+        int: the exit code - 1 if the tickets of any project could not be fetched
+    """
+    exit_code = 0
+    writer = RecordWriter.create(args.format)
+    specs = [line for line in sys.stdin if line.strip()] if args.stdin else []
+    specs.extend(args.project or [])
+    try:
+        spec_projects = [OsProject.fromSpec(spec, owner=args.owner) for spec in specs]
+    except ValueError as ex:
+        parser.error(f"{ex} - use owner/project or --owner")
+    if args.since:
+        owners = {os_project.owner for os_project in spec_projects}
+        if args.owner:
+            owners.add(args.owner)
+        if len(owners) != 1:
+            parser.error("--since needs --owner or the projects of a single owner")
+        owner = owners.pop()
+        osProjects = OsProjects()
+        tickets_by_project = osProjects.tickets_of_owner_since(
+            owner, args.since, org=args.org, state=args.state
         )
+        if args.stdin or args.project:
+            project_ids = {os_project.project_id for os_project in spec_projects}
+            tickets_by_project = {
+                project_id: tickets
+                for project_id, tickets in tickets_by_project.items()
+                if project_id in project_ids
+            }
+        for tickets in tickets_by_project.values():
+            writer.write_all(tickets)
+        return exit_code
+    if args.stdin or args.project:
+        osProjects = spec_projects
+    elif args.owner and not args.repo:
+        github = GitHubApi.get_instance()
+        repo_infos = github.repo_infos_for_owner(args.owner)
+        osProjects = [
+            OsProject(owner=args.owner, project_id=project_id)
+            for project_id in sorted(
+                repo_info.name for repo_info in repo_infos if not repo_info.fork
+            )
+        ]
+    else:
+        osProjects = [OsProject.fromRepo()]
+    if len(osProjects) == 1:
+        writer.write_all(osProjects[0].iterIssues(state=args.state, with_body=False))
     else:
-        osProject = OsProject.fromRepo()
-    tickets = osProject.getIssues(state=args.state)
-    print("\n".join([t.toWikiMarkup() for t in tickets]))
+        failed = []
+        for _osProject, tickets in OsProjects.iter_tickets(
+            osProjects, jobs=args.jobs, failed=failed, state=args.state
+        ):
+            writer.write_all(tickets)
+        if failed:
+            failed_ids = ", ".join(str(os_project) for os_project in failed)
+            print(f"fetching tickets failed for {failed_ids}", file=sys.stderr)
+            exit_code = 1
+    return exit_code
 
 
 if __name__ == "__main__":
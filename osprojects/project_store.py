@@ -0,0 +1,158 @@
+"""Created on 2026-10-19.
+
+@author: wf
+"""
+
+from itertools import islice
+from typing import Callable, Iterable, List, Optional
+
+from lodstorage.sql import SQLDB
+
+from osprojects.github_api import GitHubApi
+from osprojects.osproject import Commit, OsProject, Ticket
+
+
+class ProjectStore:
+    """SQLite store for projects, tickets and commits.
+
+    The table schemas are derived from the getSamples() list of dicts of
+    OsProject, Ticket and Commit. Records are bulk inserted in batched
+    transactions so that repeated analytical questions can be answered
+    by SQL instead of re-fetching and re-parsing.
+    """
+
+    # entity name -> (sample provider, primary key, indexed columns)
+    ENTITIES = {
+        "project": (OsProject.getSamples, "url", ["owner", "language"]),
+        "ticket": (Ticket.getSamples, "url", ["project", "state", "createdAt"]),
+        "gitcommit": (Commit.getSamples, None, ["project", "date", "name"]),
+    }
+
+    def __init__(self, db_path: Optional[str] = None, batch_size: int = 1000):
+        """Construct me.
+
+        Args:
+            db_path (str): The path of the SQLite database - defaults to osprojects.db in the GitHub cache directory.
+            batch_size (int): The number of records to insert per transaction.
+        """
+        if db_path is None:
+            db_path = GitHubApi.get_instance().get_cache_path("osprojects.db")
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.sql_db = SQLDB(db_path)
+        self.entity_infos = {}
+        for entity_name in ProjectStore.ENTITIES:
+            self.entity_infos[entity_name] = self.create_table(entity_name)
+
+    def create_table(self, entity_name: str):
+        """Create the table and indices for the given entity if they do not
+        exist yet.
+
+        Args:
+            entity_name (str): The name of the entity/table.
+
+        Returns:
+            EntityInfo: The pyLodStorage entity info.
+        """
+        get_samples, primary_key, index_columns = ProjectStore.ENTITIES[entity_name]
+        exists = any(
+            table["name"] == entity_name for table in self.sql_db.getTableList()
+        )
+        entity_info = self.sql_db.createTable(
+            get_samples(),
+            entity_name,
+            primaryKey=primary_key,
+            withCreate=not exists,
+        )
+        if entity_name == "gitcommit":
+            self.sql_db.execute(
+                "CREATE UNIQUE INDEX IF NOT EXISTS idx_gitcommit_host_hash ON gitcommit(host, hash)"
+            )
+        for column in index_columns:
+            self.sql_db.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{entity_name}_{column} ON {entity_name}({column})"
+            )
+        return entity_info
+
+    def store(
+        self, entity_name: str, items: Iterable, to_record: Callable = None
+    ) -> int:
+        """Store the given items in batched transactions.
+
+        Existing records with the same key are replaced.
+
+        Args:
+            entity_name (str): The name of the entity/table.
+            items (Iterable): The items to store - may be a generator.
+            to_record (Callable): Converter from item to record - defaults to item.to_record().
+
+        Returns:
+            int: The number of stored records.
+        """
+        if to_record is None:
+            to_record = lambda item: item.to_record()
+        entity_info = self.entity_infos[entity_name]
+        iterator = iter(items)
+        count = 0
+        while True:
+            batch = [to_record(item) for item in islice(iterator, self.batch_size)]
+            if not batch:
+                break
+            self.sql_db.store(
+                batch, entity_info, executeMany=True, fixNone=True, replace=True
+            )
+            count += len(batch)
+        return count
+
+    def store_projects(self, projects: Iterable[OsProject]) -> int:
+        """Store the given projects."""
+        count = self.store("project", projects)
+        return count
+
+    def store_tickets(self, tickets: Iterable[Ticket]) -> int:
+        """Store the given tickets."""
+        count = self.store("ticket", tickets)
+        return count
+
+    def store_commits(self, commits: Iterable[Commit]) -> int:
+        """Store the given commits."""
+        count = self.store("gitcommit", commits)
+        return count
+
+    def query(self, sql: str, params=None) -> List[dict]:
+        """Run the given SQL query and return the list of dicts result."""
+        lod = self.sql_db.query(sql, params)
+        return lod
+
+    def open_tickets_per_project(self) -> List[dict]:
+        """Get the number of open tickets per project."""
+        sql = """SELECT project, COUNT(*) AS open_tickets
+FROM ticket
+WHERE state='open'
+GROUP BY project
+ORDER BY open_tickets DESC, project"""
+        lod = self.query(sql)
+        return lod
+
+    def commits_per_month(self, project: Optional[str] = None) -> List[dict]:
+        """Get the number of commits per month for all or the given project.
+
+        Args:
+            project (str): Optionally restrict to the given project.
+
+        Returns:
+            List[dict]: project, month and commits count records.
+        """
+        where = "WHERE project=?" if project else ""
+        params = (project,) if project else None
+        sql = f"""SELECT project, SUBSTR(date,1,7) AS month, COUNT(*) AS commits
+FROM gitcommit
+{where}
+GROUP BY project, month
+ORDER BY project, month"""
+        lod = self.query(sql, params)
+        return lod
+
+    def close(self):
+        """Close the database connection."""
+        self.sql_db.close()
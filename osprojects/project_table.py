@@ -0,0 +1,287 @@
+"""Created on 2026-10-19.
+
+@author: wf
+"""
+
+import datetime
+from typing import Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+
+
+class ProjectTable:
+    """Columnar view of a set of open source projects.
+
+    Each attribute of the OsProject.getSamples() record form is held in
+    its own numpy array so that filtering, sorting, top-k and group-by
+    over large sets of projects are vectorized instead of looping over
+    OsProject properties.
+    """
+
+    # column name -> numpy dtype
+    COLUMNS = {
+        "project_id": object,
+        "owner": object,
+        "title": object,
+        "url": object,
+        "description": object,
+        "language": object,
+        "created_at": "datetime64[s]",
+        "updated_at": "datetime64[s]",
+        "stars": np.int64,
+        "forks": np.int64,
+    }
+
+    def __init__(self, columns: Dict[str, np.ndarray]):
+        """Construct me from the given columns.
+
+        Args:
+            columns (Dict[str, np.ndarray]): Equally long arrays keyed by column name.
+        """
+        self.columns = columns
+
+    def __len__(self) -> int:
+        length = len(self.columns["project_id"])
+        return length
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self.columns[column]
+
+    @staticmethod
+    def to_datetime64(value: Optional[datetime.datetime]) -> np.datetime64:
+        """Convert the given datetime to a numpy datetime64 (NaT for None)."""
+        if value is None:
+            dt64 = np.datetime64("NaT", "s")
+        else:
+            if value.tzinfo is not None:
+                value = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+            dt64 = np.datetime64(value, "s")
+        return dt64
+
+    @classmethod
+    def from_records(cls, records: List[dict]) -> "ProjectTable":
+        """Create a ProjectTable from records in the OsProject.getSamples()
+        list of dicts form.
+
+        Args:
+            records (List[dict]): The project records.
+
+        Returns:
+            ProjectTable: The columnar table.
+        """
+        columns = {}
+        for name, dtype in cls.COLUMNS.items():
+            values = [record.get(name) for record in records]
+            if dtype == "datetime64[s]":
+                column = np.array([cls.to_datetime64(v) for v in values], dtype=dtype)
+            elif dtype is object:
+                column = np.empty(len(values), dtype=object)
+                column[:] = values
+            else:
+                column = np.array([v or 0 for v in values], dtype=dtype)
+            columns[name] = column
+        table = cls(columns)
+        return table
+
+    @classmethod
+    def from_projects(cls, projects: Iterable) -> "ProjectTable":
+        """Create a ProjectTable from the given OsProjects.
+
+        Args:
+            projects (Iterable[OsProject]): The projects e.g. OsProjects.selected_projects.values().
+
+        Returns:
+            ProjectTable: The columnar table.
+        """
+        records = [project.to_record() for project in projects]
+        table = cls.from_records(records)
+        return table
+
+    def to_records(self) -> List[dict]:
+        """Convert me back to the OsProject.getSamples() list of dicts form."""
+        records = []
+        for i in range(len(self)):
+            record = {}
+            for name, dtype in ProjectTable.COLUMNS.items():
+                value = self.columns[name][i]
+                if dtype == "datetime64[s]":
+                    value = None if np.isnat(value) else value.astype(datetime.datetime)
+                elif dtype is not object:
+                    value = int(value)
+                record[name] = value
+            records.append(record)
+        return records
+
+    def take(self, indices: np.ndarray) -> "ProjectTable":
+        """Return a new table with the rows at the given indices or boolean
+        mask."""
+        columns = {name: column[indices] for name, column in self.columns.items()}
+        table = ProjectTable(columns)
+        return table
+
+    def age_days(
+        self, column: str = "updated_at", now: Optional[datetime.datetime] = None
+    ) -> np.ndarray:
+        """Get the age in days of the given date column.
+
+        Args:
+            column (str): The date column to use.
+            now (datetime): The reference time - defaults to the current UTC time.
+
+        Returns:
+            np.ndarray: The age in days as float (NaN for missing dates).
+        """
+        if now is None:
+            now = datetime.datetime.now(datetime.timezone.utc)
+        delta = ProjectTable.to_datetime64(now) - self.columns[column]
+        ages = delta / np.timedelta64(1, "D")
+        return ages
+
+    def mask(
+        self,
+        language: Optional[str] = None,
+        owner: Optional[str] = None,
+        min_stars: Optional[int] = None,
+        min_forks: Optional[int] = None,
+        max_age_days: Optional[float] = None,
+    ) -> np.ndarray:
+        """Create a boolean row mask for the given criteria.
+
+        Args:
+            language (str): Only projects with the given language.
+            owner (str): Only projects of the given owner.
+            min_stars (int): Only projects with at least this number of stars.
+            min_forks (int): Only projects with at least this number of forks.
+            max_age_days (float): Only projects updated within the given number of days.
+
+        Returns:
+            np.ndarray: The boolean mask.
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if language is not None:
+            mask &= self.columns["language"] == language
+        if owner is not None:
+            mask &= self.columns["owner"] == owner
+        if min_stars is not None:
+            mask &= self.columns["stars"] >= min_stars
+        if min_forks is not None:
+            mask &= self.columns["forks"] >= min_forks
+        if max_age_days is not None:
+            mask &= self.age_days() <= max_age_days
+        return mask
+
+    def filter(self, **criteria) -> "ProjectTable":
+        """Filter by the given criteria - see mask for the supported
+        criteria."""
+        table = self.take(self.mask(**criteria))
+        return table
+
+    @staticmethod
+    def missing(values: np.ndarray) -> np.ndarray:
+        """Get the mask of the missing values - None for object and NaT for
+        date columns."""
+        if values.dtype == object:
+            missing = np.fromiter((v is None for v in values), bool, len(values))
+        elif np.issubdtype(values.dtype, np.datetime64):
+            missing = np.isnat(values)
+        else:
+            missing = np.zeros(len(values), dtype=bool)
+        return missing
+
+    @staticmethod
+    def codes(values: np.ndarray):
+        """Encode the given values by their rank among the distinct values.
+
+        Args:
+            values (np.ndarray): The column values.
+
+        Returns:
+            tuple: the sorted distinct non missing values, the rank of each
+            value (-1 for missing values) and the missing mask
+        """
+        missing = ProjectTable.missing(values)
+        ranks = np.full(len(values), -1, dtype=np.int64)
+        uniques = values[:0]
+        if not missing.all():
+            uniques, inverse = np.unique(values[~missing], return_inverse=True)
+            ranks[~missing] = inverse.reshape(-1)
+        return uniques, ranks, missing
+
+    def sort(self, column: str, descending: bool = False) -> "ProjectTable":
+        """Sort by the given column (stable in both directions).
+
+        Missing values (None or NaT) are sorted last in both directions.
+
+        Args:
+            column (str): The column to sort by.
+            descending (bool): If True sort in descending order.
+
+        Returns:
+            ProjectTable: The sorted table.
+        """
+        _uniques, ranks, missing = ProjectTable.codes(self.columns[column])
+        if descending:
+            ranks = -ranks
+        # lexsort is stable - the last key is the primary one
+        indices = np.lexsort((ranks, missing))
+        table = self.take(indices)
+        return table
+
+    def top_k(self, column: str, k: int) -> "ProjectTable":
+        """Get the k rows with the highest values of the given numeric column.
+
+        Args:
+            column (str): The column to rank by e.g. stars or forks.
+            k (int): The number of rows to return.
+
+        Returns:
+            ProjectTable: The top k rows in descending order.
+        """
+        values = self.columns[column]
+        k = min(k, len(values))
+        if k <= 0:
+            indices = np.array([], dtype=np.int64)
+        else:
+            candidates = np.argpartition(-values, k - 1)[:k]
+            indices = candidates[np.argsort(-values[candidates], kind="stable")]
+        table = self.take(indices)
+        return table
+
+    def group_by(
+        self,
+        key: str,
+        value: Optional[str] = None,
+        agg: Callable[[np.ndarray], float] = np.sum,
+    ) -> Dict[object, dict]:
+        """Group by the given key column.
+
+        Args:
+            key (str): The column to group by e.g. language or owner.
+            value (str): Optional numeric column to aggregate e.g. stars.
+            agg (Callable): The aggregation function for the value column.
+
+        Returns:
+            Dict[object, dict]: count and optional aggregated value keyed by group.
+        """
+        groups, inverse, missing = ProjectTable.codes(self.columns[key])
+        groups = [group.item() if hasattr(group, "item") else group for group in groups]
+        if missing.any():
+            # missing keys form the last group
+            inverse = np.where(missing, len(groups), inverse)
+            groups.append(None)
+        counts = np.bincount(inverse, minlength=len(groups))
+        result = {}
+        if value is not None and agg is np.sum:
+            values = self.columns[value]
+            sums = np.bincount(inverse, weights=values, minlength=len(groups)).astype(
+                values.dtype
+            )
+        for i, group in enumerate(groups):
+            entry = {"count": int(counts[i])}
+            if value is not None:
+                if agg is np.sum:
+                    entry[value] = sums[i].item()
+                else:
+                    entry[value] = agg(self.columns[value][inverse == i]).item()
+            result[group] = entry
+        return result
@@ -0,0 +1,118 @@
+"""Created on 2026-10-19.
+
+@author: wf
+"""
+
+import csv
+import json
+import sys
+from typing import Iterable, Optional, TextIO
+
+
+class RecordWriter:
+    """Streaming writer for Tickets and Commits.
+
+    Each record is written and flushed as soon as it is produced so that
+    output starts immediately and memory does not grow with the size of
+    the output.
+    """
+
+    FORMATS = ["wiki", "markdown", "csv", "ndjson"]
+
+    def __init__(self, stream: Optional[TextIO] = None, flush: bool = True):
+        """Construct me.
+
+        Args:
+            stream (TextIO): the stream to write to - defaults to sys.stdout
+            flush (bool): if True flush after each record
+        """
+        self.stream = stream if stream is not None else sys.stdout
+        self.flush = flush
+        self.count = 0
+
+    @classmethod
+    def create(
+        cls, fmt: str = "wiki", stream: Optional[TextIO] = None, flush: bool = True
+    ) -> "RecordWriter":
+        """Create a writer for the given format.
+
+        Args:
+            fmt (str): one of FORMATS
+            stream (TextIO): the stream to write to - defaults to sys.stdout
+            flush (bool): if True flush after each record
+
+        Returns:
+            RecordWriter: the writer for the format
+        """
+        writer_classes = {
+            "wiki": WikiWriter,
+            "markdown": MarkdownWriter,
+            "csv": CsvWriter,
+            "ndjson": NdjsonWriter,
+        }
+        if fmt not in writer_classes:
+            raise ValueError(f"unknown format {fmt} - must be one of {cls.FORMATS}")
+        writer = writer_classes[fmt](stream=stream, flush=flush)
+        return writer
+
+    def format(self, item) -> str:
+        """Format the given item - to be overridden."""
+        raise NotImplementedError()
+
+    def write(self, item):
+        """Write the given Ticket or Commit."""
+        self.stream.write(self.format(item) + "\n")
+        self.count += 1
+        if self.flush:
+            self.stream.flush()
+
+    def write_all(self, items: Iterable) -> int:
+        """Write all items of the given iterable as they are produced.
+
+        Returns:
+            int: the number of records written
+        """
+        for item in items:
+            self.write(item)
+        return self.count
+
+
+class WikiWriter(RecordWriter):
+    """Mediawiki markup writer."""
+
+    def format(self, item) -> str:
+        return item.toWikiMarkup()
+
+
+class MarkdownWriter(RecordWriter):
+    """Markdown list writer."""
+
+    def format(self, item) -> str:
+        return item.toMarkdown()
+
+
+class NdjsonWriter(RecordWriter):
+    """Newline delimited JSON writer."""
+
+    def format(self, item) -> str:
+        return json.dumps(item.to_record(), default=str)
+
+
+class CsvWriter(RecordWriter):
+    """CSV writer - the header is derived from the first record."""
+
+    def __init__(self, stream: Optional[TextIO] = None, flush: bool = True):
+        super().__init__(stream=stream, flush=flush)
+        self.csv_writer = None
+
+    def write(self, item):
+        record = item.to_record()
+        if self.csv_writer is None:
+            self.csv_writer = csv.DictWriter(
+                self.stream, fieldnames=list(record.keys()), lineterminator="\n"
+            )
+            self.csv_writer.writeheader()
+        self.csv_writer.writerow(record)
+        self.count += 1
+        if self.flush:
+            self.stream.flush()
@@ -0,0 +1,263 @@
+"""Created on 2026-10-19.
+
+@author: wf
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+from lodstorage.sql import SQLDB
+
+from osprojects.github_api import GitHubApi
+from osprojects.osproject import OsProject, Ticket
+
+
+class TicketIndex:
+    """Local full-text index over ticket titles, bodies and comments.
+
+    Uses an SQLite FTS5 table with the ticket_doc table as external
+    content - triggers keep the index in sync so that tickets can be
+    added and updated incrementally. Tickets are keyed by the
+    owner/project id and their number.
+    """
+
+    SCHEMA_VERSION = 2
+
+    # the statements are built from single line strings so that formatters
+    # do not mistake them for docstrings
+    DDL_TICKET_DOC = "\n".join(
+        [
+            "CREATE TABLE IF NOT EXISTS ticket_doc(",
+            "  id INTEGER PRIMARY KEY,",
+            "  fqid TEXT NOT NULL,",
+            "  project TEXT NOT NULL,",
+            "  number INTEGER NOT NULL,",
+            "  state TEXT,",
+            "  createdAt TEXT,",
+            "  url TEXT,",
+            "  title TEXT,",
+            "  body TEXT,",
+            "  comments TEXT,",
+            "  UNIQUE(fqid, number)",
+            ")",
+        ]
+    )
+    DDL_TICKET_FTS = "\n".join(
+        [
+            "CREATE VIRTUAL TABLE IF NOT EXISTS ticket_fts USING fts5(",
+            "  title, body, comments, content='ticket_doc', content_rowid='id'",
+            ")",
+        ]
+    )
+    FTS_INSERT = "\n".join(
+        [
+            "  INSERT INTO ticket_fts(rowid, title, body, comments)",
+            "  VALUES (new.id, new.title, new.body, new.comments);",
+        ]
+    )
+    FTS_DELETE = "\n".join(
+        [
+            "  INSERT INTO ticket_fts(ticket_fts, rowid, title, body, comments)",
+            "  VALUES ('delete', old.id, old.title, old.body, old.comments);",
+        ]
+    )
+    DDL = [
+        DDL_TICKET_DOC,
+        "CREATE INDEX IF NOT EXISTS idx_ticket_doc_state ON ticket_doc(state)",
+        "CREATE INDEX IF NOT EXISTS idx_ticket_doc_createdAt ON ticket_doc(createdAt)",
+        DDL_TICKET_FTS,
+        "\n".join(
+            [
+                "CREATE TRIGGER IF NOT EXISTS ticket_doc_ai AFTER INSERT ON ticket_doc BEGIN",
+                FTS_INSERT,
+                "END",
+            ]
+        ),
+        "\n".join(
+            [
+                "CREATE TRIGGER IF NOT EXISTS ticket_doc_ad AFTER DELETE ON ticket_doc BEGIN",
+                FTS_DELETE,
+                "END",
+            ]
+        ),
+        "\n".join(
+            [
+                "CREATE TRIGGER IF NOT EXISTS ticket_doc_au AFTER UPDATE ON ticket_doc BEGIN",
+                FTS_DELETE,
+                FTS_INSERT,
+                "END",
+            ]
+        ),
+    ]
+    # indexes of older schema versions are dropped and rebuilt
+    DROP = ["DROP TABLE IF EXISTS ticket_fts", "DROP TABLE IF EXISTS ticket_doc"]
+
+    UPSERT = "\n".join(
+        [
+            "INSERT INTO ticket_doc(fqid, project, number, state, createdAt, url, title, body, comments)",
+            "VALUES (:fqid, :project, :number, :state, :createdAt, :url, :title, :body, :comments)",
+            "ON CONFLICT(fqid, number) DO UPDATE SET",
+            "  project=excluded.project,",
+            "  state=excluded.state,",
+            "  createdAt=excluded.createdAt,",
+            "  url=excluded.url,",
+            "  title=excluded.title,",
+            "  body=excluded.body,",
+            "  comments=COALESCE(excluded.comments, ticket_doc.comments)",
+        ]
+    )
+
+    def __init__(self, db_path: Optional[str] = None):
+        """Construct me.
+
+        Args:
+            db_path (str): The path of the SQLite database - defaults to ticket_index.db in the GitHub cache directory.
+        """
+        if db_path is None:
+            db_path = GitHubApi.get_instance().get_cache_path("ticket_index.db")
+        self.db_path = db_path
+        self.sql_db = SQLDB(db_path)
+        version = self.sql_db.c.execute("PRAGMA user_version").fetchone()[0]
+        if version != TicketIndex.SCHEMA_VERSION:
+            for ddl in TicketIndex.DROP:
+                self.sql_db.execute(ddl)
+        for ddl in TicketIndex.DDL:
+            self.sql_db.execute(ddl)
+        self.sql_db.execute(f"PRAGMA user_version={TicketIndex.SCHEMA_VERSION}")
+
+    @staticmethod
+    def fqid_of(ticket: Ticket) -> str:
+        """Get the owner/project id of the given ticket from its url - the
+        bare project id if the url has no owner."""
+        parts = (ticket.url or "").split("/")
+        if len(parts) > 4 and parts[2]:
+            fqid = f"{parts[3]}/{parts[4]}"
+        else:
+            fqid = ticket.project
+        return fqid
+
+    @staticmethod
+    def to_doc(
+        ticket: Ticket, comments: Optional[List[str]] = None, fqid: str = None
+    ) -> dict:
+        """Convert the given ticket and its comment texts to an index document.
+
+        Args:
+            ticket (Ticket): the ticket
+            comments (List[str]): the comment texts
+            fqid (str): the owner/project id - derived from the ticket url if None
+        """
+        created_at = ticket.createdAt.isoformat() if ticket.createdAt else None
+        doc = {
+            "fqid": fqid or TicketIndex.fqid_of(ticket),
+            "project": ticket.project,
+            "number": ticket.number,
+            "state": ticket.state,
+            "createdAt": created_at,
+            "url": ticket.url,
+            "title": ticket.title,
+            "body": ticket.body or "",
+            "comments": "\n".join(comments) if comments is not None else None,
+        }
+        return doc
+
+    def add_tickets(
+        self,
+        tickets: Iterable[Ticket],
+        comments_by_number: Optional[Dict[int, List[str]]] = None,
+        fqid: Optional[str] = None,
+    ) -> int:
+        """Add or update the given tickets in one transaction.
+
+        Args:
+            tickets (Iterable[Ticket]): the tickets to index
+            comments_by_number (Dict[int, List[str]]): optional comment texts
+                by ticket number - already indexed comments are kept if missing
+            fqid (str): the owner/project id of the tickets - derived from
+                the ticket urls if None
+
+        Returns:
+            int: the number of indexed tickets
+        """
+        comments_by_number = comments_by_number or {}
+        docs = [
+            TicketIndex.to_doc(ticket, comments_by_number.get(ticket.number), fqid)
+            for ticket in tickets
+        ]
+        self.sql_db.c.executemany(TicketIndex.UPSERT, docs)
+        self.sql_db.c.commit()
+        return len(docs)
+
+    def index_project(self, os_project: OsProject, with_comments: bool = False) -> int:
+        """Fetch and index all tickets of the given project.
+
+        Args:
+            os_project (OsProject): the project to index
+            with_comments (bool): if True also fetch and index the comments
+
+        Returns:
+            int: the number of indexed tickets
+        """
+        tickets = os_project.getIssues(state="all")
+        comments_by_number = None
+        if with_comments:
+            comments_by_number = {}
+            for ticket in tickets:
+                comments = os_project.getComments(ticket.number)
+                comments_by_number[ticket.number] = [
+                    comment.get("body") or "" for comment in comments
+                ]
+        count = self.add_tickets(tickets, comments_by_number, os_project.fqid)
+        return count
+
+    def search(
+        self,
+        query: str,
+        fqid: Optional[str] = None,
+        state: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: int = 20,
+    ) -> List[dict]:
+        """Search the index ranked by bm25 with titles weighted highest.
+
+        Args:
+            query (str): the FTS5 query e.g. 'wiki AND markup' or 'tick*'
+            fqid (str): only tickets of the given owner/project
+            state (str): only tickets with the given state
+            since (str): only tickets created at or after the given ISO date
+            until (str): only tickets created before the given ISO date
+            limit (int): the maximum number of results
+
+        Returns:
+            List[dict]: the matching tickets with rank and snippet
+        """
+        conditions = ["ticket_fts MATCH :query"]
+        params = {"query": query, "limit": limit}
+        for column, operator, value in [
+            ("fqid", "=", fqid),
+            ("state", "=", state),
+            ("createdAt", ">=", since),
+            ("createdAt", "<", until),
+        ]:
+            if value is not None:
+                name = f"p{len(params)}"
+                conditions.append(f"d.{column}{operator}:{name}")
+                params[name] = value
+        where = " AND ".join(conditions)
+        sql = "\n".join(
+            [
+                "SELECT d.fqid, d.project, d.number, d.state, d.createdAt, d.url, d.title,",
+                "  bm25(ticket_fts, 10.0, 1.0, 0.5) AS rank,",
+                "  snippet(ticket_fts, -1, '[', ']', '...', 12) AS snippet",
+                "FROM ticket_fts JOIN ticket_doc d ON d.id = ticket_fts.rowid",
+                f"WHERE {where}",
+                "ORDER BY rank",
+                "LIMIT :limit",
+            ]
+        )
+        lod = self.sql_db.query(sql, params)
+        return lod
+
+    def close(self):
+        """Close the database connection."""
+        self.sql_db.close()
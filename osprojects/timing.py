@@ -0,0 +1,164 @@
+"""Created on 2026-10-19.
+
+@author: wf
+"""
+
+import cProfile
+import io
+import json
+import pstats
+import sys
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Optional, TextIO
+
+
+@dataclass
+class Span:
+    """A timed span of work.
+
+    Attributes:
+        name (str): e.g. workspace scan or check_readme
+        category (str): e.g. phase, project, group, git or remote
+        start (float): the wall clock start time
+        duration (float): the duration in seconds
+        attrs (dict): further attributes e.g. the project
+    """
+
+    name: str
+    category: str
+    start: float
+    duration: float = 0.0
+    attrs: Dict[str, str] = field(default_factory=dict)
+
+
+class Timing:
+    """Collector of the timing spans of a run.
+
+    Spans can be written as JSON lines while they are recorded and
+    summarized by the slowest phases and projects at the end.
+    """
+
+    instance = None
+    instance_lock = threading.Lock()
+
+    def __init__(self, max_spans: int = 100000):
+        """Construct me.
+
+        Args:
+            max_spans (int): the number of most recent spans to keep e.g. in server mode
+        """
+        self.lock = threading.Lock()
+        self.spans: deque = deque(maxlen=max_spans)
+        self.jsonl: Optional[TextIO] = None
+
+    @classmethod
+    def get_instance(cls) -> "Timing":
+        """Get the shared timing collector."""
+        with cls.instance_lock:
+            if cls.instance is None:
+                cls.instance = cls()
+        return cls.instance
+
+    def open_jsonl(self, path: str):
+        """Write each recorded span as a JSON line to the given file."""
+        self.jsonl = open(path, "w", encoding="utf-8")
+
+    def close(self):
+        if self.jsonl is not None:
+            self.jsonl.close()
+            self.jsonl = None
+
+    def record(self, span: Span):
+        with self.lock:
+            self.spans.append(span)
+            if self.jsonl is not None:
+                self.jsonl.write(json.dumps(asdict(span)) + "\n")
+                self.jsonl.flush()
+
+    @contextmanager
+    def span(self, name: str, category: str = "phase", **attrs):
+        """Time the enclosed block as a span.
+
+        Args:
+            name (str): the name of the span
+            category (str): the category of the span
+            **attrs: further attributes e.g. project
+
+        Yields:
+            Span: the span - its duration is set when the block is left
+        """
+        attrs = {key: str(value) for key, value in attrs.items()}
+        span = Span(name, category, time.time(), attrs=attrs)
+        start = time.perf_counter()
+        try:
+            yield span
+        finally:
+            span.duration = time.perf_counter() - start
+            self.record(span)
+
+    def summary(self, top: int = 10) -> str:
+        """Get a summary of the slowest phases and projects.
+
+        Args:
+            top (int): the number of entries per section
+
+        Returns:
+            str: the summary text
+        """
+        with self.lock:
+            spans = list(self.spans)
+        totals = defaultdict(lambda: [0, 0.0, 0.0])
+        for span in spans:
+            if span.category == "project":
+                continue
+            total = totals[(span.category, span.name)]
+            total[0] += 1
+            total[1] += span.duration
+            total[2] = max(total[2], span.duration)
+        lines = ["slowest phases:"]
+        for (category, name), (count, duration, longest) in sorted(
+            totals.items(), key=lambda item: item[1][1], reverse=True
+        )[:top]:
+            lines.append(
+                f"  {duration:8.3f}s {count:5}x max {longest:7.3f}s {category}:{name}"
+            )
+        projects = [span for span in spans if span.category == "project"]
+        if projects:
+            lines.append("slowest projects:")
+            for span in sorted(projects, key=lambda s: s.duration, reverse=True)[:top]:
+                lines.append(f"  {span.duration:8.3f}s {span.name}")
+        summary = "\n".join(lines)
+        return summary
+
+
+@contextmanager
+def profiled(profile_path: Optional[str] = None, file: TextIO = None, top: int = 20):
+    """Run the enclosed block with cProfile if a profile path is given.
+
+    The pstats data is written to the given path and the top functions by
+    cumulative time are printed.
+
+    Args:
+        profile_path (str): the path of the pstats output - no profiling if None
+        file (TextIO): where to print the top functions - defaults to stderr
+        top (int): the number of functions to print
+    """
+    if not profile_path:
+        yield None
+        return
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        profiler.dump_stats(profile_path)
+        stream = io.StringIO()
+        stats = pstats.Stats(profiler, stream=stream)
+        stats.sort_stats("cumulative").print_stats(top)
+        print(stream.getvalue(), file=file or sys.stderr)
+        print(f"profile written to {profile_path}", file=file or sys.stderr)
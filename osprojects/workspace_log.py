@@ -0,0 +1,162 @@
+"""Created on 2026-10-19.
+
+@author: wf
+"""
+
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional
+
+from osprojects.commit_stats import CommitStats
+from osprojects.osproject import Commit, OsProject
+
+
+def commits_of_folder(
+    folder: str,
+    date_prefix: Optional[str] = None,
+    committer: Optional[str] = None,
+    paths: Optional[List[str]] = None,
+    use_cache: bool = False,
+) -> List[Commit]:
+    """Get the filtered commits of the repository in the given folder.
+
+    Module level function so that it can be run in a worker process.
+
+    Args:
+        folder (str): the folder of the local clone
+        date_prefix (str): e.g. 2026, 2026-03 or 2026-03-28
+        committer (str): only commits whose committer matches the given pattern
+        paths (List[str]): only commits touching the given paths
+        use_cache (bool): if True use the CommitCache
+
+    Returns:
+        List[Commit]: the matching commits newest first
+    """
+    commits = []
+    os_project = OsProject.fromFolder(folder)
+    if os_project is not None:
+        commits = list(
+            os_project.selectCommits(
+                date_prefix, committer=committer, paths=paths, use_cache=use_cache
+            )
+        )
+        commits.sort(key=lambda commit: commit.date, reverse=True)
+    return commits
+
+
+def stats_of_folder(
+    folder: str,
+    date_prefix: Optional[str] = None,
+    committer: Optional[str] = None,
+    paths: Optional[List[str]] = None,
+    use_cache: bool = False,
+) -> CommitStats:
+    """Get the commit statistics of the repository in the given folder in a
+    single streaming pass - see commits_of_folder for the arguments."""
+    stats = CommitStats()
+    os_project = OsProject.fromFolder(folder)
+    if os_project is not None:
+        stats.add_all(
+            os_project.selectCommits(
+                date_prefix, committer=committer, paths=paths, use_cache=use_cache
+            )
+        )
+    return stats
+
+
+class WorkspaceLog:
+    """Commit extraction across all repositories of a workspace.
+
+    The repositories are processed in a process pool and the per
+    repository results are merged in time or project order.
+    """
+
+    def __init__(self, workspace: str, jobs: Optional[int] = None):
+        """Construct me.
+
+        Args:
+            workspace (str): the directory containing the local clones
+            jobs (int): the number of worker processes - defaults to the number of cpus
+        """
+        self.workspace = workspace
+        self.jobs = jobs
+
+    def folders(self) -> Dict[str, OsProject]:
+        """Get the local repositories of the workspace in a stable order.
+
+        Returns:
+            Dict[str, OsProject]: the projects keyed by folder sorted by folder name
+        """
+        projects = {}
+        for name in sorted(os.listdir(self.workspace)):
+            folder = os.path.join(self.workspace, name)
+            if os.path.isdir(folder):
+                os_project = OsProject.fromFolder(folder)
+                if os_project is not None:
+                    projects[folder] = os_project
+        return projects
+
+    def iterCommits(
+        self,
+        order: str = "time",
+        date_prefix: Optional[str] = None,
+        committer: Optional[str] = None,
+        paths: Optional[List[str]] = None,
+        use_cache: bool = False,
+    ) -> Iterator[Commit]:
+        """Iterate over the commits of all repositories of the workspace.
+
+        Args:
+            order (str): time to merge all commits newest first or project to
+                output the commits project by project as soon as they are available
+            date_prefix (str): e.g. 2026, 2026-03 or 2026-03-28 - applied in each repository
+            committer (str): only commits whose committer matches the given pattern
+            paths (List[str]): only commits touching the given paths
+            use_cache (bool): if True use the CommitCache of each repository
+
+        Yields:
+            Commit: the commits in the requested order
+        """
+        results = self.map_folders(
+            commits_of_folder, date_prefix, committer, paths, use_cache
+        )
+        if order == "project":
+            for commits in results:
+                yield from commits
+        else:
+            yield from heapq.merge(
+                *results, key=lambda commit: commit.date, reverse=True
+            )
+
+    def map_folders(self, function, *filters) -> Iterator:
+        """Run the given function with the filters for all folders in the
+        process pool.
+
+        Yields:
+            the results in folder order
+        """
+        folders = list(self.folders().keys())
+        count = len(folders)
+        filter_lists = [[value] * count for value in filters]
+        with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+            yield from executor.map(function, folders, *filter_lists)
+
+    def stats(
+        self,
+        date_prefix: Optional[str] = None,
+        committer: Optional[str] = None,
+        paths: Optional[List[str]] = None,
+        use_cache: bool = False,
+    ) -> CommitStats:
+        """Get the commit statistics of all repositories of the workspace.
+
+        Each worker aggregates its repository so that only the statistics
+        are transferred and merged - see iterCommits for the arguments.
+        """
+        stats = CommitStats()
+        for folder_stats in self.map_folders(
+            stats_of_folder, date_prefix, committer, paths, use_cache
+        ):
+            stats.merge(folder_stats)
+        return stats
@@ -0,0 +1,120 @@
+"""Created on 2026-10-19.
+
+@author: wf
+"""
+
+import random
+import unittest
+
+from osprojects.check_rules import RuleSet, find_needles
+from tests.basetest import BaseTest
+
+
+class TestCheckRules(BaseTest):
+    """Test the declarative content rules."""
+
+    def setUp(self, debug=False, profile=True):
+        BaseTest.setUp(self, debug=debug, profile=profile)
+        self.rule_set = RuleSet.get_default()
+        self.params = {
+            "project_name": "pyOpenSourceProjects",
+            "owner": "WolfgangFahl",
+            "project_id": "pyOpenSourceProjects",
+            "fqid": "WolfgangFahl/pyOpenSourceProjects",
+            "python_minor": [10, 11, 12, 13],
+            "python_versions": "'3.10', '3.11', '3.12', '3.13'",
+        }
+
+    def test_find_needles(self):
+        """Test finding overlapping needles."""
+        needles = ("scripts/install", "scripts/installAndTest", "AndTest", "test")
+        found = find_needles("run: scripts/installAndTest", needles)
+        self.assertEqual(
+            {"scripts/install", "scripts/installAndTest", "AndTest"}, found
+        )
+        # compare with the naive substring scan for random contents
+        rng = random.Random(42)
+        alphabet = "ab/"
+        needles = tuple(
+            sorted(
+                {"".join(rng.choices(alphabet, k=rng.randint(1, 4))) for _ in range(12)}
+            )
+        )
+        for _ in range(200):
+            content = "".join(rng.choices(alphabet, k=rng.randint(0, 30)))
+            expected = {needle for needle in needles if needle in content}
+            self.assertEqual(expected, find_needles(content, needles), content)
+
+    def test_expand(self):
+        """Test the templating of the rules."""
+        rules = self.rule_set.expand("pyproject.toml", self.params)
+        needles = [rule.needle for rule in rules]
+        self.assertEqual(
+            [
+                "Programming Language :: Python :: 3.10",
+                "Programming Language :: Python :: 3.11",
+                "Programming Language :: Python :: 3.12",
+                "Programming Language :: Python :: 3.13",
+                "hatchling",
+                "[tool.hatch.build.targets.wheel.sources]",
+            ],
+            needles,
+        )
+        params = dict(self.params, python_minor=[])
+        rules = self.rule_set.expand("pyproject.toml", params)
+        self.assertEqual(2, len(rules))
+        self.assertEqual([], self.rule_set.expand("scripts/install", self.params))
+
+    def test_evaluate(self):
+        """Test evaluating the rules of a build.yml."""
+        content = """
+    strategy:
+      matrix:
+        os: [ubuntu-latest, macos-latest, windows-latest]
+        python-version: [ '3.10', '3.11', '3.12', '3.13' ]
+    steps:
+    - uses: actions/checkout@v6
+    - uses: actions/setup-python@v6
+    - run: scripts/installAndTest
+"""
+        results = self.rule_set.evaluate(
+            ".github/workflows/build.yml", content, self.params
+        )
+        for rule, ok in results:
+            # negative rules are inverted when added as checks
+            self.assertEqual(not rule.negative, ok, rule)
+        negative_rules = [rule for rule, _ok in results if rule.negative]
+        self.assertEqual(["sphinx"], [rule.needle for rule in negative_rules])
+        params = dict(self.params, python_versions="'3.12'")
+        results = self.rule_set.evaluate(".github/workflows/build.yml", content, params)
+        failed = [rule for rule, ok in results if ok == rule.negative]
+        self.assertEqual(1, len(failed))
+
+    def test_evaluate_memoized(self):
+        """Test evaluating identical file copies only once."""
+        rule_set = RuleSet.load()
+        self.assertEqual(["python_minor"], rule_set.param_names("pyproject.toml"))
+        self.assertEqual([], rule_set.param_names("scripts/test"))
+        loads = []
+
+        def get_content():
+            loads.append(1)
+            return "# WF 2024-08-03\n"
+
+        for project_name in ["p1", "p2", "p3"]:
+            params = dict(self.params, project_name=project_name)
+            results = rule_set.evaluate_memoized(
+                "scripts/test", "hash1", get_content, params
+            )
+            self.assertEqual([True], [ok for _rule, ok in results])
+        self.assertEqual(1, len(loads))
+        self.assertEqual((2, 1), (rule_set.memo_hits, rule_set.memo_misses))
+        # used parameters are part of the key
+        for python_minor in [[12, 13], [12, 13], [13]]:
+            params = dict(self.params, python_minor=python_minor)
+            rule_set.evaluate_memoized("pyproject.toml", "hash2", lambda: "", params)
+        self.assertEqual((3, 3), (rule_set.memo_hits, rule_set.memo_misses))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,311 @@
+"""Created on 2026-10-19.
+
+@author: wf
+"""
+
+import argparse
+import io
+import os
+import tempfile
+import threading
+import unittest
+from argparse import Namespace
+from concurrent.futures import Future
+from contextlib import redirect_stderr, redirect_stdout
+
+from ratelimit import RateLimitException
+
+from osprojects.check_cache import CheckCache
+from osprojects.check_shard import CheckShard
+from osprojects.check_watch import CheckWatcher
+from osprojects.checkos import CheckOS
+from osprojects.checkos import main as checkos_main
+from osprojects.checkos_client import CheckOSClient
+from osprojects.checkos_server import CheckOSServer
+from osprojects.github_api import GitHubApi
+from tests.basetest import BaseTest
+
+
+class LocalProject:
+    """Minimal local project without any remote information."""
+
+    def __init__(self, folder: str):
+        self.folder = folder
+        self.owner = "WolfgangFahl"
+        self.project_id = os.path.basename(folder)
+        self.fqid = f"{self.owner}/{self.project_id}"
+        self.url = f"https://github.com/{self.fqid}"
+
+    def __str__(self):
+        return self.fqid
+
+
+class TestCheckOS(BaseTest):
+    """Test checking a set of projects."""
+
+    def setUp(self, debug=False, profile=True):
+        BaseTest.setUp(self, debug=debug, profile=profile)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.projects = []
+        for i in range(6):
+            folder = os.path.join(self.tmp.name, f"project{i}")
+            os.makedirs(os.path.join(folder, "scripts"))
+            if i % 2 == 0:
+                with open(os.path.join(folder, "pyproject.toml"), "w") as f:
+                    f.write('[project]\nname = "p"\nrequires-python = ">=3.10"\n')
+            self.projects.append(LocalProject(folder))
+        self.fetched = []
+
+    def tearDown(self):
+        self.tmp.cleanup()
+        BaseTest.tearDown(self)
+
+    def fetch_workflow_run(self, project, max_age: float = None) -> dict:
+        """Offline stand in for the remote workflow run lookup."""
+        self.fetched.append(project.fqid)
+        latest_run = {
+            "conclusion": "success",
+            "html_url": f"{project.url}/actions/runs/1",
+        }
+        return latest_run
+
+    def create_checkos(self, jobs: int = 1, check_cache: CheckCache = None) -> CheckOS:
+        """Create a checker for the test projects which does not access the
+        network."""
+        args = Namespace(
+            verbose=False,
+            workspace=self.tmp.name,
+            debug=False,
+            editor=False,
+            badges=False,
+            jobs=jobs,
+        )
+        checkos = CheckOS(args, osprojects=None, check_cache=check_cache)
+        checkos.handle_exception = lambda ex: None
+        checkos.fetch_workflow_run = self.fetch_workflow_run
+        return checkos
+
+    def check(self, jobs: int, check_cache: CheckCache = None):
+        """Check the projects with the given number of jobs."""
+        checkos = self.create_checkos(jobs, check_cache)
+        stdout = io.StringIO()
+        exit_code = 0
+        with redirect_stdout(stdout):
+            for i, checker in enumerate(checkos.iter_checked(self.projects), 1):
+                checker.report(f"{i:3}:")
+                if not checker.ok:
+                    exit_code = 1
+        return exit_code, stdout.getvalue()
+
+    def test_jobs_order(self):
+        """Test that concurrent checks report in the sequential order."""
+        exit_code, sequential = self.check(jobs=1)
+        self.assertEqual(1, exit_code)
+        for jobs in [2, 4]:
+            parallel_exit_code, parallel = self.check(jobs=jobs)
+            self.assertEqual(exit_code, parallel_exit_code)
+            self.assertEqual(sequential, parallel)
+        titles = [
+            line[:4] for line in sequential.splitlines() if line[:3].strip().isdigit()
+        ]
+        self.assertEqual(["  1:", "  2:", "  3:", "  4:", "  5:", "  6:"], titles)
+        # the workflow runs are looked up offline - once per project and run
+        self.assertEqual(3 * len(self.projects), len(self.fetched))
+        if self.debug:
+            print(sequential)
+
+    def test_prefetched_workflow_runs(self):
+        """Test attaching prefetched workflow runs to the checks."""
+        checkos = self.create_checkos(jobs=2)
+        futures = []
+        for i, project in enumerate(self.projects):
+            future = Future()
+            conclusion = "success" if i % 3 else "failure"
+            future.set_result(
+                {"conclusion": conclusion, "html_url": f"{project.url}/actions/{i}"}
+            )
+            futures.append(future)
+        checkers = list(checkos.iter_checked(self.projects, futures))
+        for i, checker in enumerate(checkers):
+            run_checks = [
+                check for check in checker.checks if "/actions/" in check.path
+            ]
+            self.assertEqual(1, len(run_checks))
+            self.assertEqual(f"{self.projects[i].url}/actions/{i}", run_checks[0].path)
+            self.assertEqual(i % 3 != 0, run_checks[0].ok)
+        # the prefetched runs are used instead of a lookup
+        self.assertEqual([], self.fetched)
+
+    def test_check_cache(self):
+        """Test serving unchanged check groups from the result cache."""
+        cache_file = os.path.join(self.tmp.name, "checkos_results.json")
+        check_cache = CheckCache(cache_file)
+        exit_code, uncached = self.check(jobs=1, check_cache=check_cache)
+        check_cache.save()
+        self.assertEqual(0, check_cache.hits)
+        misses = check_cache.misses
+        self.assertTrue(os.path.isfile(cache_file))
+
+        check_cache = CheckCache(cache_file)
+        cached_exit_code, cached = self.check(jobs=2, check_cache=check_cache)
+        self.assertEqual(exit_code, cached_exit_code)
+        self.assertEqual(uncached, cached)
+        self.assertEqual(misses, check_cache.hits)
+        self.assertEqual(0, check_cache.misses)
+
+        # a changed input only invalidates the groups reading it
+        readme = os.path.join(self.projects[0].folder, "README.md")
+        with open(readme, "w") as f:
+            f.write("# project0\n")
+        check_cache = CheckCache(cache_file)
+        _exit_code, changed = self.check(jobs=1, check_cache=check_cache)
+        self.assertEqual(1, check_cache.misses)
+        self.assertNotEqual(uncached, changed)
+
+    def test_recent_lookups(self):
+        """Test reusing remote lookups up to a maximum age."""
+        cache_file = os.path.join(self.tmp.name, "checkos_results.json")
+        check_cache = CheckCache(cache_file)
+        key = "WolfgangFahl/project0:workflow_run"
+        self.assertIsNone(check_cache.lookup_recent(key, 300))
+        check_cache.store_recent(key, {"run": None})
+        entry = check_cache.lookup_recent(key, 300)
+        self.assertIsNone(entry["run"])
+        check_cache.entries[key]["stored"] -= 600
+        self.assertIsNone(check_cache.lookup_recent(key, 300))
+        self.assertEqual((1, 2), (check_cache.hits, check_cache.misses))
+
+    def test_watch(self):
+        """Test rechecking only the projects affected by a change."""
+        cache_file = os.path.join(self.tmp.name, "checkos_results.json")
+        checkos = self.create_checkos(check_cache=CheckCache(cache_file))
+        with redirect_stdout(io.StringIO()):
+            checkos.report_projects(self.projects)
+        watcher = CheckWatcher(checkos, use_watchdog=False)
+        self.assertEqual(set(), watcher.poll_changes())
+        self.assertEqual([], watcher.check_changes())
+        folder = self.projects[0].folder
+        readme = os.path.join(folder, "README.md")
+        with open(readme, "w") as f:
+            f.write("# project0\nreadthedocs\n")
+        changed = watcher.poll_changes()
+        self.assertEqual({readme}, changed)
+        self.assertEqual({folder: {"readme"}}, watcher.affected(changed))
+        with open(readme, "a") as f:
+            f.write("more\n")
+        lines = watcher.check_changes()
+        if self.debug:
+            print("\n".join(lines))
+        self.assertTrue(lines[0].endswith("WolfgangFahl/project0 [readme]"), lines[0])
+        self.assertIn(f"    ✅:{readme}", lines)
+        self.assertIn(f"    ❌:⚠ ️readthedocs in {readme}", lines)
+        # no further changes
+        self.assertEqual([], watcher.check_changes())
+        # git operations and virtual environments are not watched
+        for ignored in [".git/index", ".venv/lib/x.py", "node_modules/a/b.js"]:
+            self.assertTrue(CheckWatcher.is_ignored(os.path.join(folder, ignored)))
+        self.assertFalse(CheckWatcher.is_ignored(readme))
+        watch_dirs = watcher.watch_dirs()
+        # the missing .github/workflows folder is noticed via the project folder
+        self.assertTrue(watch_dirs[folder])
+        self.assertFalse(watch_dirs[os.path.join(folder, "scripts")])
+        self.assertFalse(any(CheckWatcher.is_ignored(path) for path in watch_dirs))
+        # watching blocks so it can not be combined with serving
+        with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit) as cm:
+            checkos_main(["--watch", "--serve", "--workspace", self.tmp.name])
+        self.assertEqual(2, cm.exception.code)
+
+    def test_server(self):
+        """Test serving check, badge and status requests over HTTP and a Unix
+        socket."""
+        cache_file = os.path.join(self.tmp.name, "checkos_results.json")
+        checkos = self.create_checkos(check_cache=CheckCache(cache_file))
+        with redirect_stdout(io.StringIO()):
+            checkos.report_projects(self.projects)
+        socket_path = os.path.join(self.tmp.name, "checkos.sock")
+        for server_args in [{"port": 0}, {"socket_path": socket_path}]:
+            server = CheckOSServer(checkos, **server_args)
+            thread = threading.Thread(target=server.httpd.serve_forever, daemon=True)
+            thread.start()
+            try:
+                if "port" in server_args:
+                    client = CheckOSClient(port=server.httpd.server_port)
+                else:
+                    client = CheckOSClient(socket_path=socket_path)
+                result = client.check("project1")
+                self.assertEqual(1, result["exit_code"])
+                self.assertEqual(1, len(result["projects"]))
+                self.assertTrue(result["report"].startswith("  1:❌"))
+                result = client.check()
+                self.assertEqual(len(self.projects), len(result["projects"]))
+                badges = client.badges("project2")
+                self.assertIn("WolfgangFahl/project2", badges["markdown"])
+                status = client.status()
+                self.assertEqual(len(self.projects), status["projects"])
+                self.assertEqual(4, status["requests"])
+                with self.assertRaises(RuntimeError):
+                    client.check("unknown")
+            finally:
+                server.httpd.shutdown()
+                server.shutdown()
+                thread.join()
+        self.assertFalse(os.path.exists(socket_path))
+        # concurrent requests are served one at a time on the shared state
+        server = CheckOSServer(checkos, port=0)
+        try:
+            threads = [
+                threading.Thread(target=server.check, kwargs={"project": project})
+                for project in ["project1", "project2", None] * 3
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(len(threads), server.requests)
+            self.assertFalse(server.lock.locked())
+        finally:
+            server.shutdown()
+
+    def test_shard(self):
+        """Test merging the results of sharded checks into the report of a
+        single run."""
+        checkos = self.create_checkos()
+        single = io.StringIO()
+        with redirect_stdout(single):
+            exit_code = checkos.report_projects(self.projects)
+        count = 3
+        paths = []
+        numbers = []
+        for index in range(1, count + 1):
+            shard = CheckShard.parse(f"{index}/{count}")
+            shard_numbers, projects = shard.select(self.projects)
+            # the partition is stable
+            self.assertEqual((shard_numbers, projects), shard.select(self.projects))
+            numbers.extend(shard_numbers)
+            with redirect_stdout(io.StringIO()):
+                checkos.report_projects(projects, shard_numbers)
+            path = os.path.join(self.tmp.name, shard.default_results_path)
+            shard.save_results(path, len(self.projects), checkos.results)
+            paths.append(path)
+        self.assertEqual(list(range(1, len(self.projects) + 1)), sorted(numbers))
+        merged = io.StringIO()
+        # the order of the result files does not matter
+        self.assertEqual(exit_code, CheckShard.merge(paths[::-1], file=merged))
+        self.assertEqual(single.getvalue(), merged.getvalue())
+        with self.assertRaises(ValueError):
+            CheckShard.merge(paths[1:])
+        with self.assertRaises(ValueError):
+            CheckShard.merge(paths + paths[:1])
+        for spec in ["0/3", "4/3", "1", "a/b"]:
+            with self.assertRaises(argparse.ArgumentTypeError):
+                CheckShard.parse(spec)
+        # each shard only uses its share of the rate limits
+        github = GitHubApi()
+        github.share_rate_limits(50)
+        github.search_limit()
+        with self.assertRaises(RateLimitException):
+            github.search_limit()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+"""Created on 2026-10-19.
+
+@author: wf
+"""
+
+import unittest
+
+from osprojects.commit_linker import CommitLinker
+from osprojects.osproject import Commit, Ticket
+from tests.basetest import BaseTest
+
+
+class TestCommitLinker(BaseTest):
+    """Test linking commits to tickets."""
+
+    def setUp(self, debug=False, profile=True):
+        BaseTest.setUp(self, debug=debug, profile=profile)
+        ticket = self.getSampleById(Ticket, "number", 2)
+        self.linker = CommitLinker(
+            {2: ticket}, owner="WolfgangFahl", project_id="pyOpenSourceProjects"
+        )
+
+    def test_refs(self):
+        """Test extracting plain, closing and url references."""
+        cases = [
+            ("Initial commit", []),
+            ("refs #2", [(2, None)]),
+            ("Fixes #2 and #7", [(2, "fixes"), (7, None)]),
+            ("closed: #2, see #2", [(2, "closed")]),
+            (
+                "resolves https://github.com/WolfgangFahl/pyOpenSourceProjects/issues/2",
+                [(2, "resolves")],
+            ),
+            ("see https://github.com/other/project/issues/3", []),
+            ("anchor page#3 and &#39; are no references", []),
+        ]
+        for subject, expected in cases:
+            refs = self.linker.refs(subject)
+            self.assertEqual(expected, [(r.number, r.keyword) for r in refs], subject)
+        self.assertIsNotNone(self.linker.refs("fixes #2")[0].ticket)
+        self.assertIsNone(self.linker.refs("fixes #7")[0].ticket)
+
+    def test_release_notes(self):
+        """Test the streamed release notes."""
+        commit = self.getSampleById(Commit, "hash", "106254f")
+        linked = self.getSampleById(Commit, "hash", "106254f")
+        linked.subject = "fixes #2"
+        lines = list(self.linker.release_notes(iter([commit, linked])))
+        self.assertEqual(2, len(lines))
+        self.assertTrue(
+            lines[1].endswith(
+                "- fixes [#2 Get Tickets in Wiki notation from github API](https://github.com/WolfgangFahl/pyOpenSourceProjects/issues/2)"
+            ),
+            lines[1],
+        )
+        wiki_lines = list(
+            self.linker.release_notes([commit, linked], fmt="wiki", linked_only=True)
+        )
+        self.assertEqual(1, len(wiki_lines))
+        self.assertTrue(wiki_lines[0].startswith("* 2022-01-24 [https://github.com"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+"""Created on 2026-10-19.
+
+@author: wf
+"""
+
+import datetime
+import unittest
+
+from osprojects.commit_stats import CommitStats
+from osprojects.osproject import Commit
+from tests.basetest import BaseTest
+
+
+class TestCommitStats(BaseTest):
+    """Test the single pass commit statistics."""
+
+    def make_commit(self, date_iso: str, name: str, project: str) -> Commit:
+        commit = Commit()
+        commit.date = datetime.datetime.fromisoformat(date_iso)
+        commit.name = name
+        commit.project = project
+        return commit
+
+    def test_stats(self):
+        """Test aggregating commits in chunks and merging statistics."""
+        commits = [
+            self.make_commit("2026-03-01T09:00:00+01:00", "alice", "p1"),
+            self.make_commit("2026-03-01T18:00:00+01:00", "bob", "p1"),
+            self.make_commit("2026-03-02T09:00:00+01:00", "alice", "p2"),
+            self.make_commit("2026-03-03T09:00:00+01:00", "alice", "p1"),
+            self.make_commit("2026-04-10T09:00:00+01:00", "bob", "p2"),
+        ]
+        # a small chunk size makes sure the chunked bucketing is exercised
+        stats = CommitStats(chunk_size=2).add_all(iter(commits[:3]))
+        other = CommitStats().add_all(commits[3:])
+        result = stats.merge(other).to_dict()
+        self.assertEqual(5, result["commits"])
+        self.assertEqual(4, result["active_days"])
+        self.assertEqual(3, result["longest_streak"])
+        self.assertEqual({"2026-03": 4, "2026-04": 1}, result["by_month"])
+        self.assertEqual({"p1": 3, "p2": 2}, result["by_project"])
+        self.assertEqual(
+            {"commits": 3, "active_days": 3}, result["by_committer"]["alice"]
+        )
+        self.assertEqual(
+            {"commits": 2, "active_days": 2}, result["by_committer"]["bob"]
+        )
+        self.assertEqual("2026-04-10", result["last_day"])
+        self.assertEqual(0, CommitStats().to_dict()["commits"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+"""Created on 2026-10-19.
+
+@author: wf
+"""
+
+import hashlib
+import os
+import tempfile
+import unittest
+
+from osprojects.file_snapshot import FileSnapshot
+from tests.basetest import BaseTest
+
+
+class TestFileSnapshot(BaseTest):
+    """Test the file snapshot service."""
+
+    def setUp(self, debug=False, profile=True):
+        BaseTest.setUp(self, debug=debug, profile=profile)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.snapshot = FileSnapshot(max_size=1000, mmap_threshold=100)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+        BaseTest.tearDown(self)
+
+    def write(self, name: str, text: str) -> str:
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "w") as f:
+            f.write(text)
+        return path
+
+    def test_snapshot(self):
+        """Test stat once per run, lazy and memory-mapped reads and size
+        caps."""
+        small = self.write("small.txt", "hello")
+        large = self.write("large.txt", "x" * 500)
+        huge = self.write("huge.txt", "y" * 2000)
+        missing = os.path.join(self.tmp.name, "missing.txt")
+        entries = [self.snapshot.get(path) for path in [small, large, huge, missing]]
+        small_entry, large_entry, huge_entry, missing_entry = entries
+        self.assertEqual("hello", small_entry.text)
+        # read via mmap
+        self.assertEqual("x" * 500, large_entry.text)
+        self.assertTrue(huge_entry.too_large)
+        self.assertIsNone(huge_entry.text)
+        self.assertFalse(missing_entry.exists)
+        self.assertIsNone(missing_entry.text)
+        dir_entry = self.snapshot.get(self.tmp.name)
+        self.assertTrue(dir_entry.is_dir)
+        self.assertIsNone(dir_entry.text)
+        # one stat per path and run
+        self.assertIs(small_entry, self.snapshot.get(small))
+        self.assertEqual(5, self.snapshot.stats)
+
+        # unchanged files keep their content in the next run
+        self.snapshot.new_run()
+        self.assertIs(small_entry, self.snapshot.get(small))
+        self.write("large.txt", "z" * 600)
+        changed_entry = self.snapshot.get(large)
+        self.assertIsNot(large_entry, changed_entry)
+        self.assertEqual("z" * 600, changed_entry.text)
+        self.assertEqual(7, self.snapshot.stats)
+        self.assertEqual(
+            "aaf4c61ddcc5e8a2dabede0f3b482cd9aea9434d", small_entry.content_hash
+        )
+
+    def test_single_read(self):
+        """Test that small files are read once for the hash and the text and
+        that mapped files are hashed without being decoded."""
+        small = self.snapshot.get(self.write("small.txt", "hello"))
+        self.assertIsNotNone(small.content_hash)
+        os.remove(small.path)
+        # the text was decoded in the same read as the hash
+        self.assertEqual("hello", small.text)
+        large = self.snapshot.get(self.write("large.txt", "ä" * 300))
+        self.assertEqual(
+            hashlib.sha1(("ä" * 300).encode()).hexdigest(), large.content_hash
+        )
+        self.assertIsNone(large._text)
+        self.assertEqual("ä" * 300, large.text)
+
+
+if __name__ == "__main__":
+    unittest.main()
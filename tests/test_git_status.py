@@ -0,0 +1,92 @@
+"""Created on 2026-10-19.
+
+@author: wf
+"""
+
+import os
+import subprocess
+import tempfile
+import unittest
+
+from git.exc import InvalidGitRepositoryError, NoSuchPathError
+
+from osprojects.git_status import GitStatus
+from tests.basetest import BaseTest
+
+
+class TestGitStatus(BaseTest):
+    """Test the porcelain v2 git status backend."""
+
+    def setUp(self, debug=False, profile=True):
+        BaseTest.setUp(self, debug=debug, profile=profile)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.env = dict(
+            os.environ,
+            GIT_AUTHOR_NAME="Tester",
+            GIT_AUTHOR_EMAIL="tester@example.com",
+            GIT_COMMITTER_NAME="Tester",
+            GIT_COMMITTER_EMAIL="tester@example.com",
+        )
+
+    def tearDown(self):
+        self.tmp.cleanup()
+        BaseTest.tearDown(self)
+
+    def git(self, folder: str, *args):
+        subprocess.check_output(["git", *args], cwd=folder, env=self.env)
+
+    def commit(self, folder: str, file_name: str, content: str):
+        with open(os.path.join(folder, file_name), "w") as f:
+            f.write(content)
+        self.git(folder, "add", file_name)
+        self.git(folder, "commit", "-q", "-m", f"update {file_name}")
+
+    def test_parse(self):
+        """Test parsing the NUL separated porcelain v2 output."""
+        output = (
+            b"# branch.oid 1234\0# branch.head main\0"
+            b"# branch.upstream origin/main\0# branch.ab +2 -3\0"
+            b"1 .M N... 100644 100644 100644 aa bb README.md\0"
+            b"2 R. N... 100644 100644 100644 aa bb R100 new.txt\0old.txt\0"
+        )
+        status = GitStatus.parse("/tmp/project", output)
+        self.assertEqual("main", status.branch)
+        self.assertEqual("origin/main", status.upstream)
+        self.assertEqual((2, 3), (status.ahead, status.behind))
+        self.assertEqual(2, status.changed)
+        self.assertTrue(status.is_dirty)
+        self.assertEqual("main ↑2 ↓3", status.summary)
+
+    def test_of_folder(self):
+        """Test the status of real repositories."""
+        origin = os.path.join(self.tmp.name, "origin")
+        clone = os.path.join(self.tmp.name, "clone")
+        os.makedirs(origin)
+        self.git(origin, "init", "-q", "-b", "main")
+        self.commit(origin, "README.md", "# origin\n")
+        self.git(self.tmp.name, "clone", "-q", origin, clone)
+        self.commit(clone, "a.txt", "ahead\n")
+        # untracked files do not make the repository dirty
+        with open(os.path.join(clone, "untracked.txt"), "w") as f:
+            f.write("untracked\n")
+        with open(os.path.join(origin, "README.md"), "a") as f:
+            f.write("modified\n")
+        plain = os.path.join(self.tmp.name, "plain")
+        os.makedirs(plain)
+        missing = os.path.join(self.tmp.name, "missing")
+        origin_status = GitStatus.of_folder(origin)
+        clone_status = GitStatus.of_folder(clone)
+        self.assertTrue(origin_status.is_dirty)
+        self.assertIsNone(origin_status.upstream)
+        self.assertFalse(clone_status.is_dirty)
+        self.assertEqual("origin/main", clone_status.upstream)
+        self.assertEqual((1, 0), (clone_status.ahead, clone_status.behind))
+        with self.assertRaises(InvalidGitRepositoryError):
+            GitStatus.of_folder(plain)
+        with self.assertRaises(NoSuchPathError):
+            GitStatus.of_folder(missing)
+        self.assertNotIn("core.fsmonitor=true", GitStatus.git_cmd())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -40,6 +40,48 @@ class TestGitHubApi(BaseTest):
                         repos[0], repos[trial], f"Cache was not used for {owner}"
                     )
 
+    def test_search_issue_records(self):
+        """Test spreading the owner wide issue search back to the repos."""
+
+        class FakeResponse:
+            def __init__(self, items):
+                self.items = items
+
+            def json(self):
+                return {"items": self.items}
+
+        class FakeSearchApi(GitHubApi):
+            """GitHubApi answering searches from a fixed list of items."""
+
+            def __init__(self, items):
+                super().__init__()
+                self.items = items
+                self.queries = []
+
+            def get_search_response(self, title, url, params={}):
+                self.queries.append(dict(params))
+                since = params["q"].split("updated:>=")[1]
+                matching = [i for i in self.items if i["updated_at"] >= since]
+                start = (params["page"] - 1) * params["per_page"]
+                return FakeResponse(matching[start : start + params["per_page"]])
+
+        items = []
+        for i in range(1050):
+            items.append(
+                {
+                    "id": i,
+                    "number": i,
+                    "updated_at": f"2026-10-{1 + i // 100:02d}T00:00:00Z",
+                    "repository_url": f"https://api.github.com/repos/test/repo{i % 3}",
+                }
+            )
+        api = FakeSearchApi(items)
+        records_by_repo = api.search_issue_records("test", "2026-10-01", org=True)
+        self.assertEqual(["repo0", "repo1", "repo2"], sorted(records_by_repo.keys()))
+        self.assertEqual(1050, sum(len(r) for r in records_by_repo.values()))
+        self.assertTrue(api.queries[0]["q"].startswith("org:test updated:>="))
+        self.assertLess(len(api.queries), 15)
+
     @unittest.skipIf(
         BaseTest.inPublicCI(), "Must be authenticated to access the code search API"
     )
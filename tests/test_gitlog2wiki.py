@@ -4,10 +4,17 @@
 """
 
 import datetime
+import io
+import os
+import subprocess
+import tempfile
 import unittest
+from contextlib import redirect_stderr
 
-from osprojects.osproject import Commit, GitLog2WikiCmd, gitlog2wiki
+from osprojects.commit_cache import CommitCache
+from osprojects.osproject import Commit, GitLog2WikiCmd, OsProject, gitlog2wiki
 from osprojects.version import Version
+from osprojects.workspace_log import WorkspaceLog
 from tests.basetest import BaseTest
 
 
@@ -118,5 +125,221 @@ class TestGitLog2WikiFilter(BaseTest):
         self.assertIsInstance(cmd, GitLog2WikiCmd)
 
 
+class TestGitLogStreaming(BaseTest):
+    """Test streaming the git log of a local repository."""
+
+    def setUp(self, debug=False, profile=True):
+        """Create a temporary repository with a few commits."""
+        super().setUp(debug=debug, profile=profile)
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.workspace = self.tmp_dir.name
+        self.commit_dates = [
+            "2025-01-15T10:00:00+01:00",
+            "2025-02-15T10:00:00+01:00",
+            "2026-03-28T10:00:00+00:00",
+        ]
+        self.create_repo("testproject", self.commit_dates)
+        self.os_project = OsProject.fromFolder(self.folder)
+
+    def create_repo(self, project_id: str, commit_dates: list):
+        """Create a repository in the workspace with commits at the given
+        dates."""
+        self.folder = os.path.join(self.workspace, project_id)
+        os.makedirs(self.folder)
+        self.git("init", "-q")
+        self.git("remote", "add", "origin", f"https://github.com/test/{project_id}")
+        for i, date in enumerate(commit_dates):
+            with open(os.path.join(self.folder, "file.txt"), "w") as f:
+                f.write(f"{i}")
+            self.git("add", "file.txt")
+            self.git("commit", "-q", "-m", f"commit {i} with ||| pipes #{i}", date=date)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+        super().tearDown()
+
+    def git(self, *args, date: str = None):
+        """Run git in the temporary repository."""
+        env = dict(os.environ)
+        env.update(
+            {
+                "GIT_AUTHOR_NAME": "Tester",
+                "GIT_AUTHOR_EMAIL": "tester@example.com",
+                "GIT_COMMITTER_NAME": "Tester",
+                "GIT_COMMITTER_EMAIL": "tester@example.com",
+            }
+        )
+        if date:
+            env["GIT_AUTHOR_DATE"] = date
+            env["GIT_COMMITTER_DATE"] = date
+        output = subprocess.check_output(["git", *args], cwd=self.folder, env=env)
+        return output.decode().strip()
+
+    def test_iter_commits(self):
+        """Test that subjects with delimiters survive the NUL separated
+        parsing."""
+        commits = list(self.os_project.iterCommits())
+        self.assertEqual(3, len(commits))
+        # newest first as git streams them
+        self.assertEqual("commit 2 with ||| pipes #2", commits[0].subject)
+        self.assertEqual(
+            datetime.datetime.fromisoformat(self.commit_dates[0]), commits[2].date
+        )
+        chronological = self.os_project.getCommits()
+        self.assertEqual(
+            [commit.hash for commit in reversed(commits)],
+            [commit.hash for commit in chronological],
+        )
+        self.assertEqual("Tester", commits[1].name)
+        # stopping early must not fail
+        first = next(self.os_project.iterCommits())
+        self.assertEqual(commits[0].hash, first.hash)
+
+    def test_date_prefix_range(self):
+        """Test translating date prefixes to --since/--until ranges."""
+        cases = {
+            "2026": ("2026-01-01", "2027-01-01"),
+            "2026-12": ("2026-12-01", "2027-01-01"),
+            "2026-03-28": ("2026-03-28", "2026-03-29"),
+        }
+        for prefix, (start, end) in cases.items():
+            date_range = OsProject.datePrefixRange(prefix)
+            self.assertEqual(start, str(date_range[0].date()))
+            self.assertEqual(end, str(date_range[1].date()))
+        for prefix in ["20", "2026-3", "2026-13", "abcd"]:
+            self.assertIsNone(OsProject.datePrefixRange(prefix))
+
+    def test_unsupported_combinations(self):
+        """Test that option combinations which would drop an option are
+        rejected."""
+        for argv in [
+            ["--release-notes", "--workspace", self.workspace],
+            ["--release-notes", "--stats"],
+            ["--release-notes", "--format", "csv"],
+            ["--release-notes", "--format", "ndjson"],
+        ]:
+            with redirect_stderr(io.StringIO()):
+                exit_code = gitlog2wiki(argv)
+            self.assertEqual(2, exit_code, argv)
+
+    def test_cache_with_filters(self):
+        """Test that the commit cache is skipped with a warning for committer
+        and path filters."""
+        with self.assertLogs(level="WARNING") as logs:
+            commits = list(
+                self.os_project.selectCommits(paths=["other.txt"], use_cache=True)
+            )
+        self.assertEqual(0, len(commits))
+        self.assertIn("commit cache skipped", logs.output[0])
+
+    def test_filter_pushdown(self):
+        """Test filtering commits by date prefix, committer and path in git."""
+        for prefix, expected in [("2025", 2), ("2025-02", 1), ("2024", 0), ("20", 3)]:
+            commits = list(self.os_project.iterCommitsByDatePrefix(prefix))
+            self.assertEqual(expected, len(commits), prefix)
+        commits = self.os_project.getCommits(committer="Nobody")
+        self.assertEqual(0, len(commits))
+        # the filter matches the committer shown for each commit
+        with open(os.path.join(self.folder, "file.txt"), "w") as f:
+            f.write("authored")
+        self.git("commit", "-q", "-a", "-m", "authored", "--author=Alice <a@b.c>")
+        self.assertEqual([], self.os_project.getCommits(committer="Alice"))
+        commits = self.os_project.getCommits(committer="Tester")
+        self.assertEqual(["Tester"] * 4, [commit.name for commit in commits])
+        self.git("reset", "-q", "--hard", "HEAD~1")
+        commits = self.os_project.getCommits(paths=["file.txt"])
+        self.assertEqual(3, len(commits))
+        commits = self.os_project.getCommits(paths=["other.txt"])
+        self.assertEqual(0, len(commits))
+
+    def add_commit(self, content: str, date: str):
+        """Add a commit changing file.txt to the given content."""
+        with open(os.path.join(self.folder, "file.txt"), "w") as f:
+            f.write(content)
+        self.git("commit", "-q", "-a", "-m", content, date=date)
+
+    def test_commit_cache(self):
+        """Test the incremental commit cache keyed by HEAD."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = CommitCache(self.os_project, cache_dir=cache_dir)
+            commits = cache.getCommits()
+            self.assertEqual(3, len(commits))
+            head, records = cache.load()
+            self.assertEqual(self.git("rev-parse", "HEAD"), head)
+            # incremental update only appends the new commits
+            size = os.path.getsize(cache.cache_file)
+            with open(cache.cache_file, "rb") as f:
+                cached = f.read()
+            self.add_commit("fourth", "2026-04-01T10:00:00+00:00")
+            commits = cache.getCommits()
+            self.assertEqual(4, len(commits))
+            with open(cache.cache_file, "rb") as f:
+                self.assertEqual(cached, f.read(size))
+            # a fresh process reads the appended commits
+            CommitCache.loaded.clear()
+            _head, records = CommitCache(self.os_project, cache_dir=cache_dir).load()
+            self.assertEqual(4, len(records))
+            # an interrupted append is discarded
+            with open(cache.cache_file, "ab") as f:
+                f.write(b'{"partial')
+            CommitCache.loaded.clear()
+            self.assertEqual(4, len(cache.getCommits()))
+            self.assertEqual("fourth", commits[-1].subject)
+            self.assertEqual(commits[0].date, cache.getCommits()[0].date)
+            # merged side branch commits older than the cached ones are sorted in
+            self.git("checkout", "-q", "-b", "side", "HEAD~1")
+            with open(os.path.join(self.folder, "side.txt"), "w") as f:
+                f.write("side")
+            self.git("add", "side.txt")
+            self.git("commit", "-q", "-m", "side", date="2025-06-01T10:00:00+00:00")
+            self.git("checkout", "-q", "-")
+            self.git(
+                "merge", "-q", "--no-edit", "side", date="2026-04-02T10:00:00+00:00"
+            )
+            commits = cache.getCommits()
+            self.assertEqual(6, len(commits))
+            dates = [commit.date for commit in commits]
+            self.assertEqual(sorted(dates), dates)
+            CommitCache.loaded.clear()
+            _head, records = cache.load()
+            self.assertEqual(
+                [commit.hash for commit in commits],
+                [record["hash"] for record in records],
+            )
+            # rewritten history forces a full rebuild
+            self.git("reset", "-q", "--hard", "HEAD~3")
+            self.add_commit("rewritten", "2026-05-01T10:00:00+00:00")
+            subjects = [commit.subject for commit in cache.getCommits()]
+            self.assertEqual(3, len(subjects))
+            self.assertEqual("rewritten", subjects[-1])
+            self.assertNotIn("fourth", subjects)
+
+    def test_workspace_log(self):
+        """Test collecting the commits of all repositories of a workspace."""
+        self.create_repo(
+            "otherproject", ["2025-01-20T10:00:00+00:00", "2026-03-01T10:00:00+00:00"]
+        )
+        workspace_log = WorkspaceLog(self.workspace, jobs=2)
+        self.assertEqual(2, len(workspace_log.folders()))
+        commits = list(workspace_log.iterCommits())
+        self.assertEqual(5, len(commits))
+        dates = [commit.date for commit in commits]
+        self.assertEqual(sorted(dates, reverse=True), dates)
+        projects = [c.project for c in workspace_log.iterCommits(order="project")]
+        self.assertEqual(["otherproject"] * 2 + ["testproject"] * 3, projects)
+        commits = list(workspace_log.iterCommits(date_prefix="2026-03"))
+        self.assertEqual(2, len(commits))
+        output = self.captureOutput(
+            gitlog2wiki, ["--workspace", self.workspace, "--filter", "2025"]
+        )
+        self.assertEqual(3, len(output.strip().split("\n")))
+        output = self.captureOutput(
+            gitlog2wiki, ["--workspace", self.workspace, "--reverse"]
+        )
+        lines = output.strip().split("\n")
+        self.assertIn("2025-01-15", lines[0])
+        self.assertIn("2026-03-", lines[-1])
+
+
 if __name__ == "__main__":
     unittest.main()
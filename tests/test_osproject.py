@@ -3,10 +3,21 @@
 @author: wf
 """
 
+import io
+import json
+import time
 from argparse import Namespace
+from unittest.mock import patch
 
 from osprojects.check_project import CheckProject
-from osprojects.osproject import Commit, OsProject, Ticket, gitlog2wiki, main
+from osprojects.osproject import (
+    Commit,
+    OsProject,
+    OsProjects,
+    Ticket,
+    gitlog2wiki,
+    main,
+)
 from tests.basetest import BaseTest
 
 
@@ -59,6 +70,92 @@ class TestOsProject(BaseTest):
         self.assertTrue(len(commits) > 15)
         self.assertDictEqual(expectedCommit.__dict__, commits[0].__dict__)
 
+    def testFromSpec(self):
+        """Tests project specifications for multi project issue2ticket."""
+        for spec in [
+            "WolfgangFahl/pyOpenSourceProjects",
+            "https://github.com/WolfgangFahl/pyOpenSourceProjects",
+            "pyOpenSourceProjects",
+        ]:
+            osProject = OsProject.fromSpec(spec, owner="WolfgangFahl")
+            self.assertEqual("WolfgangFahl/pyOpenSourceProjects", osProject.fqid)
+        with self.assertRaises(ValueError):
+            OsProject.fromSpec("pyOpenSourceProjects")
+
+    def testIterTicketsOrder(self):
+        """Tests that concurrently fetched tickets keep the project order."""
+
+        class SlowProject(OsProject):
+            def getIssues(self, limit: int = None, with_body: bool = True, **params):
+                # later projects answer faster
+                time.sleep(0.01 * (5 - int(self.project_id)))
+                if self.project_id == "3":
+                    raise Exception("issues disabled")
+                return [Ticket(number=int(self.project_id), project=self.project_id)]
+
+        projects = [SlowProject(owner="test", project_id=str(i)) for i in range(5)]
+        results = list(OsProjects.iter_tickets(projects, jobs=2, state="all"))
+        self.assertEqual(projects, [project for project, _tickets in results])
+        counts = [len(tickets) for _project, tickets in results]
+        self.assertEqual([1, 1, 1, 0, 1], counts)
+        failed = []
+        list(OsProjects.iter_tickets(projects, jobs=2, failed=failed))
+        self.assertEqual([projects[3]], failed)
+
+    def ticket_projects(self, ndjson: str) -> list:
+        """Get the projects of the given ndjson ticket output."""
+        projects = [json.loads(line)["project"] for line in ndjson.splitlines()]
+        return projects
+
+    def testIssue2TicketSpecs(self):
+        """Tests issue2ticket with owner/project specs and failing fetches."""
+
+        def get_issues(os_project, limit: int = None, with_body: bool = True, **params):
+            if os_project.project_id == "broken":
+                raise Exception("issues disabled")
+            return [Ticket(number=1, title="t", project=os_project.fqid)]
+
+        def iter_issues(os_project, **params):
+            yield from get_issues(os_project)
+
+        with (
+            patch.object(OsProject, "getIssues", get_issues),
+            patch.object(OsProject, "iterIssues", iter_issues),
+        ):
+            output = self.captureOutput(main, ["-p", "test/one", "--format", "ndjson"])
+            self.assertIn('"project": "test/one"', output)
+            exit_codes = []
+            output = self.captureOutput(
+                lambda argv: exit_codes.append(main(argv)),
+                ["-p", "test/one", "test/broken", "--format", "ndjson"],
+            )
+            self.assertEqual([1], exit_codes)
+            self.assertIn('"project": "test/one"', output)
+            with self.assertRaises(SystemExit):
+                main(["-p", "one"])
+
+        def tickets_of_owner_since(os_projects, owner, since, **params):
+            tickets_by_project = {
+                project_id: [
+                    Ticket(number=1, title="t", project=f"{owner}/{project_id}")
+                ]
+                for project_id in ["one", "two"]
+            }
+            return tickets_by_project
+
+        with patch.object(OsProjects, "tickets_of_owner_since", tickets_of_owner_since):
+            argv = ["--since", "2026-10-01", "--format", "ndjson"]
+            # owner/project specs select the projects of the owner wide search
+            output = self.captureOutput(main, argv + ["-p", "test/two"])
+            self.assertEqual(["test/two"], self.ticket_projects(output))
+            with patch("sys.stdin", io.StringIO("test/one\n")):
+                output = self.captureOutput(main, argv + ["--stdin"])
+            self.assertEqual(["test/one"], self.ticket_projects(output))
+            output = self.captureOutput(main, argv + ["-o", "test"])
+            self.assertEqual(["test/one", "test/two"], self.ticket_projects(output))
+            with self.assertRaises(SystemExit):
+                main(argv + ["-p", "test/one", "other/two"])
+
     def testCmdLine(self):
         """Tests cmdline of osproject."""
         testParams = [
@@ -89,3 +186,41 @@ class TestCommit(BaseTest):
         commit = self.getSampleById(Commit, "hash", "106254f")
         expectedMarkup = "{{commit|host=https://github.com/WolfgangFahl/pyOpenSourceProjects|path=|project=pyOpenSourceProjects|subject=Initial commit|name=GitHub|date=2022-01-24 07:02:55+01:00|hash=106254f|storemode=subobject|viewmode=line}}"
         self.assertEqual(expectedMarkup, commit.toWikiMarkup())
+
+
+class TestTicket(BaseTest):
+    """Tests Ticket class."""
+
+    def testFromRecords(self):
+        """Tests batch construction with fast date parsing and lazy bodies."""
+        records = [
+            {
+                "number": 2,
+                "title": "Get Tickets in Wiki notation from github API",
+                "body": "a long body",
+                "created_at": "2022-01-24T07:41:29Z",
+                "closed_at": "2022-01-25T07:43:04Z",
+                "state": "closed",
+            }
+        ]
+        project_url = "https://github.com/WolfgangFahl/pyOpenSourceProjects"
+        sampleTicket = self.getSampleById(Ticket, "number", 2)
+        tickets = Ticket.from_records(records, "pyOpenSourceProjects", project_url)
+        ticket = tickets[0]
+        for attr in Ticket.getSamples()[0].keys():
+            self.assertEqual(getattr(sampleTicket, attr), getattr(ticket, attr))
+        self.assertEqual("a long body", ticket.body)
+        self.assertEqual(sampleTicket.toWikiMarkup(), ticket.toWikiMarkup())
+        loaded = []
+        lazy_tickets = Ticket.from_records(
+            records,
+            "pyOpenSourceProjects",
+            project_url,
+            with_body=False,
+            body_loader=lambda number: loaded.append(number) or "lazy body",
+        )
+        self.assertEqual([], loaded)
+        self.assertEqual("lazy body", lazy_tickets[0].body)
+        self.assertEqual("lazy body", lazy_tickets[0].body)
+        self.assertEqual([2], loaded)
+        self.assertFalse(hasattr(lazy_tickets[0], "__dict__"))
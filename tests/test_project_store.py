@@ -0,0 +1,54 @@
+"""Created on 2026-10-19.
+
+@author: wf
+"""
+
+import os
+import tempfile
+import unittest
+
+from osprojects.osproject import Commit, Ticket
+from osprojects.project_store import ProjectStore
+from tests.basetest import BaseTest
+
+
+class TestProjectStore(BaseTest):
+    """Test the SQLite ProjectStore."""
+
+    def setUp(self, debug=False, profile=True):
+        BaseTest.setUp(self, debug=debug, profile=profile)
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        db_path = os.path.join(self.tmp_dir.name, "osprojects.db")
+        self.store = ProjectStore(db_path, batch_size=2)
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp_dir.cleanup()
+        BaseTest.tearDown(self)
+
+    def test_tickets_and_commits(self):
+        """Test batched storing and the analytical queries."""
+        tickets = []
+        for number, state in enumerate(["open", "closed", "open"], 1):
+            ticket = self.getSampleById(Ticket, "number", 2)
+            ticket.number = number
+            ticket.state = state
+            ticket.url = f"{ticket.url[:-2]}/{number}"
+            tickets.append(ticket)
+        self.assertEqual(3, self.store.store_tickets(iter(tickets)))
+        # storing again replaces instead of duplicating
+        self.store.store_tickets(tickets)
+        open_tickets = self.store.open_tickets_per_project()
+        self.assertEqual(
+            [{"project": "pyOpenSourceProjects", "open_tickets": 2}], open_tickets
+        )
+        commit = self.getSampleById(Commit, "hash", "106254f")
+        self.store.store_commits([commit, commit])
+        per_month = self.store.commits_per_month("pyOpenSourceProjects")
+        self.assertEqual(1, len(per_month))
+        self.assertEqual("2022-01", per_month[0]["month"])
+        self.assertEqual(1, per_month[0]["commits"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+"""Created on 2026-10-19.
+
+@author: wf
+"""
+
+import datetime
+import unittest
+
+from osprojects.osproject import OsProject
+from osprojects.project_table import ProjectTable
+from tests.basetest import BaseTest
+
+
+class TestProjectTable(BaseTest):
+    """Test the columnar ProjectTable."""
+
+    def setUp(self, debug=False, profile=True):
+        BaseTest.setUp(self, debug=debug, profile=profile)
+        sample = OsProject.getSamples()[0]
+        self.records = []
+        for i, language in enumerate(["Python", "Java", "Python", None]):
+            record = dict(sample)
+            record["project_id"] = f"project{i}"
+            record["language"] = language
+            record["stars"] = i * 10
+            record["forks"] = 3 - i
+            record["updated_at"] = datetime.datetime(2026, 1, 1 + i)
+            self.records.append(record)
+        self.table = ProjectTable.from_records(self.records)
+
+    def test_roundtrip(self):
+        """Test conversion from and to the getSamples() form."""
+        self.assertEqual(4, len(self.table))
+        self.assertEqual(self.records, self.table.to_records())
+
+    def test_filter_sort_top_k(self):
+        """Test vectorized filter, sort and top-k."""
+        python_projects = self.table.filter(language="Python")
+        self.assertEqual(["project0", "project2"], list(python_projects["project_id"]))
+        by_forks = self.table.sort("forks")
+        self.assertEqual("project3", by_forks["project_id"][0])
+        top = self.table.top_k("stars", 2)
+        self.assertEqual(["project3", "project2"], list(top["project_id"]))
+        recent = self.table.filter(min_stars=10, min_forks=1)
+        self.assertEqual(2, len(recent))
+
+    def test_sort(self):
+        """Test stable sorting in both directions with missing values last."""
+        for record in self.records:
+            record["forks"] = 1
+        table = ProjectTable.from_records(self.records)
+        for descending in [False, True]:
+            by_forks = table.sort("forks", descending=descending)
+            self.assertEqual(
+                ["project0", "project1", "project2", "project3"],
+                list(by_forks["project_id"]),
+            )
+        by_language = table.sort("language")
+        self.assertEqual(
+            ["Java", "Python", "Python", None], list(by_language["language"])
+        )
+        self.assertEqual("project0", by_language["project_id"][1])
+        by_language = table.sort("language", descending=True)
+        self.assertEqual(
+            ["Python", "Python", "Java", None], list(by_language["language"])
+        )
+        self.assertEqual("project0", by_language["project_id"][0])
+        by_stars = table.sort("stars", descending=True)
+        self.assertEqual([30, 20, 10, 0], list(by_stars["stars"]))
+
+    def test_group_by(self):
+        """Test grouping by language with star aggregation."""
+        groups = self.table.group_by("language", "stars")
+        self.assertEqual({"count": 2, "stars": 20}, groups["Python"])
+        self.assertEqual({"count": 1, "stars": 10}, groups["Java"])
+        self.assertEqual({"count": 1, "stars": 30}, groups[None])
+        self.assertNotIn("None", groups)
+        by_forks = self.table.group_by("forks")
+        self.assertEqual([0, 1, 2, 3], list(by_forks))
+        self.assertIsInstance(list(by_forks)[0], int)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+"""Created on 2026-10-19.
+
+@author: wf
+"""
+
+import io
+import json
+import unittest
+
+from osprojects.osproject import Commit, Ticket
+from osprojects.record_writer import RecordWriter
+from tests.basetest import BaseTest
+
+
+class TestRecordWriter(BaseTest):
+    """Test the streaming record writers."""
+
+    def write(self, fmt: str, items) -> str:
+        """Write the given items in the given format and return the output."""
+        stream = io.StringIO()
+        writer = RecordWriter.create(fmt, stream=stream)
+        count = writer.write_all(iter(items))
+        self.assertEqual(len(items), count)
+        output = stream.getvalue()
+        return output
+
+    def test_formats(self):
+        """Test all formats for commits and tickets."""
+        commit = self.getSampleById(Commit, "hash", "106254f")
+        ticket = self.getSampleById(Ticket, "number", 2)
+        wiki = self.write("wiki", [commit, commit])
+        self.assertEqual(f"{commit.toWikiMarkup()}\n" * 2, wiki)
+        markdown = self.write("markdown", [ticket])
+        self.assertIn("[#2](https://github.com/WolfgangFahl", markdown)
+        csv_output = self.write("csv", [commit, commit])
+        lines = csv_output.splitlines()
+        self.assertEqual(3, len(lines))
+        self.assertEqual("host,path,project,subject,name,date,hash", lines[0])
+        ndjson = self.write("ndjson", [ticket, ticket])
+        records = [json.loads(line) for line in ndjson.splitlines()]
+        self.assertEqual(2, records[1]["number"])
+        with self.assertRaises(ValueError):
+            RecordWriter.create("xml")
+
+    def test_falsy_values(self):
+        """Test that falsy ticket values are exported as they are."""
+        ticket = Ticket(number=0, title="", state="open")
+        record = ticket.to_record()
+        self.assertEqual(0, record["number"])
+        self.assertEqual("", record["title"])
+        self.assertIsNone(record["closedAt"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+"""Created on 2026-10-19.
+
+@author: wf
+"""
+
+import datetime
+import json
+import os
+import tempfile
+import unittest
+
+from osprojects.github_api import GitHubApi, RepoInfo
+from osprojects.osproject import OsProject
+from tests.basetest import BaseTest
+
+
+class TestRepoInfo(BaseTest):
+    """Test the compact RepoInfo projection."""
+
+    def setUp(self, debug=False, profile=True):
+        BaseTest.setUp(self, debug=debug, profile=profile)
+        self.repo_record = {
+            "id": 452237543,
+            "name": "pyOpenSourceProjects",
+            "full_name": "WolfgangFahl/pyOpenSourceProjects",
+            "owner": {"login": "WolfgangFahl", "id": 1},
+            "fork": False,
+            "language": "Python",
+            "description": "Helper Library to organize open source Projects",
+            "html_url": "https://github.com/WolfgangFahl/pyOpenSourceProjects",
+            "stargazers_count": 5,
+            "forks_count": 2,
+            "created_at": "2022-01-24T06:02:55Z",
+            "updated_at": "2022-01-24T08:00:00Z",
+            "topics": ["python"],
+        }
+
+    def test_projection(self):
+        """Test projecting a full record to the compact form."""
+        record = RepoInfo.project(self.repo_record)
+        self.assertNotIn("topics", record)
+        self.assertEqual("WolfgangFahl", record["owner_login"])
+        repo_info = RepoInfo.from_record(record)
+        self.assertEqual(record, repo_info.to_record())
+        # dict like access stays compatible
+        self.assertEqual("WolfgangFahl", repo_info["owner"]["login"])
+        self.assertFalse(repo_info["fork"])
+        self.assertEqual(5, repo_info.get("stargazers_count"))
+        self.assertEqual("default", repo_info.get("homepage", "default"))
+        self.assertFalse(hasattr(repo_info, "__dict__"))
+
+    def test_mapping(self):
+        """Test that key lookup, containment and iteration agree."""
+        repo_info = RepoInfo.from_record(self.repo_record)
+        repo_info._full = self.repo_record
+        self.assertIn("topics", repo_info)
+        self.assertEqual(["python"], repo_info["topics"])
+        self.assertNotIn("unknown", repo_info)
+        record = dict(repo_info)
+        self.assertEqual("pyOpenSourceProjects", record["name"])
+        self.assertEqual({"login": "WolfgangFahl"}, record["owner"])
+        self.assertEqual(["python"], record["topics"])
+        self.assertEqual(len(record), len(repo_info))
+        json.dumps(dict(repo_info))
+
+    def test_full_repo_index(self):
+        """Test that the owner's full cache is parsed once and reloaded on
+        change."""
+        with tempfile.TemporaryDirectory() as tmp:
+            github = GitHubApi()
+            github.cache_dir = tmp
+            cache_file = os.path.join(tmp, "WolfgangFahl_repos.json")
+            with open(cache_file, "w") as f:
+                json.dump([self.repo_record], f)
+            full = github.full_repo_info("WolfgangFahl", "pyOpenSourceProjects")
+            self.assertEqual(self.repo_record, full)
+            self.assertIs(
+                full, github.full_repo_info("WolfgangFahl", "pyOpenSourceProjects")
+            )
+            self.assertIsNone(github.full_repo_info("WolfgangFahl", "unknown"))
+            with open(cache_file, "w") as f:
+                json.dump([self.repo_record, {"name": "other"}], f)
+            other = github.full_repo_info("WolfgangFahl", "other")
+            self.assertEqual({"name": "other"}, other)
+            # only the most recently used owners are kept
+            for i in range(GitHubApi.FULL_REPO_INDEX_OWNERS + 1):
+                self.assertIsNone(github.full_repo_info(f"owner{i}", "unknown"))
+            self.assertEqual(
+                GitHubApi.FULL_REPO_INDEX_OWNERS, len(github.full_repo_index)
+            )
+            self.assertNotIn("WolfgangFahl", github.full_repo_index)
+
+    def test_dates(self):
+        """Test that the dates are parsed once and cached."""
+        repo_info = RepoInfo.from_record(self.repo_record)
+        os_project = OsProject(owner="WolfgangFahl", project_id="pyOpenSourceProjects")
+        os_project.repo_info = repo_info
+        expected = datetime.datetime(2022, 1, 24, 6, 2, 55)
+        self.assertEqual(expected, os_project.created_at)
+        self.assertIs(os_project.created_at, os_project.created_at)
+        self.assertEqual(2, os_project.forks)
+        self.assertEqual("Python", os_project.language)
+
+
+if __name__ == "__main__":
+    unittest.main()
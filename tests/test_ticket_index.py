@@ -0,0 +1,97 @@
+"""Created on 2026-10-19.
+
+@author: wf
+"""
+
+import datetime
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from osprojects.osproject import Ticket
+from osprojects.ticket_index import TicketIndex
+from tests.basetest import BaseTest
+
+
+class TestTicketIndex(BaseTest):
+    """Test the local full-text TicketIndex."""
+
+    def setUp(self, debug=False, profile=True):
+        BaseTest.setUp(self, debug=debug, profile=profile)
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.index = TicketIndex(os.path.join(self.tmp_dir.name, "index.db"))
+
+    def tearDown(self):
+        self.index.close()
+        self.tmp_dir.cleanup()
+        BaseTest.tearDown(self)
+
+    def ticket(
+        self,
+        project: str,
+        number: int,
+        title: str,
+        body: str,
+        state="open",
+        owner="test",
+    ):
+        ticket = Ticket(
+            number=number,
+            title=title,
+            project=project,
+            createdAt=datetime.datetime(2026, 1, number, tzinfo=datetime.timezone.utc),
+            state=state,
+            url=f"https://github.com/{owner}/{project}/issues/{number}",
+            body=body,
+        )
+        return ticket
+
+    def test_search(self):
+        """Test ranked searching with filters and incremental updates."""
+        tickets = [
+            self.ticket("p1", 1, "wiki markup export", "tickets as wiki"),
+            self.ticket("p1", 2, "fix date parsing", "markup unrelated", "closed"),
+            self.ticket("p2", 3, "badge generation", "nothing"),
+        ]
+        self.assertEqual(3, self.index.add_tickets(tickets, {3: ["needs wiki badge"]}))
+        results = self.index.search("wiki")
+        self.assertEqual([1, 3], [r["number"] for r in results])
+        results = self.index.search("markup", state="closed")
+        self.assertEqual([2], [r["number"] for r in results])
+        self.assertEqual(
+            [], self.index.search("wiki", fqid="test/p1", since="2026-01-02")
+        )
+        # incremental update replaces the indexed text but keeps the comments
+        self.index.add_tickets([self.ticket("p2", 3, "badge generation", "other")])
+        results = self.index.search("badge OR other")
+        self.assertEqual(1, len(results))
+        self.assertEqual([3], [r["number"] for r in self.index.search("needs")])
+        self.assertEqual([], self.index.search("nothing"))
+
+    def test_same_project_of_two_owners(self):
+        """Test that equally named projects of different owners are kept
+        apart."""
+        self.index.add_tickets([self.ticket("p1", 1, "wiki export", "first")])
+        other = self.ticket("p1", 1, "wiki import", "second", owner="other")
+        self.index.add_tickets([other], fqid="other/p1")
+        results = self.index.search("wiki")
+        self.assertEqual(["test/p1", "other/p1"], [r["fqid"] for r in results])
+        results = self.index.search("wiki", fqid="other/p1")
+        self.assertEqual(["wiki import"], [r["title"] for r in results])
+
+    def test_schema_upgrade(self):
+        """Test rebuilding an index of an older schema version."""
+        db_path = os.path.join(self.tmp_dir.name, "old.db")
+        with sqlite3.connect(db_path) as connection:
+            connection.execute(
+                "CREATE TABLE ticket_doc(id INTEGER PRIMARY KEY, project TEXT)"
+            )
+        index = TicketIndex(db_path)
+        index.add_tickets([self.ticket("p1", 1, "wiki export", "first")])
+        self.assertEqual(1, len(index.search("wiki")))
+        index.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
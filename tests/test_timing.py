@@ -0,0 +1,96 @@
+"""Created on 2026-10-19.
+
+@author: wf
+"""
+
+import io
+import json
+import os
+import pstats
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from osprojects.github_api import GitHubApi
+from osprojects.osproject import OsProjects
+from osprojects.timing import Timing, profiled
+from tests.basetest import BaseTest
+
+
+class TestTiming(BaseTest):
+    """Test the timing spans and the profiling helper."""
+
+    def setUp(self, debug=False, profile=True):
+        BaseTest.setUp(self, debug=debug, profile=profile)
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+        BaseTest.tearDown(self)
+
+    def test_spans(self):
+        """Test recording spans as JSON lines and the summary."""
+        timing = Timing(max_spans=10)
+        spans_path = os.path.join(self.tmp.name, "spans.jsonl")
+        timing.open_jsonl(spans_path)
+        with timing.span("workspace scan"):
+            pass
+        for project in ["a/one", "b/two"]:
+            with timing.span(project, "project"):
+                with timing.span("readme", "group", project=project) as span:
+                    pass
+        timing.close()
+        self.assertEqual({"project": "b/two"}, span.attrs)
+        self.assertEqual(5, len(timing.spans))
+        with open(spans_path) as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual(5, len(records))
+        self.assertEqual("workspace scan", records[0]["name"])
+        self.assertEqual("phase", records[0]["category"])
+        summary = timing.summary()
+        if self.debug:
+            print(summary)
+        self.assertIn("slowest phases:", summary)
+        self.assertIn("2x", summary)
+        self.assertIn("group:readme", summary)
+        self.assertIn("slowest projects:", summary)
+        self.assertIn("a/one", summary)
+
+    def test_workspace_spans(self):
+        """Test timing the remote owner fetches apart from the local workspace
+        scan."""
+        for owner in ["alice", "bob"]:
+            git_folder = os.path.join(self.tmp.name, f"{owner}-project", ".git")
+            os.makedirs(git_folder)
+            with open(os.path.join(git_folder, "config"), "w") as f:
+                f.write(
+                    f'[remote "origin"]\n\turl = https://github.com/{owner}/project\n'
+                )
+        timing = Timing()
+        with (
+            patch.object(Timing, "instance", timing),
+            patch.object(GitHubApi, "repo_infos_for_owner", return_value=[]),
+        ):
+            OsProjects.from_folder(self.tmp.name)
+        spans = [(span.name, span.category) for span in timing.spans]
+        self.assertEqual(("workspace scan", "phase"), spans[0])
+        self.assertEqual([("owner fetch", "remote")] * 2, spans[1:])
+        owners = sorted(span.attrs["owner"] for span in list(timing.spans)[1:])
+        self.assertEqual(["alice", "bob"], owners)
+
+    def test_profiled(self):
+        """Test writing the pstats output of a profiled block."""
+        profile_path = os.path.join(self.tmp.name, "checkos.pstats")
+        out = io.StringIO()
+        with profiled(profile_path, file=out):
+            sorted(str(i) for i in range(1000))
+        self.assertTrue(os.path.exists(profile_path))
+        stats = pstats.Stats(profile_path)
+        self.assertGreater(stats.total_calls, 0)
+        self.assertIn("cumulative", out.getvalue())
+        with profiled(None) as profiler:
+            self.assertIsNone(profiler)
+
+
+if __name__ == "__main__":
+    unittest.main()